@@ -241,49 +241,52 @@ class App(QObject):
         self.toggle_units_ignore = False
 
         self.defaults_form = GlobalOptionsUI()
+        # Option -> (group, widget attribute), see GlobalOptionsUI.get_field().
+        # The widgets are looked up when used, as the groups only create
+        # them the first time they are shown.
         self.defaults_form_fields = {
-            "units": self.defaults_form.units_radio,
-            "gerber_plot": self.defaults_form.gerber_group.plot_cb,
-            "gerber_solid": self.defaults_form.gerber_group.solid_cb,
-            "gerber_multicolored": self.defaults_form.gerber_group.multicolored_cb,
-            "gerber_isotooldia": self.defaults_form.gerber_group.iso_tool_dia_entry,
-            "gerber_isopasses": self.defaults_form.gerber_group.iso_width_entry,
-            "gerber_isooverlap": self.defaults_form.gerber_group.iso_overlap_entry,
-            "gerber_ncctools": self.defaults_form.gerber_group.ncc_tool_dia_entry,
-            "gerber_nccoverlap": self.defaults_form.gerber_group.ncc_overlap_entry,
-            "gerber_nccmargin": self.defaults_form.gerber_group.ncc_margin_entry,
-            "gerber_combine_passes": self.defaults_form.gerber_group.combine_passes_cb,
-            "gerber_cutouttooldia": self.defaults_form.gerber_group.cutout_tooldia_entry,
-            "gerber_cutoutmargin": self.defaults_form.gerber_group.cutout_margin_entry,
-            "gerber_cutoutgapsize": self.defaults_form.gerber_group.cutout_gap_entry,
-            "gerber_gaps": self.defaults_form.gerber_group.gaps_radio,
-            "gerber_noncoppermargin": self.defaults_form.gerber_group.noncopper_margin_entry,
-            "gerber_noncopperrounded": self.defaults_form.gerber_group.noncopper_rounded_cb,
-            "gerber_bboxmargin": self.defaults_form.gerber_group.bbmargin_entry,
-            "gerber_bboxrounded": self.defaults_form.gerber_group.bbrounded_cb,
-            "excellon_plot": self.defaults_form.excellon_group.plot_cb,
-            "excellon_solid": self.defaults_form.excellon_group.solid_cb,
-            "excellon_drillz": self.defaults_form.excellon_group.cutz_entry,
-            "excellon_travelz": self.defaults_form.excellon_group.travelz_entry,
-            "excellon_feedrate": self.defaults_form.excellon_group.feedrate_entry,
-            "excellon_spindlespeed": self.defaults_form.excellon_group.spindlespeed_entry,
-            "excellon_toolchangez": self.defaults_form.excellon_group.toolchangez_entry,
-            "excellon_tooldia": self.defaults_form.excellon_group.tooldia_entry,
-            "geometry_plot": self.defaults_form.geometry_group.plot_cb,
-            "geometry_cutz": self.defaults_form.geometry_group.cutz_entry,
-            "geometry_travelz": self.defaults_form.geometry_group.travelz_entry,
-            "geometry_feedrate": self.defaults_form.geometry_group.cncfeedrate_entry,
-            "geometry_cnctooldia": self.defaults_form.geometry_group.cnctooldia_entry,
-            "geometry_painttooldia": self.defaults_form.geometry_group.painttooldia_entry,
-            "geometry_spindlespeed": self.defaults_form.geometry_group.cncspindlespeed_entry,
-            "geometry_paintoverlap": self.defaults_form.geometry_group.paintoverlap_entry,
-            "geometry_paintmargin": self.defaults_form.geometry_group.paintmargin_entry,
-            "cncjob_plot": self.defaults_form.cncjob_group.plot_cb,
-            "cncjob_tooldia": self.defaults_form.cncjob_group.tooldia_entry,
-            "cncjob_prepend": self.defaults_form.cncjob_group.prepend_text,
-            "cncjob_append": self.defaults_form.cncjob_group.append_text,
-            "cncjob_dwell": self.defaults_form.cncjob_group.dwell_cb,
-            "cncjob_dwelltime": self.defaults_form.cncjob_group.dwelltime_cb
+            "units": (None, "units_radio"),
+            "gerber_plot": ("gerber_group", "plot_cb"),
+            "gerber_solid": ("gerber_group", "solid_cb"),
+            "gerber_multicolored": ("gerber_group", "multicolored_cb"),
+            "gerber_isotooldia": ("gerber_group", "iso_tool_dia_entry"),
+            "gerber_isopasses": ("gerber_group", "iso_width_entry"),
+            "gerber_isooverlap": ("gerber_group", "iso_overlap_entry"),
+            "gerber_ncctools": ("gerber_group", "ncc_tool_dia_entry"),
+            "gerber_nccoverlap": ("gerber_group", "ncc_overlap_entry"),
+            "gerber_nccmargin": ("gerber_group", "ncc_margin_entry"),
+            "gerber_combine_passes": ("gerber_group", "combine_passes_cb"),
+            "gerber_cutouttooldia": ("gerber_group", "cutout_tooldia_entry"),
+            "gerber_cutoutmargin": ("gerber_group", "cutout_margin_entry"),
+            "gerber_cutoutgapsize": ("gerber_group", "cutout_gap_entry"),
+            "gerber_gaps": ("gerber_group", "gaps_radio"),
+            "gerber_noncoppermargin": ("gerber_group", "noncopper_margin_entry"),
+            "gerber_noncopperrounded": ("gerber_group", "noncopper_rounded_cb"),
+            "gerber_bboxmargin": ("gerber_group", "bbmargin_entry"),
+            "gerber_bboxrounded": ("gerber_group", "bbrounded_cb"),
+            "excellon_plot": ("excellon_group", "plot_cb"),
+            "excellon_solid": ("excellon_group", "solid_cb"),
+            "excellon_drillz": ("excellon_group", "cutz_entry"),
+            "excellon_travelz": ("excellon_group", "travelz_entry"),
+            "excellon_feedrate": ("excellon_group", "feedrate_entry"),
+            "excellon_spindlespeed": ("excellon_group", "spindlespeed_entry"),
+            "excellon_toolchangez": ("excellon_group", "toolchangez_entry"),
+            "excellon_tooldia": ("excellon_group", "tooldia_entry"),
+            "geometry_plot": ("geometry_group", "plot_cb"),
+            "geometry_cutz": ("geometry_group", "cutz_entry"),
+            "geometry_travelz": ("geometry_group", "travelz_entry"),
+            "geometry_feedrate": ("geometry_group", "cncfeedrate_entry"),
+            "geometry_cnctooldia": ("geometry_group", "cnctooldia_entry"),
+            "geometry_painttooldia": ("geometry_group", "painttooldia_entry"),
+            "geometry_spindlespeed": ("geometry_group", "cncspindlespeed_entry"),
+            "geometry_paintoverlap": ("geometry_group", "paintoverlap_entry"),
+            "geometry_paintmargin": ("geometry_group", "paintmargin_entry"),
+            "cncjob_plot": ("cncjob_group", "plot_cb"),
+            "cncjob_tooldia": ("cncjob_group", "tooldia_entry"),
+            "cncjob_prepend": ("cncjob_group", "prepend_text"),
+            "cncjob_append": ("cncjob_group", "append_text"),
+            "cncjob_dwell": ("cncjob_group", "dwell_cb"),
+            "cncjob_dwelltime": ("cncjob_group", "dwelltime_cb")
         }
 
         self.defaults = LoudDict()
@@ -301,6 +304,7 @@ class App(QObject):
             "gerber_ncctools": "1.0, 0.5",
             "gerber_nccoverlap": 0.4,
             "gerber_nccmargin": 1,
+            "gerber_combine_passes": False,
             "gerber_cutouttooldia": 0.07,
             "gerber_cutoutmargin": 0.1,
             "gerber_cutoutgapsize": 0.15,
@@ -350,6 +354,7 @@ class App(QObject):
             "defaults_save_period_ms": 20000,   # Time between default saves.
             "shell_shape": [500, 300],          # Shape of the shell in pixels.
             "shell_at_startup": False,          # Show the shell at startup.
+            "global_toggle_tooltips": True,     # Show tooltips.
             "recent_limit": 10,                 # Max. items in recent list.
             "fit_key": '1',
             "zoom_out_key": '2',
@@ -385,47 +390,48 @@ class App(QObject):
             QTimer.singleShot(self.defaults["defaults_save_period_ms"], auto_save_defaults)
 
         self.options_form = GlobalOptionsUI()
+        # Option -> (group, widget attribute), as defaults_form_fields.
         self.options_form_fields = {
-            "units": self.options_form.units_radio,
-            "gerber_plot": self.options_form.gerber_group.plot_cb,
-            "gerber_solid": self.options_form.gerber_group.solid_cb,
-            "gerber_multicolored": self.options_form.gerber_group.multicolored_cb,
-            "gerber_isotooldia": self.options_form.gerber_group.iso_tool_dia_entry,
-            "gerber_isopasses": self.options_form.gerber_group.iso_width_entry,
-            "gerber_isooverlap": self.options_form.gerber_group.iso_overlap_entry,
-            "gerber_ncctools": self.options_form.gerber_group.ncc_tool_dia_entry,
-            "gerber_nccoverlap": self.options_form.gerber_group.ncc_overlap_entry,
-            "gerber_nccmargin": self.options_form.gerber_group.ncc_margin_entry,
-            "gerber_combine_passes": self.options_form.gerber_group.combine_passes_cb,
-            "gerber_cutouttooldia": self.options_form.gerber_group.cutout_tooldia_entry,
-            "gerber_cutoutmargin": self.options_form.gerber_group.cutout_margin_entry,
-            "gerber_cutoutgapsize": self.options_form.gerber_group.cutout_gap_entry,
-            "gerber_gaps": self.options_form.gerber_group.gaps_radio,
-            "gerber_noncoppermargin": self.options_form.gerber_group.noncopper_margin_entry,
-            "gerber_noncopperrounded": self.options_form.gerber_group.noncopper_rounded_cb,
-            "gerber_bboxmargin": self.options_form.gerber_group.bbmargin_entry,
-            "gerber_bboxrounded": self.options_form.gerber_group.bbrounded_cb,
-            "excellon_plot": self.options_form.excellon_group.plot_cb,
-            "excellon_solid": self.options_form.excellon_group.solid_cb,
-            "excellon_drillz": self.options_form.excellon_group.cutz_entry,
-            "excellon_travelz": self.options_form.excellon_group.travelz_entry,
-            "excellon_feedrate": self.options_form.excellon_group.feedrate_entry,
-            "excellon_spindlespeed": self.options_form.excellon_group.spindlespeed_entry,
-            "excellon_toolchangez": self.options_form.excellon_group.toolchangez_entry,
-            "excellon_tooldia": self.options_form.excellon_group.tooldia_entry,
-            "geometry_plot": self.options_form.geometry_group.plot_cb,
-            "geometry_cutz": self.options_form.geometry_group.cutz_entry,
-            "geometry_travelz": self.options_form.geometry_group.travelz_entry,
-            "geometry_feedrate": self.options_form.geometry_group.cncfeedrate_entry,
-            "geometry_spindlespeed": self.options_form.geometry_group.cncspindlespeed_entry,
-            "geometry_cnctooldia": self.options_form.geometry_group.cnctooldia_entry,
-            "geometry_painttooldia": self.options_form.geometry_group.painttooldia_entry,
-            "geometry_paintoverlap": self.options_form.geometry_group.paintoverlap_entry,
-            "geometry_paintmargin": self.options_form.geometry_group.paintmargin_entry,
-            "cncjob_plot": self.options_form.cncjob_group.plot_cb,
-            "cncjob_tooldia": self.options_form.cncjob_group.tooldia_entry,
-            "cncjob_prepend": self.options_form.cncjob_group.prepend_text,
-            "cncjob_append": self.options_form.cncjob_group.append_text
+            "units": (None, "units_radio"),
+            "gerber_plot": ("gerber_group", "plot_cb"),
+            "gerber_solid": ("gerber_group", "solid_cb"),
+            "gerber_multicolored": ("gerber_group", "multicolored_cb"),
+            "gerber_isotooldia": ("gerber_group", "iso_tool_dia_entry"),
+            "gerber_isopasses": ("gerber_group", "iso_width_entry"),
+            "gerber_isooverlap": ("gerber_group", "iso_overlap_entry"),
+            "gerber_ncctools": ("gerber_group", "ncc_tool_dia_entry"),
+            "gerber_nccoverlap": ("gerber_group", "ncc_overlap_entry"),
+            "gerber_nccmargin": ("gerber_group", "ncc_margin_entry"),
+            "gerber_combine_passes": ("gerber_group", "combine_passes_cb"),
+            "gerber_cutouttooldia": ("gerber_group", "cutout_tooldia_entry"),
+            "gerber_cutoutmargin": ("gerber_group", "cutout_margin_entry"),
+            "gerber_cutoutgapsize": ("gerber_group", "cutout_gap_entry"),
+            "gerber_gaps": ("gerber_group", "gaps_radio"),
+            "gerber_noncoppermargin": ("gerber_group", "noncopper_margin_entry"),
+            "gerber_noncopperrounded": ("gerber_group", "noncopper_rounded_cb"),
+            "gerber_bboxmargin": ("gerber_group", "bbmargin_entry"),
+            "gerber_bboxrounded": ("gerber_group", "bbrounded_cb"),
+            "excellon_plot": ("excellon_group", "plot_cb"),
+            "excellon_solid": ("excellon_group", "solid_cb"),
+            "excellon_drillz": ("excellon_group", "cutz_entry"),
+            "excellon_travelz": ("excellon_group", "travelz_entry"),
+            "excellon_feedrate": ("excellon_group", "feedrate_entry"),
+            "excellon_spindlespeed": ("excellon_group", "spindlespeed_entry"),
+            "excellon_toolchangez": ("excellon_group", "toolchangez_entry"),
+            "excellon_tooldia": ("excellon_group", "tooldia_entry"),
+            "geometry_plot": ("geometry_group", "plot_cb"),
+            "geometry_cutz": ("geometry_group", "cutz_entry"),
+            "geometry_travelz": ("geometry_group", "travelz_entry"),
+            "geometry_feedrate": ("geometry_group", "cncfeedrate_entry"),
+            "geometry_spindlespeed": ("geometry_group", "cncspindlespeed_entry"),
+            "geometry_cnctooldia": ("geometry_group", "cnctooldia_entry"),
+            "geometry_painttooldia": ("geometry_group", "painttooldia_entry"),
+            "geometry_paintoverlap": ("geometry_group", "paintoverlap_entry"),
+            "geometry_paintmargin": ("geometry_group", "paintmargin_entry"),
+            "cncjob_plot": ("cncjob_group", "plot_cb"),
+            "cncjob_tooldia": ("cncjob_group", "tooldia_entry"),
+            "cncjob_prepend": ("cncjob_group", "prepend_text"),
+            "cncjob_append": ("cncjob_group", "append_text")
         }
 
         self.options = LoudDict()
@@ -441,7 +447,7 @@ class App(QObject):
             "gerber_ncctools": "1.0, 0.5",
             "gerber_nccoverlap": 0.4,
             "gerber_nccmargin": 1,
-            "gerber_combine_passes": True,
+            "gerber_combine_passes": False,
             "gerber_cutouttooldia": 0.07,
             "gerber_cutoutmargin": 0.1,
             "gerber_cutoutgapsize": 0.15,
@@ -476,15 +482,23 @@ class App(QObject):
         })
         self.options.update(self.defaults)  # Copy app defaults to project options
         #self.options_write_form()
-        self.on_options_combo_change(0)  # Will show the initial form
 
         self.collection = ObjectCollection()
         self.ui.project_tab_layout.addWidget(self.collection.view)
         #### End of Data ####
 
-        #### Adjust tabs width ####
-        self.collection.view.setMinimumWidth(self.ui.options_scroll_area.widget().sizeHint().width() +
-            self.ui.options_scroll_area.verticalScrollBar().sizeHint().width())
+        # The Selected, Options and Tool tabs are filled in once the
+        # window is up, see on_tabs_built().
+        self.ui.tabs_built.connect(self.on_tabs_built)
+
+        # A group of the options forms only gets its widgets when first
+        # shown. Fill them in from the current values then.
+        for group in self.defaults_form.groups:
+            group.built.connect(self.defaults_write_form)
+            group.built.connect(self.adjust_tabs_width)
+        for group in self.options_form.groups:
+            group.built.connect(self.options_write_form)
+            group.built.connect(self.adjust_tabs_width)
 
         #### Worker ####
 
@@ -502,6 +516,7 @@ class App(QObject):
 
         self.workers = WorkerStack()
         self.worker_task.connect(self.workers.add_task)
+        self.workers.thread_exception.connect(self.thread_exception)
 
         ### Signal handling ###
         ## Custom signals
@@ -568,7 +583,6 @@ class App(QObject):
         # Object list
         self.collection.view.activated.connect(self.on_row_activated)
         # Options
-        self.ui.options_combo.activated.connect(self.on_options_combo_change)
         self.options_form.units_radio.group_toggle_fn = self.on_toggle_units
 
         ####################
@@ -578,7 +592,6 @@ class App(QObject):
         self.setup_obj_classes()
 
         self.setup_recent_items()
-        self.setup_component_editor()
 
         #########################
         ### Tools and Plugins ###
@@ -646,8 +659,11 @@ class App(QObject):
             self.setup_shell()
 
     def defaults_read_form(self):
-        for option in self.defaults_form_fields:
-            self.defaults[option] = self.defaults_form_fields[option].get_value()
+        for option, (group, attr) in self.defaults_form_fields.items():
+            field = self.defaults_form.get_field(group, attr)
+            # A group that is not built yet has nothing new to read.
+            if field is not None:
+                self.defaults[option] = field.get_value()
 
     def defaults_write_form(self):
         for option in self.defaults:
@@ -661,11 +677,14 @@ class App(QObject):
 
     def defaults_write_form_field(self, field):
         try:
-            self.defaults_form_fields[field].set_value(self.defaults[field])
+            group, attr = self.defaults_form_fields[field]
         except KeyError:
             #self.log.debug("defaults_write_form(): No field for: %s" % option)
             # TODO: Rethink this?
-            pass
+            return
+        widget = self.defaults_form.get_field(group, attr)
+        if widget is not None:
+            widget.set_value(self.defaults[field])
 
     def disable_plots(self, objects):
         # TODO: This method is very similar to replot_all. Try to merge.
@@ -1106,8 +1125,11 @@ class App(QObject):
         return obj
 
     def options_read_form(self):
-        for option in self.options_form_fields:
-            self.options[option] = self.options_form_fields[option].get_value()
+        for option, (group, attr) in self.options_form_fields.items():
+            field = self.options_form.get_field(group, attr)
+            # A group that is not built yet has nothing new to read.
+            if field is not None:
+                self.options[option] = field.get_value()
 
     def options_write_form(self):
         for option in self.options:
@@ -1115,11 +1137,15 @@ class App(QObject):
 
     def options_write_form_field(self, field):
         try:
-            self.options_form_fields[field].set_value(self.options[field])
+            group, attr = self.options_form_fields[field]
         except KeyError:
             # Changed from error to debug. This allows to have data stored
             # which is not user-editable.
             self.log.debug("options_write_form_field(): No field for: %s" % field)
+            return
+        widget = self.options_form.get_field(group, attr)
+        if widget is not None:
+            widget.set_value(self.options[field])
 
     def on_about(self):
         """
@@ -1370,6 +1396,27 @@ class App(QObject):
                 obj.options[oname] = self.defaults[option]
         obj.to_form()  # Update UI
 
+    def on_tabs_built(self):
+        """
+        Callback for FlatCAMGUI.tabs_built. Sets up the contents of the
+        Selected and Options tabs.
+
+        :return: None
+        """
+        self.ui.options_combo.activated.connect(self.on_options_combo_change)
+        self.on_options_combo_change(0)  # Will show the initial form
+        self.setup_component_editor()
+        self.adjust_tabs_width()
+
+    def adjust_tabs_width(self):
+        """
+        Makes the notebook wide enough for the options form.
+
+        :return: None
+        """
+        self.collection.view.setMinimumWidth(self.ui.options_scroll_area.widget().sizeHint().width() +
+            self.ui.options_scroll_area.verticalScrollBar().sizeHint().width())
+
     def on_options_dict_change(self, field):
         self.options_write_form_field(field)
 
@@ -1379,6 +1426,9 @@ class App(QObject):
     def on_defaults_dict_change(self, field):
         self.defaults_write_form_field(field)
 
+        if field == "global_toggle_tooltips":
+            self.ui.set_tooltips_enabled(self.defaults[field])
+
     def set_screen_units(self, units):
         self.ui.units_label.setText("[" + self.options["units"].lower() + "]")
 
@@ -1486,11 +1536,7 @@ class App(QObject):
 
         form = [self.defaults_form, self.options_form][sel]
         # self.ui.notebook.options_contents.pack_start(form, False, False, 1)
-        try:
-            self.ui.options_scroll_area.takeWidget()
-        except:
-            self.log.debug("Nothing to remove")
-        self.ui.options_scroll_area.setWidget(form)
+        self.ui.options_scroll_area.replace_widget(form)
         form.show()
 
         # self.options2form()
@@ -2382,7 +2428,10 @@ class App(QObject):
                                 self.defaults["def_win_h"])
             self.ui.splitter.setSizes([self.defaults["def_notebook_width"], 0])
         except KeyError:
-            pass
+            return
+        # Once the window has been placed, its geometry is the one in
+        # the defaults and does not need saving again on close.
+        QTimer.singleShot(0, self.ui.mark_geometry_saved)
 
     def plot_all(self):
         """
@@ -4184,14 +4233,14 @@ class App(QObject):
             return opener
 
         # Reset menu
-        self.ui.recent.clear()
+        self.ui.clear_menu(self.ui.recent)
 
         # Create menu items
         for recent in self.recent:
             filename = recent['filename'].split('/')[-1].split('\\')[-1]
 
             try:
-                action = QAction(QIcon(icons[recent["kind"]]), filename, self)
+                action = QAction(QIcon(icons[recent["kind"]]), filename, self.ui.recent)
 
                 # Attach callback
                 o = make_callback(openers[recent["kind"]], recent['filename'])
@@ -4210,7 +4259,7 @@ class App(QObject):
     def setup_component_editor(self):
         label = QLabel("Choose an item from Project")
         label.setAlignment(Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignVCenter)
-        self.ui.selected_scroll_area.setWidget(label)
+        self.ui.selected_scroll_area.replace_widget(label)
 
     def setup_obj_classes(self):
         """
@@ -1,14 +1,79 @@
+import os
+
 from OpenGL import GL as gl
-from PyQt6.QtCore import pyqtSignal, Qt, QSize
-from PyQt6.QtGui import QAction, QIcon, QPixmap, QMovie
+from PyQt6.QtCore import pyqtSignal, Qt, QSize, QTimer, QResource, QFile, QEvent
+from PyQt6.QtGui import QAction, QIcon, QPixmap, QPixmapCache, QMovie, QSurfaceFormat
 from PyQt6.QtWidgets import QMainWindow, QLabel, QGridLayout, \
     QMenu, QApplication, QToolBar, QSplitter, QWidget, QTabWidget, \
-    QVBoxLayout, QHBoxLayout, QComboBox, QProgressBar, QGroupBox
+    QVBoxLayout, QHBoxLayout, QComboBox, QProgressBar, QGroupBox, QStackedWidget
 from PyQt6.QtOpenGLWidgets import QOpenGLWidget
 
 from GUIElements import *
 
 
+# The images in share/ can be compiled into a binary Qt resource with
+#   rcc -binary share/flatcam.qrc -o share/flatcam.rcc
+# If it is present, images are read from it instead of individual files.
+_RESOURCE_FILE = os.path.join(os.path.dirname(os.path.realpath(__file__)), 'share', 'flatcam.rcc')
+_HAVE_RESOURCES = os.path.isfile(_RESOURCE_FILE) and QResource.registerResource(_RESOURCE_FILE)
+
+
+def _res(path: str) -> str:
+    """
+    Returns the resource path for a ``share/`` file when the compiled
+    resource is available, the path itself otherwise.
+    """
+    if _HAVE_RESOURCES and path.startswith('share/') and QFile.exists(':/' + path):
+        return ':/' + path
+    return path
+
+
+# Size of the shared pixmap cache in KiB.
+_PIXMAP_CACHE_LIMIT = 20480
+
+
+def _pixmap(path: str) -> QPixmap:
+    """
+    Returns the image at ``path`` through QPixmapCache, so each image is
+    decoded once and shared by everything that displays it, while the
+    cache keeps the memory used bounded.
+    """
+    pmap = QPixmapCache.find(path)
+    if pmap is None:
+        if QPixmapCache.cacheLimit() < _PIXMAP_CACHE_LIMIT:
+            QPixmapCache.setCacheLimit(_PIXMAP_CACHE_LIMIT)
+        pmap = QPixmap(_res(path))
+        QPixmapCache.insert(path, pmap)
+    return pmap
+
+
+# Icons that have a standard freedesktop name. When the platform icon
+# theme provides one of these it is used instead of the bundled image.
+_THEME_ICONS = {
+    'share/file16.png': 'document-new',
+    'share/file32.png': 'document-new',
+    'share/folder16.png': 'document-open',
+    'share/folder32.png': 'document-open',
+    'share/floppy16.png': 'document-save',
+    'share/floppy32.png': 'document-save',
+    'share/power16.png': 'application-exit',
+    'share/trash16.png': 'edit-delete',
+    'share/shell16.png': 'utilities-terminal',
+    'share/shell32.png': 'utilities-terminal',
+    'share/zoom_in32.png': 'zoom-in',
+    'share/zoom_out32.png': 'zoom-out',
+    'share/zoom_fit32.png': 'zoom-fit-best',
+    'share/home16.png': 'go-home',
+}
+
+
+def _icon(path: str) -> QIcon:
+    name = _THEME_ICONS.get(path)
+    if name is not None and QIcon.hasThemeIcon(name):
+        return QIcon.fromTheme(name)
+    return QIcon(_pixmap(path))
+
+
 # In order to enable OpenGL support in Qt6, we need to add an
 # OpenGL widget. Here we also take the opportunity to set some
 # defaults that were previously set in the VisPyPatch code.
@@ -16,11 +81,87 @@ class OpenGLWidget(QOpenGLWidget):
     def __init__(self):
         super().__init__()
 
+        # Plots are flat 2D geometry, so no depth buffer is requested.
+        fmt = QSurfaceFormat()
+        fmt.setSwapInterval(1)
+        fmt.setSwapBehavior(QSurfaceFormat.SwapBehavior.DoubleBuffer)
+        fmt.setDepthBufferSize(0)
+        self.setFormat(fmt)
+
     def initializeGL(self):
         gl.glDisable(gl.GL_LINE_SMOOTH)
         gl.glLineWidth(1.0)
         gl.glClearColor(0.2, 0.2, 0.2, 1)
-        gl.glEnable(gl.GL_DEPTH_TEST)
+        gl.glDisable(gl.GL_DEPTH_TEST)
+        gl.glDepthMask(gl.GL_FALSE)
+
+
+# Sizes of the share/flatcam_icon<size>.png application icons.
+_APP_ICON_SIZES = (16, 24, 32, 48, 128, 256)
+
+
+# Menu contents. Each entry is (attribute name, icon path or None, text),
+# None on its own adds a separator. The actions are created in order by
+# FlatCAMGUI._add_menu_actions() and stored as attributes of the window.
+_FILE_MENU_OPEN = (
+    ('menufilenew', 'share/file16.png', '&New'),
+    ('menufileopenproject', 'share/folder16.png', 'Open &Project ...'),
+    ('menufileopengerber', None, 'Open &Gerber ...'),
+    ('menufileopenexcellon', None, 'Open &Excellon ...'),
+    ('menufileopengcode', None, 'Open G-&Code ...'),
+)
+
+_FILE_MENU_IMPORT = (
+    ('menufileimportsvg', None, 'Import &SVG ...'),
+    ('menufileimportdxf', 'share/dxf16.png', '&DXF as Geometry Object'),
+    ('menufileimportdxf_as_gerber', 'share/dxf16.png', '&DXF as Gerber Object'),
+)
+
+_FILE_MENU_SAVE = (
+    ('menufileexportsvg', None, 'Export &SVG ...'),
+    None,
+    ('menufilesavedefaults', None, 'Save &Defaults'),
+    None,
+    ('menufilesaveproject', 'share/floppy16.png', '&Save Project'),
+    ('menufilesaveprojectas', None, 'Save Project &As ...'),
+    ('menufilesaveprojectcopy', None, 'Save Project C&opy ...'),
+    None,
+    ('menufileexit', 'share/power16.png', 'E&xit'),
+)
+
+_EDIT_MENU = (
+    ('menueditnew', 'share/new_geo16.png', 'New Geometry'),
+    ('menueditedit', 'share/edit16.png', 'Edit Geometry'),
+    ('menueditok', 'share/edit_ok16.png', 'Update Geometry'),
+    # ('menueditcancel', 'share/cancel_edit16.png', 'Cancel Edit'),
+    ('menueditjoin', 'share/join16.png', 'Join Geometry'),
+    ('menueditdelete', 'share/trash16.png', 'Delete'),
+)
+
+_OPTIONS_TRANSFER_MENU = (
+    ('menuoptions_transfer_a2p', None, 'Application to Project'),
+    ('menuoptions_transfer_p2a', None, 'Project to Application'),
+    ('menuoptions_transfer_p2o', None, 'Project to Object'),
+    ('menuoptions_transfer_o2p', None, 'Object to Project'),
+    ('menuoptions_transfer_a2o', None, 'Application to Object'),
+    ('menuoptions_transfer_o2a', None, 'Object to Application'),
+)
+
+_VIEW_MENU = (
+    ('menuviewenable', 'share/replot16.png', 'Enable all plots'),
+    ('menuviewdisableall', 'share/clear_plot16.png', 'Disable all plots'),
+    ('menuviewdisableother', 'share/clear_plot16.png', 'Disable non-selected'),
+)
+
+_TOOL_MENU = (
+    ('menutoolshell', 'share/shell16.png', '&Command Line'),
+)
+
+_HELP_MENU = (
+    ('menuhelp_about', 'share/tv16.png', 'About FlatCAM'),
+    ('menuhelp_home', 'share/home16.png', 'Home'),
+    ('menuhelp_manual', 'share/globe16.png', 'Manual'),
+)
 
 
 class FlatCAMGUI(QMainWindow):
@@ -28,6 +169,11 @@ class FlatCAMGUI(QMainWindow):
     geom_update = pyqtSignal(int, int, int, int, int, name='geomUpdate')
     # Emitted when we want to save prior to exit
     final_save = pyqtSignal(name='saveBeforeExit')
+    # Emitted once the Selected, Options and Tool tabs have their contents
+    tabs_built = pyqtSignal()
+
+    # Multi-resolution application icon, shared by all windows.
+    _APP_ICON = None
 
     def __init__(self, version:str, app):
         super().__init__()
@@ -35,6 +181,17 @@ class FlatCAMGUI(QMainWindow):
         # Divine icon pack by Ipapun @ finicons.com
 
         self.app = app
+
+        qapp = QApplication.instance()
+        if OPTIONS_GROUP_STYLE not in qapp.styleSheet():
+            qapp.setStyleSheet(qapp.styleSheet() + OPTIONS_GROUP_STYLE)
+
+        # Cached "global_toggle_tooltips" preference, see eventFilter().
+        # App.defaults does not exist yet at this point. App sets it
+        # through set_tooltips_enabled() from on_defaults_dict_change(),
+        # which runs when the defaults are filled in and loaded.
+        self._tooltips_enabled = True
+
         ############
         ### Menu ###
         ############
@@ -43,24 +200,7 @@ class FlatCAMGUI(QMainWindow):
         ### File ###
         self.menufile = self.menu.addMenu('&File')
         self.menufile.setToolTipsVisible(True)
-        # New
-        self.menufilenew = QAction(QIcon('share/file16.png'), '&New', self)
-        self.menufile.addAction(self.menufilenew)
-
-        self.menufileopenproject = QAction(QIcon('share/folder16.png'), 'Open &Project ...', self)
-        self.menufile.addAction(self.menufileopenproject)
-
-        # Open gerber ...
-        self.menufileopengerber = QAction('Open &Gerber ...', self)
-        self.menufile.addAction(self.menufileopengerber)
-
-        # Open Excellon ...
-        self.menufileopenexcellon = QAction('Open &Excellon ...', self)
-        self.menufile.addAction(self.menufileopenexcellon)
-
-        # Open G-Code ...
-        self.menufileopengcode = QAction('Open G-&Code ...', self)
-        self.menufile.addAction(self.menufileopengcode)
+        self._add_menu_actions(self.menufile, _FILE_MENU_OPEN)
 
         # Recent
         self.recent = self.menufile.addMenu("Recent files")
@@ -68,102 +208,43 @@ class FlatCAMGUI(QMainWindow):
         # Separator
         self.menufile.addSeparator()
 
-        self.menufileimport = self.menufile.addMenu(QIcon('share/import.png'), 'Import')
-
-        # Import SVG ...
-        self.menufileimportsvg = QAction('Import &SVG ...', self)
-        self.menufileimport.addAction(self.menufileimportsvg)
-
-        self.menufileimportdxf = QAction(QIcon('share/dxf16.png'),
-                                         '&DXF as Geometry Object', self)
-        self.menufileimport.addAction(self.menufileimportdxf)
-        self.menufileimportdxf_as_gerber = QAction(QIcon('share/dxf16.png'),
-                                                   '&DXF as Gerber Object', self)
-        self.menufileimport.addAction(self.menufileimportdxf_as_gerber)
-
+        self.menufileimport = self.menufile.addMenu(_icon('share/import.png'), 'Import')
+        self._add_menu_actions(self.menufileimport, _FILE_MENU_IMPORT)
         self.menufileimport.addSeparator()
 
-        # Export SVG ...
-        self.menufileexportsvg = QAction('Export &SVG ...', self)
-        self.menufile.addAction(self.menufileexportsvg)
-
-        # Separator
-        self.menufile.addSeparator()
-
-        # Save Defaults
-        self.menufilesavedefaults = QAction('Save &Defaults', self)
-        self.menufile.addAction(self.menufilesavedefaults)
-
-        # Separator
-        self.menufile.addSeparator()
-
-        # Save Project
-        self.menufilesaveproject = QAction(QIcon('share/floppy16.png'), '&Save Project', self)
-        self.menufile.addAction(self.menufilesaveproject)
-
-        # Save Project As ...
-        self.menufilesaveprojectas = QAction('Save Project &As ...', self)
-        self.menufile.addAction(self.menufilesaveprojectas)
-
-        # Save Project Copy ...
-        self.menufilesaveprojectcopy = QAction('Save Project C&opy ...', self)
-        self.menufile.addAction(self.menufilesaveprojectcopy)
-
-        # Separator
-        self.menufile.addSeparator()
-
-        # Quit
-        exit_action = QAction(QIcon('share/power16.png'), 'E&xit', self)
+        self._add_menu_actions(self.menufile, _FILE_MENU_SAVE)
         # exitAction.setShortcut('Ctrl+Q')
-        # exitAction.setStatusTip('Exit application')
-        exit_action.triggered.connect(QApplication.quit)
-
-        self.menufile.addAction(exit_action)
+        self.menufileexit.triggered.connect(QApplication.quit)
 
         ### Edit ###
         self.menuedit = self.menu.addMenu('&Edit')
-        self.menueditnew = self.menuedit.addAction(QIcon('share/new_geo16.png'), 'New Geometry')
-        self.menueditedit = self.menuedit.addAction(QIcon('share/edit16.png'), 'Edit Geometry')
-        self.menueditok = self.menuedit.addAction(QIcon('share/edit_ok16.png'), 'Update Geometry')
-        #self.menueditok.
-        #self.menueditcancel = self.menuedit.addAction(QIcon('share/cancel_edit16.png'), "Cancel Edit")
-        self.menueditjoin = self.menuedit.addAction(QIcon('share/join16.png'), 'Join Geometry')
-        self.menueditdelete = self.menuedit.addAction(QIcon('share/trash16.png'), 'Delete')
+        self._add_menu_actions(self.menuedit, _EDIT_MENU)
 
         ### Options ###
         self.menuoptions = self.menu.addMenu('&Options')
         self.menuoptions_transfer = self.menuoptions.addMenu('Transfer options')
-        self.menuoptions_transfer_a2p = self.menuoptions_transfer.addAction("Application to Project")
-        self.menuoptions_transfer_p2a = self.menuoptions_transfer.addAction("Project to Application")
-        self.menuoptions_transfer_p2o = self.menuoptions_transfer.addAction("Project to Object")
-        self.menuoptions_transfer_o2p = self.menuoptions_transfer.addAction("Object to Project")
-        self.menuoptions_transfer_a2o = self.menuoptions_transfer.addAction("Application to Object")
-        self.menuoptions_transfer_o2a = self.menuoptions_transfer.addAction("Object to Application")
+        self._add_menu_actions(self.menuoptions_transfer, _OPTIONS_TRANSFER_MENU)
 
         ### View ###
         self.menuview = self.menu.addMenu('&View')
-        self.menuviewenable = self.menuview.addAction(QIcon('share/replot16.png'), 'Enable all plots')
-        self.menuviewdisableall = self.menuview.addAction(QIcon('share/clear_plot16.png'), 'Disable all plots')
-        self.menuviewdisableother = self.menuview.addAction(QIcon('share/clear_plot16.png'),
-                                                            'Disable non-selected')
+        self._add_menu_actions(self.menuview, _VIEW_MENU)
 
         ### Tool ###
         #self.menutool = self.menu.addMenu('&Tool')
         self.menutool = QMenu('&Tool')
         self.menutoolaction = self.menu.addMenu(self.menutool)
-        self.menutoolshell = self.menutool.addAction(QIcon('share/shell16.png'), '&Command Line')
+        self._add_menu_actions(self.menutool, _TOOL_MENU)
 
         ### Help ###
         self.menuhelp = self.menu.addMenu('&Help')
-        self.menuhelp_about = self.menuhelp.addAction(QIcon('share/tv16.png'), 'About FlatCAM')
-        self.menuhelp_home = self.menuhelp.addAction(QIcon('share/home16.png'), 'Home')
-        self.menuhelp_manual = self.menuhelp.addAction(QIcon('share/globe16.png'), 'Manual')
+        self._add_menu_actions(self.menuhelp, _HELP_MENU)
 
         ####################
         ### Context menu ###
         ####################
 
         self.menuproject = QMenu()
+        self.menuproject.setSeparatorsCollapsible(True)
         self.menuprojectenable = self.menuproject.addAction('Enable')
         self.menuprojectdisable = self.menuproject.addAction('Disable')
         self.menuproject.addSeparator()
@@ -178,14 +259,18 @@ class FlatCAMGUI(QMainWindow):
         self.toolbarfile.setToolTipDuration(10000)
 
 
-        def add_to_toolbar(toolbar:QToolBar, iconName:str, actionName:str, eventFn) -> None:
-            btn = QAction(QIcon(iconName), actionName, self)
-            btn.setStatusTip(actionName)
-            btn.setToolTip(actionName)
-            btn.triggered.connect(eventFn)
+        def add_to_toolbar(toolbar:QToolBar, iconName:str, actionName:str, eventFn=None) -> QAction:
+            btn = QAction(_icon(iconName), actionName, toolbar)
+            # Toolbar actions never appear in a menu. The tooltip is set
+            # directly instead of being derived from a status tip.
+            btn.setIconVisibleInMenu(False)
+            btn.setToolTip(actionName.replace('&', ''))
+            if eventFn is not None:
+                btn.triggered.connect(eventFn)
             toolbar.addAction(btn)
+            return btn
 
-        self.addToolBar(self.toolbarfile)       
+        self.addToolBar(self.toolbarfile)
         add_to_toolbar(self.toolbarfile, "share/file32.png", "New Project", self.app.on_file_new)
         add_to_toolbar(self.toolbarfile, 'share/folder32.png', "Open project", self.app.on_file_openproject)
         add_to_toolbar(self.toolbarfile, 'share/floppy32.png', "Save project", self.app.on_file_saveproject)
@@ -196,35 +281,39 @@ class FlatCAMGUI(QMainWindow):
         self.toolbargeo = QToolBar('Edit')
         self.addToolBar(self.toolbargeo)
 
-        self.newgeo_btn = self.toolbargeo.addAction(QIcon('share/new_geo32.png'), "New Blank Geometry")
-        self.delete_btn = self.toolbargeo.addAction(QIcon('share/cancel_edit32.png'), "&Delete")
-        self.editgeo_btn = self.toolbargeo.addAction(QIcon('share/edit32.png'), "Edit Geometry")
-        self.updategeo_btn = self.toolbargeo.addAction(QIcon('share/edit_ok32.png'), "Update Geometry")
+        self.newgeo_btn = add_to_toolbar(self.toolbargeo, 'share/new_geo32.png', "New Blank Geometry")
+        self.delete_btn = add_to_toolbar(self.toolbargeo, 'share/cancel_edit32.png', "&Delete")
+        self.editgeo_btn = add_to_toolbar(self.toolbargeo, 'share/edit32.png', "Edit Geometry")
+        self.updategeo_btn = add_to_toolbar(self.toolbargeo, 'share/edit_ok32.png', "Update Geometry")
         self.updategeo_btn.setEnabled(False)
         #self.canceledit_btn = self.toolbar.addAction(QIcon('share/cancel_edit32.png'), "Cancel Edit")
 
         self.toolbarview = QToolBar('View')
         self.addToolBar(self.toolbarview)
-        self.zoom_fit_btn = self.toolbarview.addAction(QIcon('share/zoom_fit32.png'), "&Zoom Fit")
-        self.zoom_in_btn = self.toolbarview.addAction(QIcon('share/zoom_in32.png'), "&Zoom In")
-        self.zoom_out_btn = self.toolbarview.addAction(QIcon('share/zoom_out32.png'), "&Zoom Out")
-        self.replot_btn = self.toolbarview.addAction(QIcon('share/replot32.png'), "&Replot")
-        self.clear_plot_btn = self.toolbarview.addAction(QIcon('share/clear_plot32.png'), "&Clear plot")
+        self.zoom_fit_btn = add_to_toolbar(self.toolbarview, 'share/zoom_fit32.png', "&Zoom Fit")
+        self.zoom_in_btn = add_to_toolbar(self.toolbarview, 'share/zoom_in32.png', "&Zoom In")
+        self.zoom_out_btn = add_to_toolbar(self.toolbarview, 'share/zoom_out32.png', "&Zoom Out")
+        self.replot_btn = add_to_toolbar(self.toolbarview, 'share/replot32.png', "&Replot")
+        self.clear_plot_btn = add_to_toolbar(self.toolbarview, 'share/clear_plot32.png', "&Clear plot")
 
         self.toolbartools = QToolBar('Tools')
         self.addToolBar(self.toolbartools)
-        self.shell_btn = self.toolbartools.addAction(QIcon('share/shell32.png'), "&Command Line")
+        self.shell_btn = add_to_toolbar(self.toolbartools, 'share/shell32.png', "&Command Line")
 
         ################
         ### Splitter ###
         ################
         self.splitter = QSplitter()
         self.setCentralWidget(self.splitter)
+        # Window geometry and notebook width as last restored from or
+        # saved to the defaults, see closeEvent().
+        self._saved_geom = None
 
         ################
         ### Notebook ###
         ################
         self.notebook = QTabWidget()
+        self.notebook.setDocumentMode(True)
         # self.notebook.setMinimumWidth(250)
 
         ### Projet ###
@@ -234,59 +323,59 @@ class FlatCAMGUI(QMainWindow):
         self.project_tab_layout.setContentsMargins(2, 2, 2, 2)
         self.notebook.addTab(project_tab, "Project")
 
-        ### Selected ###
+        ### Selected / Options / Tool ###
+        # Only the tab pages are created here so the tab indices are
+        # stable. Their contents are built by _build_deferred_tabs() once
+        # the event loop runs, or earlier if any of them is needed.
+        self._deferred_built = False
+
         self.selected_tab = QWidget()
         self.selected_tab.setToolTip("Selected Object Details")
         self.selected_tab_layout = QVBoxLayout(self.selected_tab)
         self.selected_tab_layout.setContentsMargins(2, 2, 2, 2)
-        self.selected_scroll_area = VerticalScrollArea()
-        self.selected_tab_layout.addWidget(self.selected_scroll_area)
         self.notebook.addTab(self.selected_tab, "Selected")
 
-        ### Options ###
         self.options_tab = QWidget()
         self.options_tab.setContentsMargins(0, 0, 0, 0)
         self.options_tab_layout = QVBoxLayout(self.options_tab)
         self.options_tab_layout.setContentsMargins(2, 2, 2, 2)
-
-        hlay1 = QHBoxLayout()
-        self.options_tab_layout.addLayout(hlay1)
-
-        self.icon = QLabel()
-        self.icon.setPixmap(QPixmap('share/gear48.png'))
-        hlay1.addWidget(self.icon)
-
-        self.options_combo = QComboBox()
-        self.options_combo.addItem("APPLICATION DEFAULTS")
-        self.options_combo.addItem("PROJECT OPTIONS")
-        hlay1.addWidget(self.options_combo)
-        hlay1.addStretch()
-
-        self.options_scroll_area = VerticalScrollArea()
-        self.options_tab_layout.addWidget(self.options_scroll_area)
-
         self.notebook.addTab(self.options_tab, "Options")
 
-        ### Tool ###
         self.tool_tab = QWidget()
         self.tool_tab_layout = QVBoxLayout(self.tool_tab)
         self.tool_tab_layout.setContentsMargins(2, 2, 2, 2)
         self.notebook.addTab(self.tool_tab, "Tool")
-        self.tool_scroll_area = VerticalScrollArea()
-        self.tool_tab_layout.addWidget(self.tool_scroll_area)
+
+        QTimer.singleShot(0, self._build_deferred_tabs)
 
         self.splitter.addWidget(self.notebook)
 
         ######################
         ### Plot and other ###
         ######################
+        # The OpenGL widget only creates its context the first time it is
+        # shown, so it is kept behind a blank page until ensure_gl() is
+        # called. That happens once the event loop runs so the window can
+        # paint before the GL driver is initialised.
+        self.plot_stack = QStackedWidget()
+        self.plot_stack.addWidget(QWidget())
+        self.splitter.addWidget(self.plot_stack)
+
         right_widget = OpenGLWidget()
         # right_widget.setContentsMargins(0, 0, 0, 0)
-        self.splitter.addWidget(right_widget)
+        self.plot_stack.addWidget(right_widget)
         self.right_layout = QVBoxLayout()
         #self.right_layout.set  .setMargin(0)
         self.right_layout.setContentsMargins(0, 0, 0, 0)
         right_widget.setLayout(self.right_layout)
+        QTimer.singleShot(0, self.ensure_gl)
+
+        # Give the splitter its initial proportions up front rather than
+        # have them worked out on first paint. The notebook keeps its
+        # width when the window is resized.
+        self.splitter.setSizes([250, 774])
+        self.splitter.setStretchFactor(0, 0)
+        self.splitter.setStretchFactor(1, 1)
 
         ################
         ### Info bar ###
@@ -320,19 +409,111 @@ class FlatCAMGUI(QMainWindow):
         #############
         ### Icons ###
         #############
-        self.app_icon = QIcon()
-        self.app_icon.addFile('share/flatcam_icon16.png', QSize(16, 16))
-        self.app_icon.addFile('share/flatcam_icon24.png', QSize(24, 24))
-        self.app_icon.addFile('share/flatcam_icon32.png', QSize(32, 32))
-        self.app_icon.addFile('share/flatcam_icon48.png', QSize(48, 48))
-        self.app_icon.addFile('share/flatcam_icon128.png', QSize(128, 128))
-        self.app_icon.addFile('share/flatcam_icon256.png', QSize(256, 256))
+        if FlatCAMGUI._APP_ICON is None:
+            FlatCAMGUI._APP_ICON = QIcon()
+            for size in _APP_ICON_SIZES:
+                FlatCAMGUI._APP_ICON.addFile(_res(f'share/flatcam_icon{size}.png'), QSize(size, size))
+        self.app_icon = FlatCAMGUI._APP_ICON
         self.setWindowIcon(self.app_icon)
 
         self.setGeometry(100, 100, 1024, 650)
         self.setWindowTitle(f"FlatCAM {version} - Development Version")
         self.show()
 
+    def _add_menu_actions(self, menu, spec):
+        """
+        Adds the actions described by ``spec`` to ``menu``, see
+        _FILE_MENU_OPEN for the format.
+        """
+        for entry in spec:
+            if entry is None:
+                menu.addSeparator()
+                continue
+            attr, icon, text = entry
+            action = QAction(_icon(icon) if icon else QIcon(), text, menu)
+            menu.addAction(action)
+            setattr(self, attr, action)
+
+    @staticmethod
+    def clear_menu(menu):
+        """
+        Removes all actions from a menu that is rebuilt at runtime,
+        such as the recent files menu, and schedules them for deletion.
+        QMenu.clear() only deletes the actions the menu owns, so those
+        parented elsewhere would otherwise accumulate.
+
+        :param menu: QMenu to clear.
+        :return: None
+        """
+        for action in menu.actions():
+            action.deleteLater()
+        menu.clear()
+
+    def _build_deferred_tabs(self):
+        if self._deferred_built:
+            return
+        self._deferred_built = True
+
+        ### Selected ###
+        self._selected_scroll_area = VerticalScrollArea()
+        self.selected_tab_layout.addWidget(self._selected_scroll_area)
+
+        ### Options ###
+        hlay1 = QHBoxLayout()
+        self.options_tab_layout.addLayout(hlay1)
+
+        self.icon = QLabel()
+        self.icon.setPixmap(_pixmap('share/gear48.png'))
+        hlay1.addWidget(self.icon)
+
+        self._options_combo = QComboBox()
+        self._options_combo.addItem("APPLICATION DEFAULTS")
+        self._options_combo.addItem("PROJECT OPTIONS")
+        hlay1.addWidget(self._options_combo)
+        hlay1.addStretch()
+
+        self._options_scroll_area = VerticalScrollArea()
+        self.options_tab_layout.addWidget(self._options_scroll_area)
+
+        ### Tool ###
+        self._tool_scroll_area = VerticalScrollArea()
+        self.tool_tab_layout.addWidget(self._tool_scroll_area)
+
+        self.tabs_built.emit()
+
+    @property
+    def selected_scroll_area(self):
+        self._build_deferred_tabs()
+        return self._selected_scroll_area
+
+    @property
+    def options_combo(self):
+        self._build_deferred_tabs()
+        return self._options_combo
+
+    @property
+    def options_scroll_area(self):
+        self._build_deferred_tabs()
+        return self._options_scroll_area
+
+    @property
+    def tool_scroll_area(self):
+        self._build_deferred_tabs()
+        return self._tool_scroll_area
+
+    def ensure_gl(self):
+        """
+        Shows the OpenGL plot area, creating its context if this is
+        the first time.
+
+        :return: None
+        """
+        if self.plot_stack.currentIndex() != 1:
+            self.plot_stack.setCurrentIndex(1)
+
+    def set_tooltips_enabled(self, enabled):
+        self._tooltips_enabled = bool(enabled)
+
     def showSelectedTab(self):
         self.notebook.setCurrentIndex(1)
 
@@ -344,18 +525,31 @@ class FlatCAMGUI(QMainWindow):
         :param event: QT event to filter
         :return:
         """
-        print(f"eventFilter({obj}, {event})")
-        if self.app.defaults["global_toggle_tooltips"] is False:
-            if event.type() == QtCore.QEvent.ToolTip:
-                return True
-            else:
-                return False
-
+        if not self._tooltips_enabled and event.type() == QEvent.Type.ToolTip:
+            return True
         return False
 
-    def closeEvent(self, event):
+    def _current_geom(self):
         grect = self.geometry()
-        self.geom_update.emit(grect.x(), grect.y(), grect.width(), grect.height(), self.splitter.sizes()[0])
+        sizes = self.splitter.sizes()
+        return grect.x(), grect.y(), grect.width(), grect.height(), sizes[0] if sizes else 250
+
+    def mark_geometry_saved(self):
+        """
+        Records the current window geometry and notebook width as the
+        persisted ones. closeEvent() only asks for them to be saved
+        if they differ from these.
+
+        :return: None
+        """
+        self._saved_geom = self._current_geom()
+
+    def closeEvent(self, event):
+        # Only ask for the geometry to be saved if it changed.
+        geom = self._current_geom()
+        if geom != self._saved_geom:
+            self.geom_update.emit(*geom)
+            self._saved_geom = geom
         QApplication.quit()
 
 
@@ -368,9 +562,8 @@ class FlatCAMActivityView(QWidget):
 
         self.icon = QLabel(self)
         self.icon.setGeometry(0, 0, 12, 12)
-        self.movie = QMovie("share/active.gif")
-        self.icon.setMovie(self.movie)
-        #self.movie.start()
+        # Loaded on the first set_busy()
+        self.movie = None
 
         layout = QHBoxLayout()
         layout.setContentsMargins(5, 0, 5, 0)
@@ -384,22 +577,43 @@ class FlatCAMActivityView(QWidget):
         layout.addWidget(self.text)
 
     def set_idle(self):
-        self.movie.stop()
+        if self.movie is not None:
+            self.movie.stop()
         self.text.setText("Idle.")
 
     def set_busy(self, msg):
+        if self.movie is None:
+            self.movie = QMovie(_res("share/active.gif"))
+            self.icon.setMovie(self.movie)
         self.movie.start()
         self.text.setText(msg)
 
+    def showEvent(self, event):
+        if self.movie is not None and self.movie.state() == QMovie.MovieState.Paused:
+            self.movie.setPaused(False)
+        super().showEvent(event)
+
+    def hideEvent(self, event):
+        if self.movie is not None and self.movie.state() == QMovie.MovieState.Running:
+            self.movie.setPaused(True)
+        super().hideEvent(event)
+
 
 class FlatCAMInfoBar(QWidget):
 
+    # Status light colour for each level, anything else is gray.
+    _LEVEL_COLORS = {'error': 'red', 'success': 'green', 'warning': 'yellow'}
+
+    @staticmethod
+    def _pmap(color):
+        return _pixmap(f'share/{color}light12.png')
+
     def __init__(self, parent=None):
         super(FlatCAMInfoBar, self).__init__(parent=parent)
 
         self.icon = QLabel(self)
         self.icon.setGeometry(0, 0, 12, 12)
-        self.pmap = QPixmap('share/graylight12.png')
+        self.pmap = self._pmap('gray')
         self.icon.setPixmap(self.pmap)
 
         layout = QHBoxLayout()
@@ -421,51 +635,158 @@ class FlatCAMInfoBar(QWidget):
         self.text.setToolTip(text)
 
     def set_status(self, text, level="info"):
-        level = str(level)
-        self.pmap.fill()
-        if level == "error":
-            self.pmap = QPixmap('share/redlight12.png')
-        elif level == "success":
-            self.pmap = QPixmap('share/greenlight12.png')
-        elif level == "warning":
-            self.pmap = QPixmap('share/yellowlight12.png')
-        else:
-            self.pmap = QPixmap('share/graylight12.png')
-
+        self.pmap = self._pmap(self._LEVEL_COLORS.get(str(level), 'gray'))
         self.icon.setPixmap(self.pmap)
         self.set_text_(text)
 
 
+# Tooltips shared by several option groups.
+_TT_PLOT = "Plot (show) this object."
+_TT_TOOL_DIA = "Diameter of the cutting tool."
+_TT_OVERLAP = ("How much (fraction of tool width)\n"
+               "to overlap each pass.")
+_TT_SPINDLE = ("Speed of the spindle\n"
+               "in RPM (optional)")
+
+
+def _header_label(text):
+    """
+    Section header for the option groups. Bold is set through the font
+    so the text doesn't go through Qt's rich text parser.
+    """
+    label = QLabel(text)
+    label.setTextFormat(Qt.TextFormat.PlainText)
+    font = label.font()
+    font.setBold(True)
+    label.setFont(font)
+    return label
+
+
+# Style of the OptionsGroupUI boxes. Set once on the application by
+# FlatCAMGUI instead of on each group, so it's only parsed once.
+OPTIONS_GROUP_STYLE = """
+QGroupBox[flatcamOptions="true"]
+{
+    font-size: 16px;
+    font-weight: bold;
+}
+"""
+
+
 class OptionsGroupUI(QGroupBox):
+    """
+    Base for the option groups. The widgets of a group are only
+    created by ``_build_ui()`` the first time the group is shown, or
+    when ``ensure_built()`` is called. ``built`` is emitted once they
+    exist.
+    """
+    built = pyqtSignal()
+
     def __init__(self, title, parent=None):
         QGroupBox.__init__(self, title, parent=parent)
-        self.setStyleSheet("""
-        QGroupBox
-        {
-            font-size: 16px;
-            font-weight: bold;
-        }
-        """)
+        self._built = False
+        # Styled by OPTIONS_GROUP_STYLE, installed once on the application.
+        self.setProperty("flatcamOptions", True)
 
         self.layout = QVBoxLayout()
         self.setLayout(self.layout)
 
+    def _build_ui(self):
+        pass
+
+    def _add_rows(self, grid, rows, first_row=0):
+        """
+        Adds a label and an input widget per row to ``grid``.
+
+        :param grid: QGridLayout to fill.
+        :param rows: Sequence of (attribute, label, tooltip, widget factory).
+            The widget is stored on the group under ``attribute``.
+        :param first_row: Grid row of the first entry.
+        """
+        for row, (attr, text, tooltip, factory) in enumerate(rows, first_row):
+            label = QLabel(text)
+            label.setToolTip(tooltip)
+            grid.addWidget(label, row, 0)
+            widget = factory()
+            setattr(self, attr, widget)
+            grid.addWidget(widget, row, 1)
+
+    def is_built(self):
+        return self._built
+
+    def ensure_built(self):
+        if not self._built:
+            self._built = True
+            self._build_ui()
+            self.built.emit()
+
+    def showEvent(self, event):
+        self.ensure_built()
+        super().showEvent(event)
+
 
 class GerberOptionsGroupUI(OptionsGroupUI):
+    # (attribute, label, tooltip, widget factory)
+    ISOLATION_ROWS = (
+        ('iso_tool_dia_entry', 'Tool dia:', _TT_TOOL_DIA, LengthEntry),
+        ('iso_width_entry', 'Width (# passes):',
+         "Width of the isolation gap in\n"
+         "number (integer) of tool widths.", IntEntry),
+        ('iso_overlap_entry', 'Pass overlap:', _TT_OVERLAP, FloatEntry),
+    )
+
+    CLEAR_COPPER_ROWS = (
+        ('ncc_tool_dia_entry', 'Tools dia:',
+         "Diameters of the cutting tools, separated by ','", FCEntry),
+        ('ncc_overlap_entry', 'Overlap:', _TT_OVERLAP, FloatEntry),
+        ('ncc_margin_entry', 'Margin:',
+         "Bounding box margin.", FloatEntry),
+    )
+
+    CUTOUT_ROWS = (
+        ('cutout_tooldia_entry', 'Tool dia:', _TT_TOOL_DIA, LengthEntry),
+        ('cutout_margin_entry', 'Margin:',
+         "Distance from objects at which\n"
+         "to draw the cutout.", LengthEntry),
+        ('cutout_gap_entry', 'Gap size:',
+         "Size of the gaps in the toolpath\n"
+         "that will remain to hold the\n"
+         "board in place.", LengthEntry),
+        ('gaps_radio', 'Gaps:',
+         "Where to place the gaps, Top/Bottom\n"
+         "Left/Rigt, or on all 4 sides.",
+         lambda: RadioSet([{'label': '2 (T/B)', 'value': 'tb'},
+                           {'label': '2 (L/R)', 'value': 'lr'},
+                           {'label': '4', 'value': '4'}])),
+    )
+
+    NONCOPPER_ROWS = (
+        ('noncopper_margin_entry', 'Boundary Margin:',
+         "Specify the edge of the PCB\n"
+         "by drawing a box around all\n"
+         "objects with this minimum\n"
+         "distance.", LengthEntry),
+    )
+
+    BOUNDING_BOX_ROWS = (
+        ('bbmargin_entry', 'Boundary Margin:',
+         "Distance of the edges of the box\n"
+         "to the nearest polygon.", LengthEntry),
+    )
+
     def __init__(self, parent=None):
         OptionsGroupUI.__init__(self, "Gerber Options", parent=parent)
 
+    def _build_ui(self):
         ## Plot options
-        self.plot_options_label = QLabel("<b>Plot Options:</b>")
+        self.plot_options_label = _header_label("Plot Options:")
         self.layout.addWidget(self.plot_options_label)
 
         grid0 = QGridLayout()
         self.layout.addLayout(grid0)
         # Plot CB
         self.plot_cb = FCCheckBox(label='Plot')
-        self.plot_options_label.setToolTip(
-            "Plot (show) this object."
-        )
+        self.plot_options_label.setToolTip(_TT_PLOT)
         grid0.addWidget(self.plot_cb, 0, 0)
 
         # Solid CB
@@ -483,7 +804,7 @@ class GerberOptionsGroupUI(OptionsGroupUI):
         grid0.addWidget(self.multicolored_cb, 0, 2)
 
         ## Isolation Routing
-        self.isolation_routing_label = QLabel("<b>Isolation Routing:</b>")
+        self.isolation_routing_label = _header_label("Isolation Routing:")
         self.isolation_routing_label.setToolTip(
             "Create a Geometry object with\n"
             "toolpaths to cut outside polygons."
@@ -492,32 +813,8 @@ class GerberOptionsGroupUI(OptionsGroupUI):
 
         grid1 = QGridLayout()
         self.layout.addLayout(grid1)
-        tdlabel = QLabel('Tool dia:')
-        tdlabel.setToolTip(
-            "Diameter of the cutting tool."
-        )
-        grid1.addWidget(tdlabel, 0, 0)
-        self.iso_tool_dia_entry = LengthEntry()
-        grid1.addWidget(self.iso_tool_dia_entry, 0, 1)
-
-        passlabel = QLabel('Width (# passes):')
-        passlabel.setToolTip(
-            "Width of the isolation gap in\n"
-            "number (integer) of tool widths."
-        )
-        grid1.addWidget(passlabel, 1, 0)
-        self.iso_width_entry = IntEntry()
-        grid1.addWidget(self.iso_width_entry, 1, 1)
-
-        overlabel = QLabel('Pass overlap:')
-        overlabel.setToolTip(
-            "How much (fraction of tool width)\n"
-            "to overlap each pass."
-        )
-        grid1.addWidget(overlabel, 2, 0)
-        self.iso_overlap_entry = FloatEntry()
-        grid1.addWidget(self.iso_overlap_entry, 2, 1)
-        
+        self._add_rows(grid1, self.ISOLATION_ROWS)
+
         self.combine_passes_cb = FCCheckBox(label='Combine Passes')
         self.combine_passes_cb.setToolTip(
             "Combine all passes into one object"
@@ -525,7 +822,7 @@ class GerberOptionsGroupUI(OptionsGroupUI):
         grid1.addWidget(self.combine_passes_cb, 3, 0)
 
         ## Clear non-copper regions
-        self.clearcopper_label = QLabel("<b>Clear non-copper:</b>")
+        self.clearcopper_label = _header_label("Clear non-copper:")
         self.clearcopper_label.setToolTip(
             "Create a Geometry object with\n"
             "toolpaths to cut all non-copper regions."
@@ -534,33 +831,10 @@ class GerberOptionsGroupUI(OptionsGroupUI):
 
         grid5 = QGridLayout()
         self.layout.addLayout(grid5)
-        ncctdlabel = QLabel('Tools dia:')
-        ncctdlabel.setToolTip(
-            "Diameters of the cutting tools, separated by ','"
-        )
-        grid5.addWidget(ncctdlabel, 0, 0)
-        self.ncc_tool_dia_entry = FCEntry()
-        grid5.addWidget(self.ncc_tool_dia_entry, 0, 1)
-
-        nccoverlabel = QLabel('Overlap:')
-        nccoverlabel.setToolTip(
-            "How much (fraction of tool width)\n"
-            "to overlap each pass."
-        )
-        grid5.addWidget(nccoverlabel, 1, 0)
-        self.ncc_overlap_entry = FloatEntry()
-        grid5.addWidget(self.ncc_overlap_entry, 1, 1)
-
-        nccmarginlabel = QLabel('Margin:')
-        nccmarginlabel.setToolTip(
-            "Bounding box margin."
-        )
-        grid5.addWidget(nccmarginlabel, 2, 0)
-        self.ncc_margin_entry = FloatEntry()
-        grid5.addWidget(self.ncc_margin_entry, 2, 1)
+        self._add_rows(grid5, self.CLEAR_COPPER_ROWS)
 
         ## Board cuttout
-        self.board_cutout_label = QLabel("<b>Board cutout:</b>")
+        self.board_cutout_label = _header_label("Board cutout:")
         self.board_cutout_label.setToolTip(
             "Create toolpaths to cut around\n"
             "the PCB and separate it from\n"
@@ -570,46 +844,10 @@ class GerberOptionsGroupUI(OptionsGroupUI):
 
         grid2 = QGridLayout()
         self.layout.addLayout(grid2)
-        tdclabel = QLabel('Tool dia:')
-        tdclabel.setToolTip(
-            "Diameter of the cutting tool."
-        )
-        grid2.addWidget(tdclabel, 0, 0)
-        self.cutout_tooldia_entry = LengthEntry()
-        grid2.addWidget(self.cutout_tooldia_entry, 0, 1)
-
-        marginlabel = QLabel('Margin:')
-        marginlabel.setToolTip(
-            "Distance from objects at which\n"
-            "to draw the cutout."
-        )
-        grid2.addWidget(marginlabel, 1, 0)
-        self.cutout_margin_entry = LengthEntry()
-        grid2.addWidget(self.cutout_margin_entry, 1, 1)
-
-        gaplabel = QLabel('Gap size:')
-        gaplabel.setToolTip(
-            "Size of the gaps in the toolpath\n"
-            "that will remain to hold the\n"
-            "board in place."
-        )
-        grid2.addWidget(gaplabel, 2, 0)
-        self.cutout_gap_entry = LengthEntry()
-        grid2.addWidget(self.cutout_gap_entry, 2, 1)
-
-        gapslabel = QLabel('Gaps:')
-        gapslabel.setToolTip(
-            "Where to place the gaps, Top/Bottom\n"
-            "Left/Rigt, or on all 4 sides."
-        )
-        grid2.addWidget(gapslabel, 3, 0)
-        self.gaps_radio = RadioSet([{'label': '2 (T/B)', 'value': 'tb'},
-                                    {'label': '2 (L/R)', 'value': 'lr'},
-                                    {'label': '4', 'value': '4'}])
-        grid2.addWidget(self.gaps_radio, 3, 1)
+        self._add_rows(grid2, self.CUTOUT_ROWS)
 
         ## Non-copper regions
-        self.noncopper_label = QLabel("<b>Non-copper regions:</b>")
+        self.noncopper_label = _header_label("Non-copper regions:")
         self.noncopper_label.setToolTip(
             "Create polygons covering the\n"
             "areas without copper on the PCB.\n"
@@ -623,16 +861,7 @@ class GerberOptionsGroupUI(OptionsGroupUI):
         self.layout.addLayout(grid3)
 
         # Margin
-        bmlabel = QLabel('Boundary Margin:')
-        bmlabel.setToolTip(
-            "Specify the edge of the PCB\n"
-            "by drawing a box around all\n"
-            "objects with this minimum\n"
-            "distance."
-        )
-        grid3.addWidget(bmlabel, 0, 0)
-        self.noncopper_margin_entry = LengthEntry()
-        grid3.addWidget(self.noncopper_margin_entry, 0, 1)
+        self._add_rows(grid3, self.NONCOPPER_ROWS)
 
         # Rounded corners
         self.noncopper_rounded_cb = FCCheckBox(label="Rounded corners")
@@ -643,20 +872,12 @@ class GerberOptionsGroupUI(OptionsGroupUI):
         grid3.addWidget(self.noncopper_rounded_cb, 1, 0, 1, 2)
 
         ## Bounding box
-        self.boundingbox_label = QLabel('<b>Bounding Box:</b>')
+        self.boundingbox_label = _header_label('Bounding Box:')
         self.layout.addWidget(self.boundingbox_label)
 
         grid4 = QGridLayout()
         self.layout.addLayout(grid4)
-
-        bbmargin = QLabel('Boundary Margin:')
-        bbmargin.setToolTip(
-            "Distance of the edges of the box\n"
-            "to the nearest polygon."
-        )
-        grid4.addWidget(bbmargin, 0, 0)
-        self.bbmargin_entry = LengthEntry()
-        grid4.addWidget(self.bbmargin_entry, 0, 1)
+        self._add_rows(grid4, self.BOUNDING_BOX_ROWS)
 
         self.bbrounded_cb = FCCheckBox(label="Rounded corners")
         self.bbrounded_cb.setToolTip(
@@ -669,19 +890,37 @@ class GerberOptionsGroupUI(OptionsGroupUI):
 
 
 class ExcellonOptionsGroupUI(OptionsGroupUI):
+    CNCJOB_ROWS = (
+        ('cutz_entry', 'Cut Z:',
+         "Drill depth (negative)\n"
+         "below the copper surface.", LengthEntry),
+        ('travelz_entry', 'Travel Z:',
+         "Tool height when travelling\n"
+         "across the XY plane.", LengthEntry),
+        ('feedrate_entry', 'Feed rate:',
+         "Tool speed while drilling\n"
+         "(in units per minute).", LengthEntry),
+        ('toolchangez_entry', 'Toolchange Z:',
+         "Tool Z where user can change drill bit\n", LengthEntry),
+        ('spindlespeed_entry', 'Spindle speed:', _TT_SPINDLE, lambda: IntEntry(allow_empty=True)),
+    )
+
+    MILL_HOLES_ROWS = (
+        ('tooldia_entry', 'Tool dia:', _TT_TOOL_DIA, LengthEntry),
+    )
+
     def __init__(self, parent=None):
         OptionsGroupUI.__init__(self, "Excellon Options", parent=parent)
 
+    def _build_ui(self):
         ## Plot options
-        self.plot_options_label = QLabel("<b>Plot Options:</b>")
+        self.plot_options_label = _header_label("Plot Options:")
         self.layout.addWidget(self.plot_options_label)
 
         grid0 = QGridLayout()
         self.layout.addLayout(grid0)
         self.plot_cb = FCCheckBox(label='Plot')
-        self.plot_cb.setToolTip(
-            "Plot (show) this object."
-        )
+        self.plot_cb.setToolTip(_TT_PLOT)
         grid0.addWidget(self.plot_cb, 0, 0)
         self.solid_cb = FCCheckBox(label='Solid')
         self.solid_cb.setToolTip(
@@ -690,7 +929,7 @@ class ExcellonOptionsGroupUI(OptionsGroupUI):
         grid0.addWidget(self.solid_cb, 0, 1)
 
         ## Create CNC Job
-        self.cncjob_label = QLabel('<b>Create CNC Job</b>')
+        self.cncjob_label = _header_label('Create CNC Job')
         self.cncjob_label.setToolTip(
             "Create a CNC Job object\n"
             "for this drill object."
@@ -699,53 +938,10 @@ class ExcellonOptionsGroupUI(OptionsGroupUI):
 
         grid1 = QGridLayout()
         self.layout.addLayout(grid1)
-
-        cutzlabel = QLabel('Cut Z:')
-        cutzlabel.setToolTip(
-            "Drill depth (negative)\n"
-            "below the copper surface."
-        )
-        grid1.addWidget(cutzlabel, 0, 0)
-        self.cutz_entry = LengthEntry()
-        grid1.addWidget(self.cutz_entry, 0, 1)
-
-        travelzlabel = QLabel('Travel Z:')
-        travelzlabel.setToolTip(
-            "Tool height when travelling\n"
-            "across the XY plane."
-        )
-        grid1.addWidget(travelzlabel, 1, 0)
-        self.travelz_entry = LengthEntry()
-        grid1.addWidget(self.travelz_entry, 1, 1)
-
-        frlabel = QLabel('Feed rate:')
-        frlabel.setToolTip(
-            "Tool speed while drilling\n"
-            "(in units per minute)."
-        )
-        grid1.addWidget(frlabel, 2, 0)
-        self.feedrate_entry = LengthEntry()
-        grid1.addWidget(self.feedrate_entry, 2, 1)
-
-        toolchangezlabel = QLabel('Toolchange Z:')
-        toolchangezlabel.setToolTip(
-            "Tool Z where user can change drill bit\n"
-        )
-        grid1.addWidget(toolchangezlabel, 3, 0)
-        self.toolchangez_entry = LengthEntry()
-        grid1.addWidget(self.toolchangez_entry, 3, 1)
-
-        spdlabel = QLabel('Spindle speed:')
-        spdlabel.setToolTip(
-            "Speed of the spindle\n"
-            "in RPM (optional)"
-        )
-        grid1.addWidget(spdlabel, 4, 0)
-        self.spindlespeed_entry = IntEntry(allow_empty=True)
-        grid1.addWidget(self.spindlespeed_entry, 4, 1)
+        self._add_rows(grid1, self.CNCJOB_ROWS)
 
         #### Milling Holes ####
-        self.mill_hole_label = QLabel('<b>Mill Holes</b>')
+        self.mill_hole_label = _header_label('Mill Holes')
         self.mill_hole_label.setToolTip(
             "Create Geometry for milling holes."
         )
@@ -753,32 +949,54 @@ class ExcellonOptionsGroupUI(OptionsGroupUI):
 
         grid1 = QGridLayout()
         self.layout.addLayout(grid1)
-        tdlabel = QLabel('Tool dia:')
-        tdlabel.setToolTip(
-            "Diameter of the cutting tool."
-        )
-        grid1.addWidget(tdlabel, 0, 0)
-        self.tooldia_entry = LengthEntry()
-        grid1.addWidget(self.tooldia_entry, 0, 1)
+        self._add_rows(grid1, self.MILL_HOLES_ROWS)
 
 
 class GeometryOptionsGroupUI(OptionsGroupUI):
+    CNCJOB_ROWS = (
+        ('cutz_entry', 'Cut Z:',
+         "Cutting depth (negative)\n"
+         "below the copper surface.", LengthEntry),
+        ('travelz_entry', 'Travel Z:',
+         "Height of the tool when\n"
+         "moving without cutting.", LengthEntry),
+        ('cncfeedrate_entry', 'Feed Rate:',
+         "Cutting speed in the XY\n"
+         "plane in units per minute", LengthEntry),
+        ('cnctooldia_entry', 'Tool dia:',
+         "The diameter of the cutting\n"
+         "tool (just for display).", LengthEntry),
+        ('cncspindlespeed_entry', 'Spindle speed:', _TT_SPINDLE, lambda: IntEntry(allow_empty=True)),
+    )
+
+    PAINT_ROWS = (
+        ('painttooldia_entry', 'Tool dia:',
+         "Diameter of the tool to\n"
+         "be used in the operation.", LengthEntry),
+        ('paintoverlap_entry', 'Overlap:',
+         "How much (fraction) of the tool\n"
+         "width to overlap each tool pass.", LengthEntry),
+        ('paintmargin_entry', 'Margin:',
+         "Distance by which to avoid\n"
+         "the edges of the polygon to\n"
+         "be painted.", LengthEntry),
+    )
+
     def __init__(self, parent=None):
         OptionsGroupUI.__init__(self, "Geometry Options", parent=parent)
 
+    def _build_ui(self):
         ## Plot options
-        self.plot_options_label = QLabel("<b>Plot Options:</b>")
+        self.plot_options_label = _header_label("Plot Options:")
         self.layout.addWidget(self.plot_options_label)
 
         # Plot CB
         self.plot_cb = FCCheckBox(label='Plot')
-        self.plot_cb.setToolTip(
-            "Plot (show) this object."
-        )
+        self.plot_cb.setToolTip(_TT_PLOT)
         self.layout.addWidget(self.plot_cb)
 
         ## Create CNC Job
-        self.cncjob_label = QLabel('<b>Create CNC Job:</b>')
+        self.cncjob_label = _header_label('Create CNC Job:')
         self.cncjob_label.setToolTip(
             "Create a CNC Job object\n"
             "tracing the contours of this\n"
@@ -788,57 +1006,10 @@ class GeometryOptionsGroupUI(OptionsGroupUI):
 
         grid1 = QGridLayout()
         self.layout.addLayout(grid1)
-
-        cutzlabel = QLabel('Cut Z:')
-        cutzlabel.setToolTip(
-            "Cutting depth (negative)\n"
-            "below the copper surface."
-        )
-        grid1.addWidget(cutzlabel, 0, 0)
-        self.cutz_entry = LengthEntry()
-        grid1.addWidget(self.cutz_entry, 0, 1)
-
-        # Travel Z
-        travelzlabel = QLabel('Travel Z:')
-        travelzlabel.setToolTip(
-            "Height of the tool when\n"
-            "moving without cutting."
-        )
-        grid1.addWidget(travelzlabel, 1, 0)
-        self.travelz_entry = LengthEntry()
-        grid1.addWidget(self.travelz_entry, 1, 1)
-
-        # Feedrate
-        frlabel = QLabel('Feed Rate:')
-        frlabel.setToolTip(
-            "Cutting speed in the XY\n"
-            "plane in units per minute"
-        )
-        grid1.addWidget(frlabel, 2, 0)
-        self.cncfeedrate_entry = LengthEntry()
-        grid1.addWidget(self.cncfeedrate_entry, 2, 1)
-
-        # Tooldia
-        tdlabel = QLabel('Tool dia:')
-        tdlabel.setToolTip(
-            "The diameter of the cutting\n"
-            "tool (just for display)."
-        )
-        grid1.addWidget(tdlabel, 3, 0)
-        self.cnctooldia_entry = LengthEntry()
-        grid1.addWidget(self.cnctooldia_entry, 3, 1)
-
-        spdlabel = QLabel('Spindle speed:')
-        spdlabel.setToolTip(
-            "Speed of the spindle\n"
-            "in RPM (optional)"
-        )
-        grid1.addWidget(spdlabel, 4, 0)
-        self.cncspindlespeed_entry = IntEntry(allow_empty=True)
-        grid1.addWidget(self.cncspindlespeed_entry, 4, 1)
+        self._add_rows(grid1, self.CNCJOB_ROWS)
 
         ## Paint area
-        self.paint_label = QLabel('<b>Paint Area:</b>')
+        self.paint_label = _header_label('Paint Area:')
         self.paint_label.setToolTip(
             "Creates tool paths to cover the\n"
             "whole area of a polygon (remove\n"
@@ -849,46 +1020,22 @@ class GeometryOptionsGroupUI(OptionsGroupUI):
 
         grid2 = QGridLayout()
         self.layout.addLayout(grid2)
-
-        # Tool dia
-        ptdlabel = QLabel('Tool dia:')
-        ptdlabel.setToolTip(
-            "Diameter of the tool to\n"
-            "be used in the operation."
-        )
-        grid2.addWidget(ptdlabel, 0, 0)
-
-        self.painttooldia_entry = LengthEntry()
-        grid2.addWidget(self.painttooldia_entry, 0, 1)
-
-        # Overlap
-        ovlabel = QLabel('Overlap:')
-        ovlabel.setToolTip(
-            "How much (fraction) of the tool\n"
-            "width to overlap each tool pass."
-        )
-        grid2.addWidget(ovlabel, 1, 0)
-        self.paintoverlap_entry = LengthEntry()
-        grid2.addWidget(self.paintoverlap_entry, 1, 1)
-
-        # Margin
-        marginlabel = QLabel('Margin:')
-        marginlabel.setToolTip(
-            "Distance by which to avoid\n"
-            "the edges of the polygon to\n"
-            "be painted."
-        )
-        grid2.addWidget(marginlabel, 2, 0)
-        self.paintmargin_entry = LengthEntry()
-        grid2.addWidget(self.paintmargin_entry)
+        self._add_rows(grid2, self.PAINT_ROWS)
 
 
 class CNCJobOptionsGroupUI(OptionsGroupUI):
+    PLOT_ROWS = (
+        ('tooldia_entry', 'Tool dia:',
+         "Diameter of the tool to be\n"
+         "rendered in the plot.", LengthEntry),
+    )
+
     def __init__(self, parent=None):
         OptionsGroupUI.__init__(self, "CNC Job Options", parent=None)
 
+    def _build_ui(self):
         ## Plot options
-        self.plot_options_label = QLabel("<b>Plot Options:</b>")
+        self.plot_options_label = _header_label("Plot Options:")
         self.layout.addWidget(self.plot_options_label)
 
         grid0 = QGridLayout()
@@ -897,23 +1044,14 @@ class CNCJobOptionsGroupUI(OptionsGroupUI):
         # Plot CB
         # self.plot_cb = QCheckBox('Plot')
         self.plot_cb = FCCheckBox('Plot')
-        self.plot_cb.setToolTip(
-            "Plot (show) this object."
-        )
+        self.plot_cb.setToolTip(_TT_PLOT)
         grid0.addWidget(self.plot_cb, 0, 0)
 
         # Tool dia for plot
-        tdlabel = QLabel('Tool dia:')
-        tdlabel.setToolTip(
-            "Diameter of the tool to be\n"
-            "rendered in the plot."
-        )
-        grid0.addWidget(tdlabel, 1, 0)
-        self.tooldia_entry = LengthEntry()
-        grid0.addWidget(self.tooldia_entry, 1, 1)
+        self._add_rows(grid0, self.PLOT_ROWS, first_row=1)
 
         ## Export G-Code
-        self.export_gcode_label = QLabel("<b>Export G-Code:</b>")
+        self.export_gcode_label = _header_label("Export G-Code:")
         self.export_gcode_label.setToolTip(
             "Export and save G-Code to\n"
             "make this object to a file."
@@ -1010,3 +1148,23 @@ class GlobalOptionsUI(QWidget):
         # self.cncjob_group.setStyle(QFrame.StyledPanel)
         layout.addWidget(self.cncjob_group)
 
+    @property
+    def groups(self):
+        return (self.gerber_group, self.excellon_group,
+                self.geometry_group, self.cncjob_group)
+
+    def get_field(self, group, attr):
+        """
+        Returns an input widget of the form.
+
+        :param group: Attribute name of the option group holding the
+            widget, or None for widgets of the form itself.
+        :param attr: Attribute name of the widget.
+        :return: The widget, or None if its group has not been built yet.
+        """
+        if group is None:
+            return getattr(self, attr)
+        group = getattr(self, group)
+        if not group.is_built():
+            return None
+        return getattr(group, attr)
@@ -1,8 +1,7 @@
-import inspect  # TODO: For debugging only.
+import logging
 import re
 import sys
 
-from copy import copy
 from io import StringIO
 from PyQt6.QtCore import pyqtSignal, Qt, QObject, QTimer
 from PyQt6.QtWidgets import QTableWidgetItem, QFileDialog
@@ -62,8 +61,11 @@ class FlatCAMObj(QObject):
 
         self.muted_ui = False
         self.deleted = False
+        self._visible = None                # Last visibility applied to shapes
 
         self._drawing_tolerance = 0.01
+        self._tolerance_cached = None
+        self._tolerance_units = None
 
         # assert isinstance(self.ui, ObjectUI)
         # self.ui.name_entry.returnPressed.connect(self.on_name_activate)
@@ -91,8 +93,10 @@ class FlatCAMObj(QObject):
                 setattr(self, attr, d[attr])
 
     def on_options_change(self, key):
-        # Update form on programmatically options change
-        self.set_form_item(key)
+        # Update form on programmatically options change, unless the
+        # form is being filled in bulk anyway.
+        if not self.muted_ui:
+            self.set_form_item(key)
 
         # Set object visibility
         if key == 'plot':
@@ -113,7 +117,7 @@ class FlatCAMObj(QObject):
         return "<FlatCAMObj({:12s}): {:20s}>".format(self.kind, self.options["name"])
 
     def on_name_activate(self):
-        old_name = copy(self.options["name"])
+        old_name = self.options["name"]
         new_name = self.ui.name_entry.get_value()
         self.options["name"] = self.ui.name_entry.get_value()
         self.app.info("Name changed from %s to %s" % (old_name, new_name))
@@ -139,12 +143,20 @@ class FlatCAMObj(QObject):
 
         :return: None
         """
-        FlatCAMApp.App.log.debug(str(inspect.stack()[1][3]) + "--> FlatCAMObj.to_form()")
-        for option in self.options:
-            try:
-                self.set_form_item(option)
-            except:
-                self.app.log.warning("Unexpected error:", sys.exc_info())
+        if FlatCAMApp.App.log.isEnabledFor(logging.DEBUG):
+            FlatCAMApp.App.log.debug("%s--> FlatCAMObj.to_form()", sys._getframe(1).f_code.co_name)
+
+        # Widget change handlers check muted_ui, so they don't act on
+        # the values being loaded.
+        muted, self.muted_ui = self.muted_ui, True
+        try:
+            for option in [o for o in self.options if o in self.form_fields]:
+                try:
+                    self.set_form_item(option)
+                except:
+                    self.app.log.warning("Unexpected error: %s", sys.exc_info())
+        finally:
+            self.muted_ui = muted
 
     def read_form(self):
         """
@@ -153,12 +165,13 @@ class FlatCAMObj(QObject):
         :return: None
         :rtype: None
         """
-        FlatCAMApp.App.log.debug(str(inspect.stack()[1][3]) + "--> FlatCAMObj.read_form()")
-        for option in self.options:
+        if FlatCAMApp.App.log.isEnabledFor(logging.DEBUG):
+            FlatCAMApp.App.log.debug("%s--> FlatCAMObj.read_form()", sys._getframe(1).f_code.co_name)
+        for option in [o for o in self.options if o in self.form_fields]:
             try:
                 self.read_form_item(option)
             except:
-                self.app.log.warning("Unexpected error:", sys.exc_info())
+                self.app.log.warning("Unexpected error: %s", sys.exc_info())
 
     def build_ui(self):
         """
@@ -170,7 +183,8 @@ class FlatCAMObj(QObject):
         """
 
         self.muted_ui = True
-        FlatCAMApp.App.log.debug(str(inspect.stack()[1][3]) + "--> FlatCAMObj.build_ui()")
+        if FlatCAMApp.App.log.isEnabledFor(logging.DEBUG):
+            FlatCAMApp.App.log.debug("%s--> FlatCAMObj.build_ui()", sys._getframe(1).f_code.co_name)
 
         # Remove anything else in the box
         # box_children = self.app.ui.notebook.selected_contents.get_children()
@@ -183,27 +197,22 @@ class FlatCAMObj(QObject):
         # box_selected.pack_start(sw, True, True, 0)
         # self.app.ui.notebook.selected_contents.add(self.ui)
         # self.app.ui.selected_layout.addWidget(self.ui)
-        try:
-            self.app.ui.selected_scroll_area.takeWidget()
-        except:
-            self.app.log.debug("Nothing to remove")
-        self.app.ui.selected_scroll_area.setWidget(self.ui)
+        self.app.ui.selected_scroll_area.replace_widget(self.ui)
 
         self.muted_ui = False
 
     def set_form_item(self, option):
         """
-        Copies the specified option to the UI form.
+        Copies the specified option to the UI form. Options without
+        a form field are ignored.
 
         :param option: Name of the option (Key in ``self.options``).
         :type option: str
         :return: None
         """
 
-        try:
+        if option in self.form_fields:
             self.form_fields[option].set_value(self.options[option])
-        except KeyError:
-            self.app.log.warn("Tried to set an option or field that does not exist: %s" % option)
 
     def read_form_item(self, option):
         """
@@ -214,10 +223,10 @@ class FlatCAMObj(QObject):
         :return: None
         """
 
-        try:
+        if option in self.form_fields:
             self.options[option] = self.form_fields[option].get_value()
-        except KeyError:
-            self.app.log.warning("Failed to read option from field: %s" % option)
+        else:
+            self.app.log.warning("Failed to read option from field: %s", option)
 
         # #try read field only when option have equivalent in form_fields
         # if option in self.form_fields:
@@ -238,7 +247,8 @@ class FlatCAMObj(QObject):
         :return: Whether to continue plotting or not depending on the "plot" option.
         :rtype: bool
         """
-        FlatCAMApp.App.log.debug(str(inspect.stack()[1][3]) + " --> FlatCAMObj.plot()")
+        if FlatCAMApp.App.log.isEnabledFor(logging.DEBUG):
+            FlatCAMApp.App.log.debug("%s --> FlatCAMObj.plot()", sys._getframe(1).f_code.co_name)
 
         if self.deleted:
             return False
@@ -271,29 +281,57 @@ class FlatCAMObj(QObject):
         if self.deleted:
             raise ObjectDeleted()
         else:
+            self._visible = None
             self.shapes.add(tolerance=self.drawing_tolerance, **kwargs)
 
+    def add_shapes(self, shapes, **kwargs):
+        """
+        Adds several shapes to the plot collection in one call.
+
+        :param shapes: Iterable of keyword argument dicts, one per shape,
+            as accepted by add_shape().
+        :param kwargs: Arguments common to all the shapes.
+        :return: None
+        """
+        if self.deleted:
+            raise ObjectDeleted()
+        else:
+            self._visible = None
+            self.shapes.add_batch(list(shapes), tolerance=self.drawing_tolerance, **kwargs)
+
     @property
     def visible(self):
         return self.shapes.visible
 
     @visible.setter
     def visible(self, value):
+        # Shapes added since the last call carry their own visibility,
+        # add_shape()/add_shapes() reset _visible so they are updated too.
+        if value == self._visible:
+            return
+        self._visible = value
+
         self.shapes.visible = value
 
         # Not all object types has annotations
-        try:
-            self.annotation.visible = value
-        except AttributeError:
-            pass
+        annotation = getattr(self, 'annotation', None)
+        if annotation is not None:
+            annotation.visible = value
 
     @property
     def drawing_tolerance(self):
-        return self._drawing_tolerance if self.units == 'MM' or not self.units else self._drawing_tolerance / 25.4
+        # Cached per units value, recomputed only when the units change.
+        units = self.units
+        if self._tolerance_cached is None or units != self._tolerance_units:
+            self._tolerance_cached = self._drawing_tolerance if units == 'MM' or not units \
+                else self._drawing_tolerance / 25.4
+            self._tolerance_units = units
+        return self._tolerance_cached
 
     @drawing_tolerance.setter
     def drawing_tolerance(self, value):
         self._drawing_tolerance = value if self.units == 'MM' or not self.units else value / 25.4
+        self._tolerance_cached = None
 
     def clear(self, update=False):
         self.shapes.clear(update)
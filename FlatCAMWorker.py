@@ -1,20 +1,24 @@
-from PyQt6.QtCore import QObject, pyqtSignal
+import logging
 
+from PyQt6.QtCore import QRunnable
 
-class Worker(QObject):
+log = logging.getLogger('base')
+
+
+class Task(QRunnable):
     """
-    Implements a queue of tasks to be carried out in order
-    in a single independent thread.
+    A single call of ``fcn(*params)`` to be carried out
+    by a thread of the WorkerStack pool.
     """
 
     # avoid multiple tests  for debug availability
     pydevd_failed = False
-    task_completed = pyqtSignal(str)
 
-    def __init__(self, app, name=None):
+    def __init__(self, stack, fcn, params):
         super().__init__()
-        self.app = app
-        self.name = name
+        self.stack = stack
+        self.fcn = fcn
+        self.params = params
 
     def allow_debug(self):
         """
@@ -23,37 +27,23 @@ class Worker(QObject):
         :return:
         """
 
-        if not self.pydevd_failed:
+        if not Task.pydevd_failed:
             try:
                 import pydevd
                 pydevd.settrace(suspend=False, trace_only_current_thread=True)
             except ImportError:
-                self.pydevd_failed=True
+                Task.pydevd_failed = True
 
     def run(self):
 
-        # self.app.log.debug("Worker Started!")
+        # self.stack.log.debug("Running task: %s" % str(self.fcn))
 
         self.allow_debug()
 
-        # Tasks are queued in the event listener.
-        self.app.worker_task.connect(self.do_worker_task)
-
-    def do_worker_task(self, task):
-
-        # self.app.log.debug("Running task: %s" % str(task))
-
-        self.allow_debug()
-
-        if ('worker_name' in task and task['worker_name'] == self.name) or \
-                ('worker_name' not in task and self.name is None):
-
-            try:
-                task['fcn'](*task['params'])
-            except Exception as e:
-                self.app.thread_exception.emit(e)
-                raise e
-            finally:
-                self.task_completed.emit(self.name)
-
-        # self.app.log.debug("Task ignored.")
+        # Nothing above run() would see an exception raised here, and
+        # it would take the pool thread down, so it is reported instead.
+        try:
+            self.fcn(*self.params)
+        except Exception as e:
+            log.exception("Worker task %s failed", self.fcn)
+            self.stack.thread_exception.emit(e)
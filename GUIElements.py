@@ -1,10 +1,11 @@
+import ast
+import math
 import re
 import logging
 
-from copy import copy
-from PyQt6 import QtCore
-from PyQt6.QtCore import Qt, QSize
-from PyQt6.QtWidgets import QScrollArea, QWidget, QTableWidget, \
+from functools import lru_cache
+from PyQt6.QtCore import Qt, QSize, QAbstractTableModel, QModelIndex
+from PyQt6.QtWidgets import QScrollArea, QWidget, QTableView, \
     QPlainTextEdit, QCheckBox, QHBoxLayout, QVBoxLayout, \
         QButtonGroup, QRadioButton, QLineEdit
 from PyQt6.QtCore import QEvent, pyqtSignal
@@ -14,6 +15,135 @@ log = logging.getLogger('GuiElements')
 
 EDIT_SIZE_HINT = 80
 
+# Upper bound on lines kept by FCTextArea (G-code prepend/append text).
+TEXT_AREA_MAX_BLOCKS = 10000
+
+# Names that may be used in expressions typed into entries, e.g. "pi/4".
+_EXPR_NAMES = {name: getattr(math, name) for name in
+               ('pi', 'sqrt', 'sin', 'cos', 'tan', 'asin', 'acos', 'atan', 'atan2',
+                'radians', 'degrees')}
+
+# Syntax allowed in entry expressions: numbers, arithmetic, tuples and
+# lists of those, and calls to the functions in _EXPR_NAMES.
+_EXPR_NODES = (ast.Expression, ast.Constant, ast.BinOp, ast.UnaryOp, ast.Tuple,
+               ast.List, ast.Name, ast.Call, ast.Load,
+               ast.Add, ast.Sub, ast.Mult, ast.Div, ast.FloorDiv, ast.Mod, ast.Pow,
+               ast.USub, ast.UAdd)
+
+# Largest exponent allowed in an entry expression. Together with the
+# base not being a power itself this keeps results small enough to
+# compute at once, e.g. "9**9**9" is rejected.
+_EXPR_MAX_EXPONENT = 64
+
+
+def _check_pow(node):
+    """
+    Checks that a power in an entry expression has a numeric exponent
+    of at most _EXPR_MAX_EXPONENT and a base without powers.
+
+    :param node: ast.BinOp with an ast.Pow operator.
+    :raises ValueError: If the power is not allowed.
+    """
+    exponent = node.right
+    if isinstance(exponent, ast.UnaryOp) and isinstance(exponent.op, (ast.USub, ast.UAdd)):
+        exponent = exponent.operand
+    if not isinstance(exponent, ast.Constant) or not isinstance(exponent.value, (int, float)) \
+            or abs(exponent.value) > _EXPR_MAX_EXPONENT:
+        raise ValueError("Exponent must be a number up to %d" % _EXPR_MAX_EXPONENT)
+    for sub in ast.walk(node.left):
+        if isinstance(sub, ast.BinOp) and isinstance(sub.op, ast.Pow):
+            raise ValueError("Powers of powers are not allowed")
+
+
+@lru_cache(maxsize=512)
+def _compile_expr(src):
+    """
+    Compiles an entry expression after checking it only uses the
+    syntax in _EXPR_NODES. Results are cached by source text.
+
+    :param src: Expression text.
+    :return: Code object.
+    :raises SyntaxError, ValueError: If the text is not an allowed expression.
+    """
+    tree = ast.parse(src, mode='eval')
+    for node in ast.walk(tree):
+        if not isinstance(node, _EXPR_NODES):
+            raise ValueError("Not allowed in expression: %s" % type(node).__name__)
+        if isinstance(node, ast.Constant) and not isinstance(node.value, (int, float)):
+            raise ValueError("Not a number: %r" % node.value)
+        if isinstance(node, ast.Name) and node.id not in _EXPR_NAMES:
+            raise ValueError("Unknown name: %s" % node.id)
+        if isinstance(node, ast.Call) and (not isinstance(node.func, ast.Name) or node.keywords):
+            raise ValueError("Only plain function calls are allowed")
+        if isinstance(node, ast.BinOp):
+            # Tuples and lists are only values, e.g. "[0]*10**9" would
+            # build a huge sequence.
+            if isinstance(node.left, (ast.List, ast.Tuple)) or isinstance(node.right, (ast.List, ast.Tuple)):
+                raise ValueError("No arithmetic on tuples or lists")
+            if isinstance(node.op, ast.Pow):
+                _check_pow(node)
+    return compile(tree, '<entry>', 'eval')
+
+
+def _is_finite(value):
+    """
+    Checks that a number, or every number in nested tuples and lists,
+    is real and finite.
+
+    :param value: Result of an entry expression.
+    :return: False if any number in it is complex, infinite or NaN.
+    """
+    if isinstance(value, (tuple, list)):
+        return all(_is_finite(item) for item in value)
+    if isinstance(value, complex):
+        return False
+    return not isinstance(value, float) or math.isfinite(value)
+
+
+def _safe_eval(raw):
+    """
+    Evaluates the text of an entry. Plain numbers are converted
+    directly, anything else must be an arithmetic expression.
+    Integers stay integers, as they would with eval().
+
+    :param raw: Text to evaluate.
+    :return: The value of the expression.
+    :raises Exception: If the text cannot be evaluated or gives
+        infinite or NaN values.
+    """
+    try:
+        value = int(raw)
+    except ValueError:
+        try:
+            value = float(raw)
+        except ValueError:
+            value = eval(_compile_expr(raw), {'__builtins__': {}}, _EXPR_NAMES)
+
+    # float() accepts "nan", "inf" and "1e400", expressions can
+    # overflow and powers of negative numbers can be complex, e.g.
+    # "(-8)**0.5". None of them makes sense as a size or offset.
+    if not _is_finite(value):
+        raise ValueError("Not a finite real number: %s" % raw)
+    return value
+
+
+class EditSizeHint:
+    """
+    Mixin for edit widgets giving them a fixed EDIT_SIZE_HINT width hint.
+    The hint is computed once and kept until the font or style changes.
+    """
+    _cached_hint = None
+
+    def sizeHint(self):
+        if self._cached_hint is None:
+            self._cached_hint = QSize(EDIT_SIZE_HINT, super().sizeHint().height())
+        return self._cached_hint
+
+    def changeEvent(self, event):
+        if event.type() in (QEvent.Type.FontChange, QEvent.Type.StyleChange):
+            self._cached_hint = None
+        super().changeEvent(event)
+
 
 class RadioSet(QWidget):
     activated_custom = pyqtSignal()
@@ -29,20 +159,23 @@ class RadioSet(QWidget):
         :type choices: list
         """
         super().__init__(parent)
-        self.choices = copy(choices)
+        self.choices = choices
 
         if orientation == 'horizontal':
             layout = QHBoxLayout()
         else:
             layout = QVBoxLayout()
 
-        group = QButtonGroup(self)
+        self.group = QButtonGroup(self)
 
-        for choice in self.choices:
+        for i, choice in enumerate(self.choices):
             choice['radio'] = QRadioButton(choice['label'])
-            group.addButton(choice['radio'])
+            self.group.addButton(choice['radio'], i)
             layout.addWidget(choice['radio'], stretch=0)
-            choice['radio'].toggled.connect(self.on_toggle)
+
+        self._id_to_value = {i: choice['value'] for i, choice in enumerate(self.choices)}
+        self._value_to_button = {choice['value']: choice['radio'] for choice in self.choices}
+        self.group.idToggled.connect(self.on_toggle)
 
         layout.setContentsMargins(0, 0, 0, 0)
         layout.addStretch()
@@ -50,84 +183,69 @@ class RadioSet(QWidget):
 
         self.group_toggle_fn = lambda: None
 
-    def on_toggle(self):
-        log.debug("Radio toggled")
-        radio = self.sender()
-        # TODO - catch error if sender isn't a QRadioButton
-        try:
-            if radio.isChecked():
-                self.group_toggle_fn()
-                self.activated_custom.emit()
-        except AttributeError as e:
-            log.debug(f"Tried to treat {radio} as a QRadioButton, but it's not? {type(radio)}")
-
-        return
+    def on_toggle(self, button_id, checked):
+        # Each click toggles two buttons, only act on the one being checked.
+        if checked:
+            log.debug("Radio toggled")
+            self.group_toggle_fn()
+            self.activated_custom.emit()
 
     def get_value(self):
-        for choice in self.choices:
-            if choice['radio'].isChecked():
-                return choice['value']
-        log.error("No button was toggled in RadioSet.")
-        return None
+        value = self._id_to_value.get(self.group.checkedId())
+        if value is None:
+            log.error("No button was toggled in RadioSet.")
+        return value
 
     def set_value(self, val):
-        for choice in self.choices:
-            if choice['value'] == val:
-                choice['radio'].setChecked(True)
-                return
-        log.error("Value given is not part of this RadioSet: %s" % str(val))
+        try:
+            self._value_to_button[val].setChecked(True)
+        except (KeyError, TypeError):
+            log.error("Value given is not part of this RadioSet: %s", val)
 
 
-class LengthEntry(QLineEdit):
+class LengthEntry(EditSizeHint, QLineEdit):
+
+    # Value with an optional "in" or "mm" unit suffix.
+    format_re = re.compile(r"^\s*(?P<expr>.*?)\s*(?P<unit>in|mm)?\s*$", re.IGNORECASE)
+
+    # Unit conversion table OUTPUT-INPUT
+    scales = {
+        'IN': {'IN': 1.0,
+               'MM': 1/25.4},
+        'MM': {'IN': 25.4,
+               'MM': 1.0}
+    }
+
     def __init__(self, output_units='IN', parent=None):
         super().__init__(parent)
 
         self.output_units = output_units
-        self.format_re = re.compile(r"^([^\s]+)(?:\s([a-zA-Z]+))?$")
-
-        # Unit conversion table OUTPUT-INPUT
-        self.scales = {
-            'IN': {'IN': 1.0,
-                   'MM': 1/25.4},
-            'MM': {'IN': 25.4,
-                   'MM': 1.0}
-        }
+        self.scale_table = self.scales[output_units]
 
     def returnPressed(self, *args, **kwargs):
         val = self.get_value()
         if val is not None:
             self.set_text(str(val))
         else:
-            log.warning("Could not interpret entry: %s" % self.get_text())
+            log.warning("Could not interpret entry: %s", self.get_text())
 
     def get_value(self):
-        raw = str(self.text()).strip(' ')
-        # match = self.format_re.search(raw)
+        raw = self.text().strip()
+        match = self.format_re.match(raw)
+        unit = match.group('unit')
+        scale = self.scale_table[unit.upper()] if unit else 1.0
 
         try:
-            units = raw[-2:]
-            units = self.scales[self.output_units][units.upper()]
-            value = raw[:-2]
-            return float(eval(value))*units
-        except IndexError:
-            value = raw
-            return float(eval(value))
-        except KeyError:
-            value = raw
-            return float(eval(value))
-        except:
-            log.warning("Could not parse value in entry: %s" % str(raw))
+            return float(_safe_eval(match.group('expr')))*scale
+        except Exception:
+            log.warning("Could not parse value in entry: %s", raw)
             return None
 
     def set_value(self, val):
         self.setText(str(val))
 
-    def sizeHint(self):
-        default_hint_size = super().sizeHint()
-        return QtCore.QSize(EDIT_SIZE_HINT, default_hint_size.height())
-
 
-class FloatEntry(QLineEdit):
+class FloatEntry(EditSizeHint, QLineEdit):
     def __init__(self, parent=None):
         super().__init__(parent)
 
@@ -136,14 +254,14 @@ class FloatEntry(QLineEdit):
         if val is not None:
             self.set_text(str(val))
         else:
-            log.warning("Could not interpret entry: %s" % self.text())
+            log.warning("Could not interpret entry: %s", self.text())
 
     def get_value(self):
-        raw = str(self.text()).strip(' ')
+        raw = self.text().strip()
         try:
-            evaled = eval(raw)
-        except:
-            log.error("Could not evaluate: %s" % str(raw))
+            evaled = _safe_eval(raw)
+        except Exception:
+            log.error("Could not evaluate: %s", raw)
             return None
 
         return float(evaled)
@@ -151,12 +269,8 @@ class FloatEntry(QLineEdit):
     def set_value(self, val):
         self.setText("%.6f" % val)
 
-    def sizeHint(self):
-        default_hint_size = super().sizeHint()
-        return QSize(EDIT_SIZE_HINT, default_hint_size.height())
-
 
-class IntEntry(QLineEdit):
+class IntEntry(EditSizeHint, QLineEdit):
 
     def __init__(self, parent=None, allow_empty=False, empty_val=None):
         super().__init__(parent)
@@ -166,7 +280,7 @@ class IntEntry(QLineEdit):
     def get_value(self):
 
         if self.allow_empty:
-            if str(self.text()) == "":
+            if self.text() == "":
                 return self.empty_val
 
         return int(self.text())
@@ -179,27 +293,19 @@ class IntEntry(QLineEdit):
 
         self.setText(str(val))
 
-    def sizeHint(self):
-        default_hint_size = super().sizeHint()
-        return QSize(EDIT_SIZE_HINT, default_hint_size.height())
-
 
-class FCEntry(QLineEdit):
+class FCEntry(EditSizeHint, QLineEdit):
     def __init__(self, parent=None):
         super(FCEntry, self).__init__(parent)
 
     def get_value(self):
-        return str(self.text())
+        return self.text()
 
     def set_value(self, val):
         self.setText(str(val))
 
-    def sizeHint(self):
-        default_hint_size = super().sizeHint()
-        return QSize(EDIT_SIZE_HINT, default_hint_size.height())
-
 
-class EvalEntry(QLineEdit):
+class EvalEntry(EditSizeHint, QLineEdit):
     def __init__(self, parent=None):
         super().__init__(parent)
 
@@ -208,23 +314,19 @@ class EvalEntry(QLineEdit):
         if val is not None:
             self.setText(str(val))
         else:
-            log.warning("Could not interpret entry: %s" % self.get_text())
+            log.warning("Could not interpret entry: %s", self.get_text())
 
     def get_value(self):
-        raw = str(self.text()).strip(' ')
+        raw = self.text().strip()
         try:
-            return eval(raw)
-        except:
-            log.error("Could not evaluate: %s" % str(raw))
+            return _safe_eval(raw)
+        except Exception:
+            log.error("Could not evaluate: %s", raw)
             return None
 
     def set_value(self, val):
         self.setText(str(val))
 
-    def sizeHint(self):
-        default_hint_size = super().sizeHint()
-        return QSize(EDIT_SIZE_HINT, default_hint_size.height())
-
 
 class FCCheckBox(QCheckBox):
     def __init__(self, label='', parent=None):
@@ -240,19 +342,18 @@ class FCCheckBox(QCheckBox):
         self.set_value(not self.get_value())
 
 
-class FCTextArea(QPlainTextEdit):
+class FCTextArea(EditSizeHint, QPlainTextEdit):
     def __init__(self, parent=None):
         super().__init__(parent)
+        # G-code is line oriented, skip rewrapping and bound the layout work.
+        self.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)
+        self.setMaximumBlockCount(TEXT_AREA_MAX_BLOCKS)
 
     def set_value(self, val):
         self.setPlainText(val)
 
     def get_value(self):
-        return str(self.toPlainText())
-
-    def sizeHint(self):
-        default_hint_size = super().sizeHint()
-        return QSize(EDIT_SIZE_HINT, default_hint_size.height())
+        return self.toPlainText()
 
 
 class VerticalScrollArea(QScrollArea):
@@ -266,6 +367,25 @@ class VerticalScrollArea(QScrollArea):
         self.setWidgetResizable(True)
         self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         self.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
+        self._last_min_w = -1
+
+    def replace_widget(self, widget):
+        """
+        Shows ``widget`` in the scroll area in place of the current one.
+        The previous widget is taken out, not deleted, so it can be
+        shown again later. Updates are suspended during the swap so the
+        area is laid out and painted once rather than for each step.
+
+        :param widget: The widget to show.
+        :return: The widget that was replaced, or None.
+        """
+        self.setUpdatesEnabled(False)
+        try:
+            old = self.takeWidget()
+            self.setWidget(widget)
+        finally:
+            self.setUpdatesEnabled(True)
+        return old
 
     def eventFilter(self, source, event):
         """
@@ -281,8 +401,11 @@ class VerticalScrollArea(QScrollArea):
             # log.debug(" minimumSizeHint().width() = %d" % self.widget().minimumSizeHint().width())
             # log.debug(" verticalScrollBar().width() = %d" % self.verticalScrollBar().width())
 
-            self.setMinimumWidth(self.widget().sizeHint().width() +
-                                 self.verticalScrollBar().sizeHint().width())
+            # setMinimumWidth() relayouts even when the width is unchanged.
+            new_w = self.widget().sizeHint().width() + self.verticalScrollBar().sizeHint().width()
+            if new_w != self._last_min_w:
+                self.setMinimumWidth(new_w)
+                self._last_min_w = new_w
 
             # if self.verticalScrollBar().isVisible():
             #     log.debug(" Scroll bar visible")
@@ -309,27 +432,117 @@ class OptionalInputSection:
 
         self.cb = cb
         self.optinputs = optinputs
+        self._state = None
 
         self.on_cb_change()
         self.cb.stateChanged.connect(self.on_cb_change)
 
     def on_cb_change(self):
+        state = self.cb.isChecked()
+        if state == self._state:
+            return
+        self._state = state
 
-        if self.cb.checkState():
+        for widget in self.optinputs:
+            widget.setEnabled(state)
 
-            for widget in self.optinputs:
-                widget.setEnabled(True)
 
-        else:
+class FCTableModel(QAbstractTableModel):
+    """
+    Read-only table model over a list of rows. Values are shown
+    as text but kept as given, so numeric columns sort numerically.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._headers = []
+        self._rows = []
+        self._selectable = None
+
+    def set_data(self, headers, rows, selectable_columns=None):
+        """
+        Replaces the contents of the model.
+
+        :param headers: Column titles.
+        :param rows: List of rows, each a list of values.
+        :param selectable_columns: Columns whose cells can be selected.
+            All columns if None.
+        :return: None
+        """
+        self.beginResetModel()
+        self._headers = list(headers)
+        self._rows = [list(row) for row in rows]
+        self._selectable = None if selectable_columns is None else set(selectable_columns)
+        self.endResetModel()
+
+    def value(self, row, column):
+        return self._rows[row][column]
+
+    def set_cell(self, row, column, value):
+        self._rows[row][column] = value
+        index = self.index(row, column)
+        self.dataChanged.emit(index, index)
 
-            for widget in self.optinputs:
-                widget.setEnabled(False)
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._headers)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and index.isValid():
+            return str(self._rows[index.row()][index.column()])
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self._headers[section]
+        return None
+
+    def flags(self, index):
+        if self._selectable is None or index.column() in self._selectable:
+            return Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEnabled
+        return Qt.ItemFlag.ItemIsEnabled
+
+    def sort(self, column, order=Qt.SortOrder.AscendingOrder):
+        if not 0 <= column < len(self._headers):
+            return
 
+        self.layoutAboutToBeChanged.emit()
+        order_idx = sorted(range(len(self._rows)), key=lambda r: self._rows[r][column],
+                           reverse=order == Qt.SortOrder.DescendingOrder)
+        self._rows = [self._rows[r] for r in order_idx]
 
-class FCTable(QTableWidget):
+        # Keep the selection on the same rows
+        new_row = {old: new for new, old in enumerate(order_idx)}
+        old_indexes = self.persistentIndexList()
+        self.changePersistentIndexList(old_indexes, [self.index(new_row[i.row()], i.column())
+                                                     for i in old_indexes])
+        self.layoutChanged.emit()
+
+
+class FCTable(EditSizeHint, QTableView):
     def __init__(self, parent=None):
         super().__init__(parent)
+        self.setModel(FCTableModel(self))
 
-    def sizeHint(self):
-        default_hint_size = super().sizeHint()
-        return QSize(EDIT_SIZE_HINT, default_hint_size.height())
+    def set_data(self, headers, rows, selectable_columns=None):
+        """
+        Replaces the table contents. See FCTableModel.set_data().
+        """
+        self.model().set_data(headers, rows, selectable_columns)
+
+    def set_cell(self, row, column, value):
+        self.model().set_cell(row, column, value)
+
+    def selected_values(self, column=0):
+        """
+        Values of the selected cells in the given column.
+
+        :param column: Column to read.
+        :return: List of values, in row order.
+        """
+        model = self.model()
+        rows = sorted(index.row() for index in self.selectionModel().selectedIndexes()
+                      if index.column() == column)
+        return [model.value(row, column) for row in rows]
@@ -1,5 +1,6 @@
-import inspect  # TODO: Remove
+import logging
 import re
+import sys
 
 from PyQt6.QtCore import Qt, QVariant, QModelIndex, pyqtSignal, QAbstractItemModel, QItemSelectionModel
 from PyQt6.QtGui import QPixmap, QBrush
@@ -319,7 +320,8 @@ class ObjectCollection(QAbstractItemModel):
             print (obj)
 
     def append(self, obj, active=False):
-        FlatCAMApp.App.log.debug(str(inspect.stack()[1][3]) + " --> OC.append()")
+        if FlatCAMApp.App.log.isEnabledFor(logging.DEBUG):
+            FlatCAMApp.App.log.debug("%s --> OC.append()", sys._getframe(1).f_code.co_name)
 
         name = obj.options["name"]
 
@@ -368,7 +370,8 @@ class ObjectCollection(QAbstractItemModel):
         :rtype: list
         """
 
-        FlatCAMApp.App.log.debug(str(inspect.stack()[1][3]) + " --> OC.get_names()")
+        if FlatCAMApp.App.log.isEnabledFor(logging.DEBUG):
+            FlatCAMApp.App.log.debug("%s --> OC.get_names()", sys._getframe(1).f_code.co_name)
         return [x.options['name'] for x in self.get_list()]
 
     def get_bounds(self):
@@ -378,7 +381,8 @@ class ObjectCollection(QAbstractItemModel):
         :return: [xmin, ymin, xmax, ymax]
         :rtype: list
         """
-        FlatCAMApp.App.log.debug(str(inspect.stack()[1][3]) + "--> OC.get_bounds()")
+        if FlatCAMApp.App.log.isEnabledFor(logging.DEBUG):
+            FlatCAMApp.App.log.debug("%s--> OC.get_bounds()", sys._getframe(1).f_code.co_name)
 
         # TODO: Move the operation out of here.
 
@@ -409,7 +413,8 @@ class ObjectCollection(QAbstractItemModel):
         :return: The requested object or None if no such object.
         :rtype: FlatCAMObj or None
         """
-        FlatCAMApp.App.log.debug(str(inspect.stack()[1][3]) + "--> OC.get_by_name()")
+        if FlatCAMApp.App.log.isEnabledFor(logging.DEBUG):
+            FlatCAMApp.App.log.debug("%s--> OC.get_by_name()", sys._getframe(1).f_code.co_name)
 
         for obj in self.get_list():
             if obj.options['name'] == name:
@@ -540,7 +545,8 @@ class ObjectCollection(QAbstractItemModel):
         index.internalPointer().obj.build_ui()
 
     def delete_all(self):
-        FlatCAMApp.App.log.debug(str(inspect.stack()[1][3]) + "--> OC.delete_all()")
+        if FlatCAMApp.App.log.isEnabledFor(logging.DEBUG):
+            FlatCAMApp.App.log.debug("%s--> OC.delete_all()", sys._getframe(1).f_code.co_name)
 
         self.beginResetModel()
 
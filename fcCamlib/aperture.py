@@ -7,12 +7,15 @@
 ############################################################
 
 
+import math
+import operator
 import re
+from collections import OrderedDict
+from functools import lru_cache
 
-from numpy import cos, pi, sin
-from shapely import affinity
-from shapely.geometry import LineString, Point, Polygon
-from shapely.geometry import box as shply_box
+import numpy as np
+import shapely
+from shapely.geometry import LineString, MultiPolygon, Point, Polygon
 from shapely.ops import unary_union
 
 from .utils import setup_log
@@ -20,6 +23,192 @@ from .utils import setup_log
 
 log = setup_log("fcCamlib.aprture")
 
+# Default segments per quarter circle for the round shapes of
+# aperture macros, see ApertureMacro.circle_quad_segs.
+AM_CIRCLE_RESOLUTION = 8
+
+# Binary operators of macro expressions and their precedence.
+# Gerber uses x (or X) for multiplication.
+_AM_BINARY = {'+': (operator.add, 1), '-': (operator.sub, 1),
+              'x': (operator.mul, 2), 'X': (operator.mul, 2), '/': (operator.truediv, 2)}
+_AM_UNARY = {'+': operator.pos, '-': operator.neg}
+_AM_UNARY_FUNCTIONS = frozenset(_AM_UNARY.values())
+
+# A plain number, and the tokens of an expression: numbers,
+# variables, operators and parentheses.
+_am_number_re = re.compile(r'\s*[-+]?(\d+\.?\d*|\.\d+)\s*', re.ASCII)
+_am_expr_token_re = re.compile(r'\s*(?:(\d+\.?\d*|\.\d+)|\$([0-9a-wyzA-WYZ]+)|([-+xX/()]))', re.ASCII)
+
+
+def _compile_am_expr(text):
+    """
+    Converts an aperture macro arithmetic expression into reverse
+    polish notation with the shunting-yard algorithm. Items of the
+    result are numbers (float), variable names (str) and operator
+    functions, which take one argument if in ``_AM_UNARY``.
+
+    :param text: Expression, like ``$1x0.5+0.1``.
+    :return: List of items, see ``_am_expr_function()``.
+    :raises ValueError: If the text is not an arithmetic expression.
+    """
+    output = []
+    ops = []  # Pending operators and "(" as (function, precedence)
+    operand_expected = True
+    pos = 0
+    text = text.rstrip()
+
+    while pos < len(text):
+        match = _am_expr_token_re.match(text, pos)
+        if match is None:
+            raise ValueError("Invalid aperture macro expression: %s" % text)
+        pos = match.end()
+        number, name, symbol = match.groups()
+
+        if number is not None or name is not None:
+            if not operand_expected:
+                raise ValueError("Missing operator in aperture macro expression: %s" % text)
+            output.append(float(number) if name is None else name)
+            operand_expected = False
+        elif symbol == '(':
+            if not operand_expected:
+                raise ValueError("Missing operator in aperture macro expression: %s" % text)
+            ops.append(None)
+        elif symbol == ')':
+            while ops and ops[-1] is not None:
+                output.append(ops.pop()[0])
+            if operand_expected or not ops:
+                raise ValueError("Unbalanced parenthesis in aperture macro expression: %s" % text)
+            ops.pop()
+        elif operand_expected:
+            if symbol not in _AM_UNARY:
+                raise ValueError("Missing operand in aperture macro expression: %s" % text)
+            # Binds tighter than any binary operator
+            ops.append((_AM_UNARY[symbol], 3))
+        else:
+            function, precedence = _AM_BINARY[symbol]
+            while ops and ops[-1] is not None and ops[-1][1] >= precedence:
+                output.append(ops.pop()[0])
+            ops.append((function, precedence))
+            operand_expected = True
+
+    if operand_expected:
+        raise ValueError("Missing operand in aperture macro expression: %s" % text)
+    while ops:
+        if ops[-1] is None:
+            raise ValueError("Unbalanced parenthesis in aperture macro expression: %s" % text)
+        output.append(ops.pop()[0])
+    return output
+
+
+def _am_expr_function(rpn):
+    """
+    Turns an expression compiled by ``_compile_am_expr()`` into
+    nested closures, so that evaluating it needs no stack or type
+    checks. Parts without variables are computed right away.
+
+    :param rpn: Compiled expression.
+    :return: The value if the expression has no variables, otherwise
+        a function taking the variables by name (undefined ones are 0)
+        and returning the value.
+    :rtype: float or function
+    """
+    stack = []
+    for item in rpn:
+        if item.__class__ is float:
+            stack.append(item)
+        elif item.__class__ is str:
+            stack.append(lambda v, name=item: v.get(name, 0.0))
+        elif item in _AM_UNARY_FUNCTIONS:
+            a = stack.pop()
+            if a.__class__ is float:
+                stack.append(item(a))
+            else:
+                stack.append(lambda v, f=item, a=a: f(a(v)))
+        else:
+            b = stack.pop()
+            a = stack.pop()
+            if a.__class__ is float and b.__class__ is float:
+                stack.append(item(a, b))
+            elif a.__class__ is float:
+                stack.append(lambda v, f=item, a=a, b=b: f(a, b(v)))
+            elif b.__class__ is float:
+                stack.append(lambda v, f=item, a=a, b=b: f(a(v), b))
+            else:
+                stack.append(lambda v, f=item, a=a, b=b: f(a(v), b(v)))
+    return stack[0]
+
+
+def _compile_am_modifier(text):
+    """
+    Compiles a modifier or variable definition of an aperture macro.
+    Plain numbers, by far the most common, skip the tokenizer.
+
+    :param text: Expression, like ``$1x0.5+0.1``.
+    :return: See ``_am_expr_function()``.
+    :raises ValueError: If the text is not an arithmetic expression.
+    """
+    if _am_number_re.fullmatch(text):
+        return float(text)
+    return _am_expr_function(_compile_am_expr(text))
+
+
+@lru_cache(maxsize=64)
+def _rotation_matrix(angle):
+    """
+    Matrix (a, b, d, e) with x' = a*x + b*y, y' = d*x + e*y rotating
+    by ``angle`` degrees counterclockwise around the origin.
+    """
+    c = math.cos(math.radians(angle))
+    s = math.sin(math.radians(angle))
+    return c, -s, s, c
+
+
+def _rotated(points, angle):
+    """
+    Rotates an (N, 2) array of vertices by ``angle`` degrees
+    around the origin.
+    """
+    if angle == 0:
+        return points
+    a, b, d, e = _rotation_matrix(angle)
+    return points @ np.array([[a, d], [b, e]])
+
+
+def _polygons(arrays):
+    """
+    Builds the polygons for a list of (N, 2) vertex arrays with
+    one call into Shapely.
+    """
+    coords = np.concatenate(arrays)
+    indices = np.repeat(np.arange(len(arrays)), [len(points) for points in arrays])
+    return list(shapely.polygons(shapely.linearrings(coords, indices=indices)))
+
+
+def _bounds_disjoint(geometries):
+    """
+    True if no two bounding boxes in ``geometries`` overlap or touch.
+    Sweeps the boxes sorted by their left edge.
+    """
+    active = []
+    for minx, miny, maxx, maxy in sorted(g.bounds for g in geometries):
+        active = [b for b in active if b[2] >= minx]
+        for bminx, bminy, bmaxx, bmaxy in active:
+            if bminy <= maxy and miny <= bmaxy:
+                return False
+        active.append((minx, miny, maxx, maxy))
+    return True
+
+
+def _polygonal(geometries):
+    """
+    The polygons and multipolygons in ``geometries``, also those in
+    collections. Lines and points, e.g. what make_valid() leaves of
+    a primitive of zero width, are dropped.
+    """
+    parts = shapely.get_parts(geometries)
+    types = shapely.get_type_id(parts)
+    return parts[(types == shapely.GeometryType.POLYGON) | (types == shapely.GeometryType.MULTIPOLYGON)]
+
 
 class ApertureMacro:
     """
@@ -34,11 +223,18 @@ class ApertureMacro:
     """
 
     ## Regular expressions
-    am1_re = re.compile(r'^%AM([^\*]+)\*(.+)?(%)?$')
-    am2_re = re.compile(r'(.*)%$')
-    amcomm_re = re.compile(r'^0(.*)')
-    amprim_re = re.compile(r'^[1-9].*')
-    amvar_re = re.compile(r'^\$([0-9a-zA-z]+)=(.*)')
+    am1_re = re.compile(r'^%AM([^\*]+)\*(.+)?(%)?$', re.ASCII)
+    am2_re = re.compile(r'(.*)%$', re.ASCII)
+    amcomm_re = re.compile(r'^0(.*)', re.ASCII)
+    amprim_re = re.compile(r'^[1-9].*', re.ASCII)
+    amvar_re = re.compile(r'^\$([0-9a-zA-Z]+)=(.*)', re.ASCII)
+
+    # Segments per quarter circle of circles, moire rings and thermals.
+    # Set it before making geometry, cached geometries are not redone.
+    circle_quad_segs = AM_CIRCLE_RESOLUTION
+
+    # Number of geometries kept per macro by make_geometry()
+    geometry_cache_size = 1024
 
     def __init__(self, name=None):
         self.name = name
@@ -50,6 +246,18 @@ class ApertureMacro:
         self.locvars = {}
         self.geometry = None
 
+        # Compiled parts of self.raw, see compile_content()
+        self._compiled_parts = None
+        self._compiled_raw = None
+
+        # Macros without variables evaluate to the same primitives
+        # every time, these are kept in self._static_primitives.
+        self._has_vars = None
+        self._static_primitives = None
+
+        # Geometries made by make_geometry(), keyed by modifiers (LRU)
+        self._geo_cache = OrderedDict()
+
     def to_dict(self):
         """
         Returns the object in a serializable form. Only the name and
@@ -75,24 +283,19 @@ class ApertureMacro:
         for attr in ['name', 'raw']:
             setattr(self, attr, d[attr])
 
-    def parse_content(self):
+    def compile_content(self):
         """
-        Creates numerical lists for all primitives in the aperture
-        macro (in ``self.raw``) by replacing all variables by their
-        values iteratively and evaluating expressions. Results
-        are stored in ``self.primitives``.
+        Compiles the parts of ``self.raw`` into numbers and functions
+        of the variables (see ``_compile_am_modifier()``), stored in
+        ``self._compiled_parts`` as ``(name, expression)`` for variable
+        definitions and ``(None, [expression, ...])`` for primitives.
 
         :return: None
         """
-        # Cleanup
-        self.raw = self.raw.replace('\n', '').replace('\r', '').strip(" *")
-        self.primitives = []
-
-        # Separate parts
-        parts = self.raw.split('*')
+        parts = []
 
         #### Every part in the macro ####
-        for part in parts:
+        for part in self.raw.split('*'):
             ### Comments. Ignored.
             match = ApertureMacro.amcomm_re.search(part)
             if match:
@@ -102,49 +305,60 @@ class ApertureMacro:
             # These are variables defined locally inside the macro. They can be
             # numerical constant or defind in terms of previously define
             # variables, which can be defined locally or in an aperture
-            # definition. All replacements ocurr here.
+            # definition.
             match = ApertureMacro.amvar_re.search(part)
             if match:
-                var = match.group(1)
-                val = match.group(2)
-
-                # Replace variables in value
-                for v in self.locvars:
-                    val = re.sub(r'\$'+str(v)+r'(?![0-9a-zA-Z])', str(self.locvars[v]), val)
-
-                # Make all others 0
-                val = re.sub(r'\$[0-9a-zA-Z](?![0-9a-zA-Z])', "0", val)
-
-                # Change x with *
-                val = re.sub(r'[xX]', "*", val)
-
-                # Eval() and store.
-                self.locvars[var] = eval(val)
+                parts.append((match.group(1), _compile_am_modifier(match.group(2))))
                 continue
 
             ### Primitives
             # Each is an array. The first identifies the primitive, while the
-            # rest depend on the primitive. All are strings representing a
-            # number and may contain variable definition. The values of these
-            # variables are defined in an aperture definition.
+            # rest depend on the primitive. All are expressions which may
+            # contain variables defined in an aperture definition.
             match = ApertureMacro.amprim_re.search(part)
             if match:
-                ## Replace all variables
-                for v in self.locvars:
-                    part = re.sub(r'\$' + str(v) + r'(?![0-9a-zA-Z])', str(self.locvars[v]), part)
+                parts.append((None, [_compile_am_modifier(x) for x in part.split(',')]))
+                continue
 
-                # Make all others 0
-                part = re.sub(r'\$[0-9a-zA-Z](?![0-9a-zA-Z])', "0", part)
+            log.warning("Unknown syntax of aperture macro part: %s" % str(part))
 
-                # Change x with *
-                part = re.sub(r'[xX]', "*", part)
+        self._compiled_parts = parts
+        self._compiled_raw = self.raw
+        self._has_vars = '$' in self.raw
+        self._static_primitives = None
+        self._geo_cache.clear()
 
-                ## Store
-                elements = part.split(",")
-                self.primitives.append([eval(x) for x in elements])
-                continue
+    def parse_content(self):
+        """
+        Creates numerical lists for all primitives in the aperture
+        macro (in ``self.raw``) by evaluating its variables and
+        expressions in order. Results are stored in ``self.primitives``.
+        The macro is compiled on first use and again only if
+        ``self.raw`` changes.
 
-            log.warning("Unknown syntax of aperture macro part: %s" % str(part))
+        :return: None
+        """
+        # Cleanup
+        self.raw = self.raw.replace('\n', '').replace('\r', '').strip(" *")
+        self.primitives = []
+
+        if self._compiled_raw != self.raw:
+            self.compile_content()
+
+        if not self._has_vars and self._static_primitives is not None:
+            self.primitives = self._static_primitives
+            return
+
+        # Constants were computed when compiling, only expressions
+        # with variables are left as functions.
+        for var, expr in self._compiled_parts:
+            if var is not None:
+                self.locvars[var] = expr if expr.__class__ is float else expr(self.locvars)
+            else:
+                self.primitives.append([x if x.__class__ is float else x(self.locvars) for x in expr])
+
+        if not self._has_vars:
+            self._static_primitives = self.primitives
 
     def append(self, data):
         """
@@ -166,13 +380,15 @@ class ApertureMacro:
         :type n: int
         :param mods: List to be padded.
         :type mods: list
-        :return: Zero-padded list.
+        :return: Zero-padded list, ``mods`` itself if not shorter than n.
         :rtype: list
         """
-        x = [0.0] * n
-        na = len(mods)
-        x[0:na] = mods
-        return x
+        # Primitives usually give all their modifiers, so the list
+        # is only copied and padded when some are missing.
+        missing = n - len(mods)
+        if missing <= 0:
+            return mods
+        return list(mods) + [0.0] * missing
 
     @staticmethod
     def make_circle(mods):
@@ -184,100 +400,111 @@ class ApertureMacro:
 
         pol, dia, x, y = ApertureMacro.default2zero(4, mods)
 
-        return {"pol": int(pol), "geometry": Point(x, y).buffer(dia/2)}
+        return {"pol": int(pol), "geometry": Point(x, y).buffer(dia/2, quad_segs=ApertureMacro.circle_quad_segs)}
 
     @staticmethod
-    def make_vectorline(mods):
+    def vectorline_vertices(mods):
         """
 
         :param mods: (Exposure 0/1, Line width >= 0, X-start, Y-start, X-end, Y-end,
             rotation angle around origin in degrees)
-        :return:
+        :return: Polarity and (4, 2) array of rotated corners, None for a zero length line.
         """
         pol, width, xs, ys, xe, ye, angle = ApertureMacro.default2zero(7, mods)
 
-        line = LineString([(xs, ys), (xe, ye)])
-        box = line.buffer(width/2, cap_style=2)
-        box_rotated = affinity.rotate(box, angle, origin=(0, 0))
+        # Corners of the line, offset by width/2 on each side
+        length = np.hypot(xe - xs, ye - ys)
+        if length == 0:
+            return int(pol), None
+        nx, ny = (ys - ye) * width / (2 * length), (xe - xs) * width / (2 * length)
 
-        return {"pol": int(pol), "geometry": box_rotated}
+        return int(pol), _rotated(np.array([(xs + nx, ys + ny), (xe + nx, ye + ny),
+                                            (xe - nx, ye - ny), (xs - nx, ys - ny)]), angle)
 
     @staticmethod
-    def make_centerline(mods):
+    def centerline_vertices(mods):
         """
 
         :param mods: (Exposure 0/1, width >=0, height >=0, x-center, y-center,
             rotation angle around origin in degrees)
-        :return:
+        :return: Polarity and (4, 2) array of rotated corners.
         """
 
         pol, width, height, x, y, angle = ApertureMacro.default2zero(6, mods)
 
-        box = shply_box(x-width/2, y-height/2, x+width/2, y+height/2)
-        box_rotated = affinity.rotate(box, angle, origin=(0, 0))
-
-        return {"pol": int(pol), "geometry": box_rotated}
+        return int(pol), _rotated(np.array([(x - width/2, y - height/2), (x + width/2, y - height/2),
+                                            (x + width/2, y + height/2), (x - width/2, y + height/2)]), angle)
 
     @staticmethod
-    def make_lowerleftline(mods):
+    def lowerleftline_vertices(mods):
         """
 
         :param mods: (exposure 0/1, width >=0, height >=0, x-lowerleft, y-lowerleft,
             rotation angle around origin in degrees)
-        :return:
+        :return: Polarity and (4, 2) array of rotated corners.
         """
 
         pol, width, height, x, y, angle = ApertureMacro.default2zero(6, mods)
 
-        box = shply_box(x, y, x+width, y+height)
-        box_rotated = affinity.rotate(box, angle, origin=(0, 0))
-
-        return {"pol": int(pol), "geometry": box_rotated}
+        return int(pol), _rotated(np.array([(x, y), (x + width, y),
+                                            (x + width, y + height), (x, y + height)]), angle)
 
     @staticmethod
-    def make_outline(mods):
+    def outline_vertices(mods):
         """
 
-        :param mods:
-        :return:
+        :param mods: (exposure 0/1, n points, x0, y0, ... xn, yn, rotation angle)
+        :return: Polarity and (n + 1, 2) array of rotated vertices.
         """
 
         pol = mods[0]
-        n = mods[1]
-        points = [(0, 0)]*(n+1)
-
-        for i in range(n+1):
-            points[i] = mods[2*i + 2:2*i + 4]
-
+        n = int(mods[1])
+        points = np.asarray(mods[2:2*n + 4], dtype=float).reshape((n + 1, 2))
         angle = mods[2*n + 4]
 
-        poly = Polygon(points)
-        poly_rotated = affinity.rotate(poly, angle, origin=(0, 0))
-
-        return {"pol": int(pol), "geometry": poly_rotated}
+        return int(pol), _rotated(points, angle)
 
     @staticmethod
-    def make_polygon(mods):
+    def polygon_vertices(mods):
         """
         Note: Specs indicate that rotation is only allowed if the center
         (x, y) == (0, 0). I will tolerate breaking this rule.
 
         :param mods: (exposure 0/1, n_verts 3<=n<=12, x-center, y-center,
             diameter of circumscribed circle >=0, rotation angle around origin)
-        :return:
+        :return: Polarity and (n_verts, 2) array of rotated vertices.
         """
 
         pol, nverts, x, y, dia, angle = ApertureMacro.default2zero(6, mods)
-        points = [(0, 0)]*nverts
+        nverts = int(nverts)
 
-        for i in range(nverts):
-            points[i] = (x + 0.5 * dia * cos(2*pi * i/nverts),
-                         y + 0.5 * dia * sin(2*pi * i/nverts))
+        ang = (2 * np.pi / nverts) * np.arange(nverts)
+        return int(pol), _rotated(np.column_stack((x + 0.5 * dia * np.cos(ang),
+                                                   y + 0.5 * dia * np.sin(ang))), angle)
 
-        poly = Polygon(points)
-        poly_rotated = affinity.rotate(poly, angle, origin=(0, 0))
+    @staticmethod
+    def _vertices_primitive(pol, points):
+        return {"pol": pol, "geometry": Polygon() if points is None else Polygon(points)}
 
-        return {"pol": int(pol), "geometry": poly_rotated}
+    @staticmethod
+    def make_vectorline(mods):
+        return ApertureMacro._vertices_primitive(*ApertureMacro.vectorline_vertices(mods))
+
+    @staticmethod
+    def make_centerline(mods):
+        return ApertureMacro._vertices_primitive(*ApertureMacro.centerline_vertices(mods))
+
+    @staticmethod
+    def make_lowerleftline(mods):
+        return ApertureMacro._vertices_primitive(*ApertureMacro.lowerleftline_vertices(mods))
+
+    @staticmethod
+    def make_outline(mods):
+        return ApertureMacro._vertices_primitive(*ApertureMacro.outline_vertices(mods))
+
+    @staticmethod
+    def make_polygon(mods):
+        return ApertureMacro._vertices_primitive(*ApertureMacro.polygon_vertices(mods))
 
     @staticmethod
     def make_moire(mods):
@@ -293,26 +520,23 @@ class ApertureMacro:
 
         x, y, dia, thickness, gap, nrings, cross_th, cross_len, angle = ApertureMacro.default2zero(9, mods)
 
+        quad_segs = ApertureMacro.circle_quad_segs
         r = dia/2 - thickness/2
-        result = Point((x, y)).buffer(r).exterior.buffer(thickness/2.0)
-        ring = Point((x, y)).buffer(r).exterior.buffer(thickness/2.0)  # Need a copy!
-
-        i = 1  # Number of rings created so far
+        rings = [Point((x, y)).buffer(r, quad_segs=quad_segs).exterior.buffer(thickness/2.0, quad_segs=quad_segs)]
 
         ## If the ring does not have an interior it means that it is
         ## a disk. Then stop.
-        while len(ring.interiors) > 0 and i < nrings:
+        while len(rings[-1].interiors) > 0 and len(rings) < nrings:
             r -= thickness + gap
             if r <= 0:
                 break
-            ring = Point((x, y)).buffer(r).exterior.buffer(thickness/2.0)
-            result = unary_union([result, ring])
-            i += 1
+            rings.append(Point((x, y)).buffer(r, quad_segs=quad_segs).exterior.buffer(thickness/2.0,
+                                                                                      quad_segs=quad_segs))
 
         ## Crosshair
         hor = LineString([(x - cross_len, y), (x + cross_len, y)]).buffer(cross_th/2.0, cap_style=2)
         ver = LineString([(x, y-cross_len), (x, y + cross_len)]).buffer(cross_th/2.0, cap_style=2)
-        result = unary_union([result, hor, ver])
+        result = unary_union(rings + [hor, ver])
 
         return {"pol": 1, "geometry": result}
 
@@ -329,13 +553,51 @@ class ApertureMacro:
 
         x, y, dout, din, t, angle = ApertureMacro.default2zero(6, mods)
 
-        ring = Point((x, y)).buffer(dout/2.0).difference(Point((x, y)).buffer(din/2.0))
+        quad_segs = ApertureMacro.circle_quad_segs
+        center = Point((x, y))
+        ring = center.buffer(dout/2.0, quad_segs=quad_segs).difference(center.buffer(din/2.0, quad_segs=quad_segs))
         hline = LineString([(x - dout/2.0, y), (x + dout/2.0, y)]).buffer(t/2.0, cap_style=3)
         vline = LineString([(x, y - dout/2.0), (x, y + dout/2.0)]).buffer(t/2.0, cap_style=3)
-        thermal = ring.difference(hline.union(vline))
+        thermal = ring.difference(unary_union([hline, vline]))
 
         return {"pol": 1, "geometry": thermal}
 
+    def _apply_run(self, geometries, pol):
+        """
+        Adds (pol == 1) or removes (pol == 0) the union of
+        ``geometries`` to/from ``self.geometry``. Items may also be
+        (N, 2) vertex arrays of polygons.
+        """
+        if not geometries:
+            return
+
+        # Vertex arrays of polygon primitives are turned into
+        # polygons all at once.
+        arrays = [g for g in geometries if isinstance(g, np.ndarray)]
+        if arrays:
+            geometries = [g for g in geometries if not isinstance(g, np.ndarray)] + _polygons(arrays)
+
+        if pol == 1:
+            parts = geometries if self.geometry is None else [self.geometry] + geometries
+            valid = shapely.is_valid(parts).all()
+            # Empty parts, e.g. everything cleared by a previous run or
+            # a circle of diameter 0, add nothing and have NaN bounds.
+            # If all parts are empty, one of them is kept as the result.
+            solid = [g for g, empty in zip(parts, shapely.is_empty(parts)) if not empty] or parts[:1]
+            # Valid polygons far apart from each other need no union.
+            if valid and all(type(g) is Polygon for g in solid) and _bounds_disjoint(solid):
+                self.geometry = solid[0] if len(solid) == 1 else MultiPolygon(solid)
+            else:
+                # Invalid parts, e.g. self-intersecting outlines, are
+                # repaired first as unary_union() may fail on them.
+                # Primitives of zero width or height only repair to
+                # lines or points, which add no area.
+                if not valid:
+                    parts = _polygonal(shapely.make_valid(parts))
+                self.geometry = unary_union(parts) if len(parts) else Polygon()
+        elif self.geometry is not None:
+            self.geometry = self.geometry.difference(unary_union(geometries))
+
     def make_geometry(self, modifiers):
         """
         Runs the macro for the given modifiers and generates
@@ -347,15 +609,19 @@ class ApertureMacro:
         :rtype: shapely.geometry.polygon
         """
 
-        ## Primitive makers
+        ## Primitive makers for polygons, these give vertex arrays
+        vertex_makers = {
+            "2": ApertureMacro.vectorline_vertices,
+            "20": ApertureMacro.vectorline_vertices,
+            "21": ApertureMacro.centerline_vertices,
+            "22": ApertureMacro.lowerleftline_vertices,
+            "4": ApertureMacro.outline_vertices,
+            "5": ApertureMacro.polygon_vertices
+        }
+
+        ## Other primitive makers
         makers = {
             "1": ApertureMacro.make_circle,
-            "2": ApertureMacro.make_vectorline,
-            "20": ApertureMacro.make_vectorline,
-            "21": ApertureMacro.make_centerline,
-            "22": ApertureMacro.make_lowerleftline,
-            "4": ApertureMacro.make_outline,
-            "5": ApertureMacro.make_polygon,
             "6": ApertureMacro.make_moire,
             "7": ApertureMacro.make_thermal
         }
@@ -363,29 +629,53 @@ class ApertureMacro:
         ## Store modifiers as local variables
         modifiers = modifiers or []
         modifiers = [float(m) for m in modifiers]
+
+        # Apertures flashed many times use the same modifiers. The cache
+        # is only valid for the compiled raw, it's cleared on recompile.
+        key = tuple(modifiers)
+        if self._compiled_raw == self.raw and key in self._geo_cache:
+            self._geo_cache.move_to_end(key)
+            self.geometry = self._geo_cache[key]
+            return self.geometry
+
         self.locvars = {}
         for i in range(0, len(modifiers)):
             self.locvars[str(i + 1)] = modifiers[i]
 
         ## Parse
         self.primitives = []  # Cleanup
-        self.geometry = Polygon()
+        self.geometry = None  # Nothing added yet
         self.parse_content()
 
         ## Make the geometry
+        # Consecutive primitives of the same polarity are merged with a
+        # single unary_union. The result is the same as adding them one
+        # by one, since (A - B) - C == A - (B | C).
+        run, run_pol = [], None
         for primitive in self.primitives:
             # Make the primitive
-            prim_geo = makers[str(int(primitive[0]))](primitive[1:])
-
-            # Add it (according to polarity)
-            # if self.geometry is None and prim_geo['pol'] == 1:
-            #     self.geometry = prim_geo['geometry']
-            #     continue
-            if prim_geo['pol'] == 1:
-                self.geometry = self.geometry.union(prim_geo['geometry'])
-                continue
-            if prim_geo['pol'] == 0:
-                self.geometry = self.geometry.difference(prim_geo['geometry'])
+            code = str(int(primitive[0]))
+            if code in vertex_makers:
+                pol, geo = vertex_makers[code](primitive[1:])
+                if geo is None:
+                    continue
+            else:
+                prim_geo = makers[code](primitive[1:])
+                pol, geo = prim_geo['pol'], prim_geo['geometry']
+
+            if pol not in (0, 1):
                 continue
+            if pol != run_pol:
+                self._apply_run(run, run_pol)
+                run, run_pol = [], pol
+            run.append(geo)
+
+        self._apply_run(run, run_pol)
+        if self.geometry is None:
+            self.geometry = Polygon()
+
+        self._geo_cache[key] = self.geometry
+        if len(self._geo_cache) > self.geometry_cache_size:
+            self._geo_cache.popitem(last=False)
 
         return self.geometry
@@ -8,20 +8,30 @@
 
 import re
 
-from decimal import Decimal
+from collections import defaultdict
+from functools import lru_cache
+import numpy as np
+import shapely
 from numpy import arctan2, sqrt
-from io import StringIO
-from shapely import affinity
 from shapely.geometry import LineString, Point, LinearRing
 from shapely.ops import unary_union
 
-from .fcTree import FlatCAMRTreeStorage
+from .fcTree import FlatCAMZOrderStorage
 from .geometry import Geometry
 from .utils import arc, setup_log
 
 log = setup_log("fcCamlib.cncjob")
 
 
+@lru_cache(maxsize=8)
+def _move_templates(coordinate_format):
+    """
+    G-code lines for a rapid (G00) and a linear (G01) move
+    to the X, Y coordinates given in ``coordinate_format``.
+    """
+    return "G00 " + coordinate_format + "\n", "G01 " + coordinate_format + "\n"
+
+
 class CNCjob(Geometry):
     """
     Represents work to be done by a CNC machine.
@@ -44,6 +54,9 @@ class CNCjob(Geometry):
         "coordinate_format": "X%.4fY%.4f"
     }
 
+    # A letter and its value in a line of G-Code
+    code_re = re.compile(r'\s*([A-Z])\s*([\+\-\.\d\s]+)')
+
     def __init__(self,
                  units="in",
                  kind="generic",
@@ -71,6 +84,10 @@ class CNCjob(Geometry):
         self.gcode_parsed = None
         self.steps_per_circ = 20  # Used when parsing G-code arcs
 
+        # The self.gcode_parsed that self.solid_geometry was made from
+        # by create_geometry(), so that export_svg() can reuse it.
+        self._solid_geometry_source = None
+
         if zdownrate is not None:
             self.zdownrate = float(zdownrate)
         elif CNCjob.defaults["zdownrate"] is not None:
@@ -118,50 +135,49 @@ class CNCjob(Geometry):
         
         # sort the tools list by the second item in tuple (here we have a dict with diameter of the tool)
         # so we actually are sorting the tools by diameter
-        sorted_tools = sorted(exobj.tools.items(), key = lambda x: x[1])
+        sorted_tools = sorted(exobj.tools.items(), key=lambda x: x[1]["C"])
         if tools == "all":
             tools = [i[0] for i in sorted_tools]   # we get a array of ordered tools
             log.debug("Tools 'all' and sorted are: %s" % str(tools))
         else:
-            selected_tools = [x.strip() for x in tools.split(",")]  # we strip spaces and also separate the tools by ','
-            selected_tools = filter(lambda i: i in selected_tools, selected_tools)
+            selected_tools = {x.strip() for x in tools.split(",")}  # we strip spaces and also separate the tools by ','
 
             # Create a sorted list of selected tools from the sorted_tools list
-            tools = [i for i, j in sorted_tools for k in selected_tools if i == k]
-            log.debug("Tools selected and sorted are: %s" % str(tools)) 
+            tools = [i for i, _ in sorted_tools if i in selected_tools]
+            log.debug("Tools selected and sorted are: %s" % str(tools))
 
         # Points (Group by tool)
-        points = {}
+        points = defaultdict(list)
+        tools_set = set(tools)
         for drill in exobj.drills:
-            if drill['tool'] in tools:
-                try:
-                    points[drill['tool']].append(drill['point'])
-                except KeyError:
-                    points[drill['tool']] = [drill['point']]
+            if drill['tool'] in tools_set:
+                points[drill['tool']].append(drill['point'])
 
         #log.debug("Found %d drills." % len(points))
-        self.gcode = []
 
         # Basic G-Code macros
-        t = "G00 " + CNCjob.defaults["coordinate_format"] + "\n"
+        t, _ = _move_templates(CNCjob.defaults["coordinate_format"])
         down = "G01 Z%.4f\n" % self.z_cut
         up = "G00 Z%.4f\n" % self.z_move
         up_to_zero = "G01 Z0\n"
 
+        # G-code is collected in a list and joined at the end.
+        gcode = []
+
         # Initialization
-        gcode = self.unitcode[self.units.upper()] + "\n"
-        gcode += self.absolutecode + "\n"
-        gcode += self.feedminutecode + "\n"
-        gcode += "F%.2f\n" % self.feedrate
-        gcode += "G00 Z%.4f\n" % self.z_move  # Move to travel height
+        gcode.append(self.unitcode[self.units.upper()] + "\n")
+        gcode.append(self.absolutecode + "\n")
+        gcode.append(self.feedminutecode + "\n")
+        gcode.append("F%.2f\n" % self.feedrate)
+        gcode.append("G00 Z%.4f\n" % self.z_move)  # Move to travel height
 
         if self.spindlespeed is not None:
             # Spindle start with configured speed
-            gcode += "M03 S%d\n" % int(self.spindlespeed)
+            gcode.append("M03 S%d\n" % int(self.spindlespeed))
         else:
-            gcode += "M03\n"  # Spindle start
+            gcode.append("M03\n")  # Spindle start
 
-        #gcode += self.pausecode + "\n"
+        #gcode.append(self.pausecode + "\n")
 
         for tool in tools:
 
@@ -169,28 +185,26 @@ class CNCjob(Geometry):
             if tool in points:
                 # Tool change sequence (optional)
                 if toolchange:
-                    gcode += "G00 Z%.4f\n" % toolchangez
-                    gcode += "T%d\n" % int(tool)  # Indicate tool slot (for automatic tool changer)
-                    gcode += "M5\n"  # Spindle Stop
-                    gcode += "M6\n"  # Tool change
-                    gcode += "(MSG, Change to tool dia=%.4f)\n" % exobj.tools[tool]["C"]
-                    gcode += "M0\n"  # Temporary machine stop
+                    gcode.append("G00 Z%.4f\n" % toolchangez)
+                    gcode.append("T%d\n" % int(tool))  # Indicate tool slot (for automatic tool changer)
+                    gcode.append("M5\n")  # Spindle Stop
+                    gcode.append("M6\n")  # Tool change
+                    gcode.append("(MSG, Change to tool dia=%.4f)\n" % exobj.tools[tool]["C"])
+                    gcode.append("M0\n")  # Temporary machine stop
                     if self.spindlespeed is not None:
                         # Spindle start with configured speed
-                        gcode += "M03 S%d\n" % int(self.spindlespeed)
+                        gcode.append("M03 S%d\n" % int(self.spindlespeed))
                     else:
-                        gcode += "M03\n"  # Spindle start
+                        gcode.append("M03\n")  # Spindle start
 
-                # Drillling!
-                for point in points[tool]:
-                    x, y = point.coords.xy
-                    gcode += t % (x[0], y[0])
-                    gcode += down + up_to_zero + up
+                # Drillling! Move, drill and lift for every hole, formatted all at once.
+                xy = shapely.get_coordinates(points[tool])
+                gcode.append(((t + down + up_to_zero + up) * len(xy)) % tuple(xy.ravel().tolist()))
 
-        gcode += t % (0, 0)
-        gcode += "M05\n"  # Spindle stop
+        gcode.append(t % (0, 0))
+        gcode.append("M05\n")  # Spindle stop
 
-        self.gcode = gcode
+        self.gcode = "".join(gcode)
 
     def generate_from_geometry_2(self,
                                  geometry,
@@ -204,7 +218,7 @@ class CNCjob(Geometry):
 
         ALgorithm description:
         ----------------------
-        Uses RTree to find the nearest path to follow.
+        Uses a z-order index to find the nearest path to follow.
 
         :param geometry:
         :param append:
@@ -231,14 +245,13 @@ class CNCjob(Geometry):
             return [o.coords[0], o.coords[-1]]
 
         # Create the indexed storage.
-        storage = FlatCAMRTreeStorage()
+        storage = FlatCAMZOrderStorage()
         storage.get_points = get_pts
 
         # Store the geometry
         log.debug("Indexing geometry before generating G-Code...")
-        for shape in flat_geometry:
-            if shape is not None:  # TODO: This shouldn't have happened.
-                storage.insert(shape)
+        # TODO: None shouldn't have happened.
+        storage.bulk_load([shape for shape in flat_geometry if shape is not None])
 
         if tooldia is not None:
             self.tooldia = tooldia
@@ -248,17 +261,51 @@ class CNCjob(Geometry):
         if not append:
             self.gcode = ""
 
+        # G-code is collected in a list and joined into
+        # self.gcode at the end.
+        gcode = []
+
         # Initial G-Code
-        self.gcode = self.unitcode[self.units.upper()] + "\n"
-        self.gcode += self.absolutecode + "\n"
-        self.gcode += self.feedminutecode + "\n"
-        self.gcode += "F%.2f\n" % self.feedrate
-        self.gcode += "G00 Z%.4f\n" % self.z_move  # Move (up) to travel height
+        gcode.append(self.unitcode[self.units.upper()] + "\n")
+        gcode.append(self.absolutecode + "\n")
+        gcode.append(self.feedminutecode + "\n")
+        gcode.append("F%.2f\n" % self.feedrate)
+        gcode.append("G00 Z%.4f\n" % self.z_move)  # Move (up) to travel height
         if self.spindlespeed is not None:
-            self.gcode += "M03 S%d\n" % int(self.spindlespeed)  # Spindle start with configured speed
+            gcode.append("M03 S%d\n" % int(self.spindlespeed))  # Spindle start with configured speed
         else:
-            self.gcode += "M03\n"  # Spindle start
-        #self.gcode += self.pausecode + "\n"
+            gcode.append("M03\n")  # Spindle start
+        #gcode.append(self.pausecode + "\n")
+
+        # Paths are all cut the same way, so the whole of what
+        # linear2gcode() would produce is one template per path
+        # length: move to the start, plunge, cut to every point
+        # and, after the last pass, lift.
+        rapid, linear_move = _move_templates(CNCjob.defaults["coordinate_format"])
+        lift = "G00 Z%.4f\n" % self.z_move
+
+        if multidepth:
+            z_cut = float(self.z_cut)
+            # Full depth in one pass if not given.
+            depthpercut = abs(float(depthpercut)) if depthpercut else abs(z_cut)
+
+            # Depth is filled in for every pass.
+            if self.zdownrate is not None:
+                plunge = "F%.2f\nG01 Z%%.4f\nF%.2f\n" % (self.zdownrate, self.feedrate)
+            else:
+                plunge = "G01 Z%.4f\n"
+
+            def cut_pass(path, depth):
+                xy = path[:, :2].ravel().tolist()
+                return (rapid + plunge + linear_move * (len(path) - 1)) % (xy[0], xy[1], depth, *xy[2:])
+        else:
+            if self.zdownrate is not None:
+                plunge = "F%.2f\nG01 Z%.4f\nF%.2f\n" % (self.zdownrate, self.z_cut, self.feedrate)
+            else:
+                plunge = "G01 Z%.4f\n" % self.z_cut
+
+            def cut_path(path):
+                return (rapid + plunge + linear_move * (len(path) - 1) + lift) % tuple(path[:, :2].ravel().tolist())
 
         ## Iterate over geometry paths getting the nearest each time.
         log.debug("Starting G-Code...")
@@ -274,11 +321,19 @@ class CNCjob(Geometry):
                 # deletion will fail.
                 storage.remove(geo)
 
+                # Vertices of the path to cut. Shapely geometry can't be
+                # modified, reversing works on views of this array.
+                if type(geo) == LineString or type(geo) == LinearRing:
+                    coords = np.asarray((geo.simplify(tolerance) if tolerance > 0 else geo).coords)
+                else:
+                    coords = np.asarray(geo.coords)
+
                 # If last point in geometry is the nearest
                 # but prefer the first one if last point == first point
-                # then reverse coordinates.
+                # then reverse coordinates (a view, the vertices
+                # are not copied).
                 if pt != geo.coords[0] and pt == geo.coords[-1]:
-                    geo.coords = list(geo.coords)[::-1]
+                    coords = coords[::-1]
 
                 #---------- Single depth/pass --------
                 if not multidepth:
@@ -286,27 +341,19 @@ class CNCjob(Geometry):
                     # Note: self.linear2gcode() and self.point2gcode() will
                     # lower and raise the tool every time.
                     if type(geo) == LineString or type(geo) == LinearRing:
-                        self.gcode += self.linear2gcode(geo, tolerance=tolerance)
+                        gcode.append(cut_path(coords))
                     elif type(geo) == Point:
-                        self.gcode += self.point2gcode(geo)
+                        self.point2gcode(geo, out=gcode)
                     else:
                         log.warning("G-code generation not implemented for %s" % (str(type(geo))))
 
                 #--------- Multi-pass ---------
                 else:
-                    if isinstance(self.z_cut, Decimal):
-                        z_cut = self.z_cut
-                    else:
-                        z_cut = Decimal(self.z_cut).quantize(Decimal('0.000000001'))
-
-                    if depthpercut is None:
-                        depthpercut = z_cut
-                    elif not isinstance(depthpercut, Decimal):
-                        depthpercut = Decimal(depthpercut).quantize(Decimal('0.000000001'))
-
-                    depth = 0
-                    reverse = False
-                    while depth > z_cut:
+                    depth = 0.0
+                    pass_coords = coords
+                    # The margin keeps rounding errors from adding
+                    # a pass right above z_cut.
+                    while depth > z_cut + 1e-9:
 
                         # Increase depth. Limit to z_cut.
                         depth -= depthpercut
@@ -314,18 +361,16 @@ class CNCjob(Geometry):
                             depth = z_cut
 
                         # Cut at specific depth and do not lift the tool.
-                        # Note: linear2gcode() will use G00 to move to the
+                        # Note: cut_pass() will use G00 to move to the
                         # first point in the path, but it should be already
                         # at the first point if the tool is down (in the material).
                         # So, an extra G00 should show up but is inconsequential.
                         if type(geo) == LineString or type(geo) == LinearRing:
-                            self.gcode += self.linear2gcode(geo, tolerance=tolerance,
-                                                            zcut=depth,
-                                                            up=False)
+                            gcode.append(cut_pass(pass_coords, depth))
 
                         # Ignore multi-pass for points.
                         elif type(geo) == Point:
-                            self.gcode += self.point2gcode(geo)
+                            self.point2gcode(geo, out=gcode)
                             break  # Ignoring ...
 
                         else:
@@ -334,24 +379,21 @@ class CNCjob(Geometry):
                         # Reverse coordinates if not a loop so we can continue
                         # cutting without returning to the beginhing.
                         if type(geo) == LineString:
-                            geo.coords = list(geo.coords)[::-1]
-                            reverse = True
+                            pass_coords = pass_coords[::-1]
 
-                    # If geometry is reversed, revert.
-                    if reverse:
-                        if type(geo) == LineString:
-                            geo.coords = list(geo.coords)[::-1]
+                    # The last pass ended where the next would start.
+                    coords = pass_coords[::-1]
 
                     # Lift the tool
-                    self.gcode += "G00 Z%.4f\n" % self.z_move
-                    # self.gcode += "( End of path. )\n"
+                    gcode.append(lift)
+                    # gcode.append("( End of path. )\n")
 
                 # Did deletion at the beginning.
                 # Delete from index, update current location and continue.
                 #rti.delete(hits[0], geo.coords[0])
                 #rti.delete(hits[0], geo.coords[-1])
 
-                current_pt = geo.coords[-1]
+                current_pt = tuple(coords[-1].tolist())
 
                 # Next
                 pt, geo = storage.nearest(current_pt)
@@ -362,9 +404,11 @@ class CNCjob(Geometry):
         log.debug("%s paths traced." % path_count)
 
         # Finish
-        self.gcode += "G00 Z%.4f\n" % self.z_move  # Stop cutting
-        self.gcode += "G00 X0Y0\n"
-        self.gcode += "M05\n"  # Spindle stop
+        gcode.append(lift)  # Stop cutting
+        gcode.append("G00 X0Y0\n")
+        gcode.append("M05\n")  # Spindle stop
+
+        self.gcode = "".join(gcode)
 
     @staticmethod
     def codes_split(gline):
@@ -378,11 +422,12 @@ class CNCjob(Geometry):
 
         command = {}
 
-        match = re.search(r'^\s*([A-Z])\s*([\+\-\.\d\s]+)', gline)
+        # Codes are read from the start of the line, up to the
+        # first thing that is not a code.
+        match = CNCjob.code_re.match(gline)
         while match:
             command[match.group(1)] = float(match.group(2).replace(" ", ""))
-            gline = gline[match.end():]
-            match = re.search(r'^\s*([A-Z])\s*([\+\-\.\d\s]+)', gline)
+            match = CNCjob.code_re.match(gline, match.end())
 
         return command
 
@@ -395,8 +440,10 @@ class CNCjob(Geometry):
 
         kind = ["C", "F"]  # T=travel, C=cut, F=fast, S=slow
 
-        # Results go here
-        geometry = []        
+        # Results go here. The LineStrings are made at the end,
+        # all in one call.
+        paths = []
+        kinds = []
 
         # Last known instruction
         current = {'X': 0.0, 'Y': 0.0, 'Z': 0.0, 'G': 0}
@@ -405,10 +452,19 @@ class CNCjob(Geometry):
         # lifted or lowered.
         path = [(0, 0)]
 
+        arcdir = [None, None, "cw", "ccw"]
+
+        # Lines already split, G-code repeats many of them (every
+        # pass of a multi-depth cut, moves up and down, ...).
+        # Only read from here, never modified.
+        split_lines = {}
+
         # Process every instruction
-        for line in StringIO(self.gcode):
+        for line in self.gcode.splitlines():
 
-            gobj = self.codes_split(line)
+            gobj = split_lines.get(line)
+            if gobj is None:
+                gobj = split_lines[line] = self.codes_split(line)
 
             ## Units
             if 'G' in gobj and (gobj['G'] == 20.0 or gobj['G'] == 21.0):
@@ -423,8 +479,8 @@ class CNCjob(Geometry):
                 current['Z'] = gobj['Z']
                 # Store the path into geometry and reset path
                 if len(path) > 1:
-                    geometry.append({"geom": LineString(path),
-                                     "kind": kind})
+                    paths.append(path)
+                    kinds.append(kind)
                     path = [path[-1]]  # Start with the last point of last path.
 
             if 'G' in gobj:
@@ -448,8 +504,7 @@ class CNCjob(Geometry):
                     kind[0] = 'T'
                 if current['G'] > 0:
                     kind[1] = 'S'
-                   
-                arcdir = [None, None, "cw", "ccw"]
+
                 if current['G'] in [0, 1]:  # line
                     path.append((x, y))
 
@@ -470,8 +525,15 @@ class CNCjob(Geometry):
         # end, therefore, see here too if there is
         # a final path.
         if len(path) > 1:
-            geometry.append({"geom": LineString(path),
-                             "kind": kind})
+            paths.append(path)
+            kinds.append(kind)
+
+        geometry = []
+        if paths:
+            coords = np.array([pt for path in paths for pt in path], dtype=float)
+            indices = np.repeat(np.arange(len(paths)), [len(path) for path in paths])
+            lines = shapely.linestrings(coords, indices=indices)
+            geometry = [{"geom": line, "kind": kind} for line, kind in zip(lines, kinds)]
 
         self.gcode_parsed = geometry
         return geometry
@@ -531,31 +593,41 @@ class CNCjob(Geometry):
             tooldia = self.tooldia
         
         if tooldia == 0:
-            for geo in self.gcode_parsed:
-                obj.add_shape(shape=geo['geom'], color=color[geo['kind'][0]][1], visible=visible)
+            obj.add_shapes([{'shape': geo['geom'], 'color': color[geo['kind'][0]][1]} for geo in self.gcode_parsed],
+                           visible=visible)
         else:
             text = []
-            pos = []
-            for geo in self.gcode_parsed:
+            shapes = []
+
+            # Tool shapes of all the paths, buffered and simplified in one call
+            # each. quad_segs as in BaseGeometry.buffer(), shapely.buffer() uses 8.
+            paths = [geo['geom'] for geo in self.gcode_parsed]
+            polys = shapely.simplify(shapely.buffer(paths, tooldia / 2.0, quad_segs=16), tool_tolerance)
+
+            # Path numbers go at the first point of each path.
+            pos = [tuple(pt) for pt in shapely.get_coordinates(shapely.get_point(paths, 0)).tolist()]
+
+            for geo, poly in zip(self.gcode_parsed, polys):
                 path_num += 1
 
                 text.append(str(path_num))
-                pos.append(geo['geom'].coords[0])
 
-                poly = geo['geom'].buffer(tooldia / 2.0).simplify(tool_tolerance)
-                obj.add_shape(shape=poly, color=color[geo['kind'][0]][1], face_color=color[geo['kind'][0]][0],
-                              visible=visible, layer=1 if geo['kind'][0] == 'C' else 2)
+                shapes.append({'shape': poly, 'color': color[geo['kind'][0]][1], 'face_color': color[geo['kind'][0]][0],
+                               'layer': 1 if geo['kind'][0] == 'C' else 2})
 
+            obj.add_shapes(shapes, visible=visible)
             obj.annotation.set(text=text, pos=pos, visible=obj.options['plot'])
 
     def create_geometry(self):
         # TODO: This takes forever. Too much data?
 #        self.solid_geometry = cascaded_union([geo['geom'] for geo in self.gcode_parsed])
         self.solid_geometry = unary_union([geo['geom'] for geo in self.gcode_parsed])
+        self._solid_geometry_source = self.gcode_parsed
 
     def linear2gcode(self, linear, tolerance=0, down=True, up=True,
                      zcut=None, ztravel=None, downrate=None,
-                     feedrate=None, cont=False):
+                     feedrate=None, cont=False, out=None, coords=None,
+                     reverse=False):
         """
         Generates G-code to cut along the linear feature.
 
@@ -564,7 +636,16 @@ class CNCjob(Geometry):
         :param tolerance: All points in the simplified object will be within the
             tolerance distance of the original geometry.
         :type tolerance: float
-        :return: G-code to cut along the linear feature.
+        :param out: If given, the G-code lines are appended to this list
+            instead of being returned.
+        :type out: list
+        :param coords: Vertices to cut along, used as they are instead of
+            those of ``linear`` (which is then not simplified).
+        :type coords: numpy.ndarray
+        :param reverse: Cut from the last vertex to the first. The
+            geometry is not modified.
+        :type reverse: bool
+        :return: G-code to cut along the linear feature, None if ``out`` is given.
         :rtype: str
         """
 
@@ -580,58 +661,77 @@ class CNCjob(Geometry):
         if feedrate is None:
             feedrate = self.feedrate
 
-        t = "G0%d " + CNCjob.defaults["coordinate_format"] + "\n"
+        rapid, linear_move = _move_templates(CNCjob.defaults["coordinate_format"])
 
-        # Simplify paths?
-        if tolerance > 0:
-            target_linear = linear.simplify(tolerance)
-        else:
-            target_linear = linear
+        if coords is None:
+            # Simplify paths?
+            if tolerance > 0:
+                target_linear = linear.simplify(tolerance)
+            else:
+                target_linear = linear
+            coords = np.asarray(target_linear.coords)
+
+        # A view, no copy of the vertices.
+        if reverse:
+            coords = coords[::-1]
 
-        gcode = ""
+        gcode = [] if out is None else out
 
-        path = list(target_linear.coords)
+        path = coords[:, :2]
 
         # Move fast to 1st point
         if not cont:
-            gcode += t % (0, path[0][0], path[0][1])  # Move to first point
+            gcode.append(rapid % (path[0][0], path[0][1]))  # Move to first point
 
         # Move down to cutting depth
         if down:
             # Different feedrate for vertical cut?
             if self.zdownrate is not None:
-                gcode += "F%.2f\n" % downrate
-                gcode += "G01 Z%.4f\n" % zcut       # Start cutting
-                gcode += "F%.2f\n" % feedrate       # Restore feedrate
+                gcode.append("F%.2f\n" % downrate)
+                gcode.append("G01 Z%.4f\n" % zcut)       # Start cutting
+                gcode.append("F%.2f\n" % feedrate)       # Restore feedrate
             else:
-                gcode += "G01 Z%.4f\n" % zcut       # Start cutting
+                gcode.append("G01 Z%.4f\n" % zcut)       # Start cutting
 
-        # Cutting...
-        for pt in path[1:]:
-            gcode += t % (1, pt[0], pt[1])    # Linear motion to point
+        # Cutting... Linear motion to every point, formatted all at once.
+        if len(path) > 1:
+            gcode.append((linear_move * (len(path) - 1)) % tuple(path[1:].ravel().tolist()))
 
         # Up to travelling height.
         if up:
-            gcode += "G00 Z%.4f\n" % ztravel  # Stop cutting
+            gcode.append("G00 Z%.4f\n" % ztravel)  # Stop cutting
 
-        return gcode
+        if out is None:
+            return "".join(gcode)
 
-    def point2gcode(self, point):
-        gcode = ""
-        #t = "G0%d X%.4fY%.4f\n"
-        t = "G0%d " + CNCjob.defaults["coordinate_format"] + "\n"
+    def point2gcode(self, point, out=None):
+        """
+        Generates G-code to plunge at the point.
+
+        :param point: Where to cut.
+        :type point: Shapely.Point
+        :param out: If given, the G-code lines are appended to this list
+            instead of being returned.
+        :type out: list
+        :return: G-code, None if ``out`` is given.
+        :rtype: str
+        """
+        gcode = [] if out is None else out
+        rapid, _ = _move_templates(CNCjob.defaults["coordinate_format"])
         path = list(point.coords)
-        gcode += t % (0, path[0][0], path[0][1])  # Move to first point
+        gcode.append(rapid % (path[0][0], path[0][1]))  # Move to first point
 
         if self.zdownrate is not None:
-            gcode += "F%.2f\n" % self.zdownrate
-            gcode += "G01 Z%.4f\n" % self.z_cut       # Start cutting
-            gcode += "F%.2f\n" % self.feedrate
+            gcode.append("F%.2f\n" % self.zdownrate)
+            gcode.append("G01 Z%.4f\n" % self.z_cut)       # Start cutting
+            gcode.append("F%.2f\n" % self.feedrate)
         else:
-            gcode += "G01 Z%.4f\n" % self.z_cut       # Start cutting
+            gcode.append("G01 Z%.4f\n" % self.z_cut)       # Start cutting
+
+        gcode.append("G00 Z%.4f\n" % self.z_move)      # Stop cutting
 
-        gcode += "G00 Z%.4f\n" % self.z_move      # Stop cutting
-        return gcode
+        if out is None:
+            return "".join(gcode)
 
     def scale(self, factor):
         """
@@ -645,8 +745,7 @@ class CNCjob(Geometry):
         :rtype: None
         """
 
-        for g in self.gcode_parsed:
-            g['geom'] = affinity.scale(g['geom'], factor, factor, origin=(0, 0))
+        self._transform_parsed(lambda coords: coords * factor)
 
         self.create_geometry()
 
@@ -661,11 +760,23 @@ class CNCjob(Geometry):
         """
         dx, dy = vect
 
-        for g in self.gcode_parsed:
-            g['geom'] = affinity.translate(g['geom'], xoff=dx, yoff=dy)
+        self._transform_parsed(lambda coords: coords + (dx, dy))
 
         self.create_geometry()
 
+    def _transform_parsed(self, transformation):
+        """
+        Replaces the geometry in ``self.gcode_parsed``, all at once,
+        by its transformation.
+
+        :param transformation: Function taking an (N, 2) array of
+            coordinates and returning the new ones.
+        :return: None
+        """
+        geoms = shapely.transform([g['geom'] for g in self.gcode_parsed], transformation)
+        for g, geom in zip(self.gcode_parsed, geoms):
+            g['geom'] = geom
+
     def export_svg(self, scale_factor=0.00):
         """
         Exports the CNC Job as a SVG Element
@@ -695,8 +806,10 @@ class CNCjob(Geometry):
             if g['kind'][0] == 'C': cuts.append(g)
             if g['kind'][0] == 'T': travels.append(g)
 
-        # Used to determine the overall board size
-        self.solid_geometry = unary_union([geo['geom'] for geo in self.gcode_parsed])
+        # Used to determine the overall board size. Already made
+        # unless the G-code was parsed again since.
+        if self._solid_geometry_source is not self.gcode_parsed:
+            self.create_geometry()
 
         # Convert the cuts and travels into single geometry objects we can render as svg xml
         if travels:
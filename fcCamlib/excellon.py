@@ -8,13 +8,60 @@
 
 import re
 
-from shapely.geometry import Point
+import numpy as np
+import shapely
 
 from .geometry import Geometry
 from .utils import setup_log
 
 log = setup_log("fcCamlib.excellon")
 
+# Values after an X or a Y, see _parse_xy().
+_coord_re = re.compile(r'[-\+]?\d*')
+_coord_period_re = re.compile(r'[-\+]?\d*\.\d*')
+
+# 10 ** n, for the usual exponents in Excellon.parse_number()
+_powers_of_ten = {n: 10 ** n for n in range(-3, 16)}
+
+
+def _parse_xy(line):
+    """
+    Finds the X and Y values in a line of coordinates, the
+    same way ``Excellon.coordsnoperiod_re`` and then
+    ``Excellon.coordsperiod_re`` would.
+
+    If an X or a Y follows the last period in the line, the
+    values are read without period (a period before them is
+    ignored). Otherwise only values with a period are taken.
+    The last X and the last Y win.
+
+    Only the values are matched, at the positions found
+    with ``str.rfind()``, so a line is looked at once
+    instead of by one pattern and then the other.
+
+    :param line: Line with an X and/or a Y.
+    :type line: str
+    :return: (x, y, period), x or y are None when missing.
+    :rtype: tuple
+    """
+    last_period = line.rfind('.')
+    ix = line.rfind('X')
+    iy = line.rfind('Y')
+
+    if ix > last_period or iy > last_period:
+        x = _coord_re.match(line, ix + 1).group() if ix > last_period else None
+        y = _coord_re.match(line, iy + 1).group() if iy > last_period else None
+        return x, y, False
+
+    x = y = None
+    while ix >= 0 and x is None:
+        x = _coord_period_re.match(line, ix + 1)
+        ix = line.rfind('X', 0, ix)
+    while iy >= 0 and y is None:
+        y = _coord_period_re.match(line, iy + 1)
+        iy = line.rfind('Y', 0, iy)
+    return x and x.group(), y and y.group(), True
+
 
 class Excellon(Geometry):
     """
@@ -44,6 +91,74 @@ class Excellon(Geometry):
         "zeros": "L"
     }
 
+    #### Patterns ####
+    # Compiled once, shared by all instances.
+    # Regex basics:
+    # ^ - beginning
+    # $ - end
+    # *: 0 or more, +: 1 or more, ?: 0 or 1
+
+    # M48 - Beggining of Part Program Header
+    hbegin_re = re.compile(r'^M48$')
+
+    # M95 or % - End of Part Program Header
+    # NOTE: % has different meaning in the body
+    hend_re = re.compile(r'^(?:M95|%)$')
+
+    # FMAT Excellon format
+    # Ignored in the parser
+    #fmat_re = re.compile(r'^FMAT,([12])$')
+
+    # Number format and units
+    # INCH uses 6 digits
+    # METRIC uses 5/6
+    units_re = re.compile(r'^(INCH|METRIC)(?:,([TL])Z)?$')
+
+    # Tool definition/parameters (?= is look-ahead
+    # NOTE: This might be an overkill!
+    # toolset_re = re.compile(r'^T(0?\d|\d\d)(?=.*C(\d*\.?\d*))?' +
+    #                         r'(?=.*F(\d*\.?\d*))?(?=.*S(\d*\.?\d*))?' +
+    #                         r'(?=.*B(\d*\.?\d*))?(?=.*H(\d*\.?\d*))?' +
+    #                         r'(?=.*Z([-\+]?\d*\.?\d*))?[CFSBHT]')
+    toolset_re = re.compile(r'^T(\d+)(?=.*C(\d*\.?\d*))?' +
+                            r'(?=.*F(\d*\.?\d*))?(?=.*S(\d*\.?\d*))?' +
+                            r'(?=.*B(\d*\.?\d*))?(?=.*H(\d*\.?\d*))?' +
+                            r'(?=.*Z([-\+]?\d*\.?\d*))?[CFSBHT]')
+
+    # Tool select
+    # Can have additional data after tool number but
+    # is ignored if present in the header.
+    # Warning: This will match toolset_re too.
+    # toolsel_re = re.compile(r'^T((?:\d\d)|(?:\d))')
+    toolsel_re = re.compile(r'^T(\d+)')
+
+    # Comment
+    comm_re = re.compile(r'^;(.*)$')
+
+    # Absolute/Incremental G90/G91
+    absinc_re = re.compile(r'^G9([01])$')
+
+    # Modes of operation
+    # 1-linear, 2-circCW, 3-cirCCW, 4-vardwell, 5-Drill
+    modes_re = re.compile(r'^G0([012345])')
+
+    # Measuring mode
+    # 1-metric, 2-inch
+    meas_re = re.compile(r'^M7([12])$')
+
+    # Coordinates
+    # Not used by parse_lines(), see _parse_xy().
+    #xcoord_re = re.compile(r'^X(\d*\.?\d*)(?:Y\d*\.?\d*)?$')
+    #ycoord_re = re.compile(r'^(?:X\d*\.?\d*)?Y(\d*\.?\d*)$')
+    coordsperiod_re = re.compile(r'(?=.*X([-\+]?\d*\.\d*))?(?=.*Y([-\+]?\d*\.\d*))?[XY]')
+    coordsnoperiod_re = re.compile(r'(?!.*\.)(?=.*X([-\+]?\d*))?(?=.*Y([-\+]?\d*))?[XY]')
+
+    # R - Repeat hole (# times, X offset, Y offset)
+    rep_re = re.compile(r'^R(\d+)(?=.*[XY])+(?:X([-\+]?\d*\.?\d*))?(?:Y([-\+]?\d*\.?\d*))?$')
+
+    # Various stop/pause commands
+    stop_re = re.compile(r'^((G04)|(M09)|(M06)|(M00)|(M30))')
+
     def __init__(self, zeros=None):
         """
         The constructor takes no parameters.
@@ -70,94 +185,29 @@ class Excellon(Geometry):
         # from Geometry.
         self.ser_attrs += ['tools', 'drills', 'zeros']
 
-        #### Patterns ####
-        # Regex basics:
-        # ^ - beginning
-        # $ - end
-        # *: 0 or more, +: 1 or more, ?: 0 or 1
-
-        # M48 - Beggining of Part Program Header
-        self.hbegin_re = re.compile(r'^M48$')
-
-        # M95 or % - End of Part Program Header
-        # NOTE: % has different meaning in the body
-        self.hend_re = re.compile(r'^(?:M95|%)$')
-
-        # FMAT Excellon format
-        # Ignored in the parser
-        #self.fmat_re = re.compile(r'^FMAT,([12])$')
-
-        # Number format and units
-        # INCH uses 6 digits
-        # METRIC uses 5/6
-        self.units_re = re.compile(r'^(INCH|METRIC)(?:,([TL])Z)?$')
-
-        # Tool definition/parameters (?= is look-ahead
-        # NOTE: This might be an overkill!
-        # self.toolset_re = re.compile(r'^T(0?\d|\d\d)(?=.*C(\d*\.?\d*))?' +
-        #                              r'(?=.*F(\d*\.?\d*))?(?=.*S(\d*\.?\d*))?' +
-        #                              r'(?=.*B(\d*\.?\d*))?(?=.*H(\d*\.?\d*))?' +
-        #                              r'(?=.*Z([-\+]?\d*\.?\d*))?[CFSBHT]')
-        self.toolset_re = re.compile(r'^T(\d+)(?=.*C(\d*\.?\d*))?' +
-                                     r'(?=.*F(\d*\.?\d*))?(?=.*S(\d*\.?\d*))?' +
-                                     r'(?=.*B(\d*\.?\d*))?(?=.*H(\d*\.?\d*))?' +
-                                     r'(?=.*Z([-\+]?\d*\.?\d*))?[CFSBHT]')
-
-        # Tool select
-        # Can have additional data after tool number but
-        # is ignored if present in the header.
-        # Warning: This will match toolset_re too.
-        # self.toolsel_re = re.compile(r'^T((?:\d\d)|(?:\d))')
-        self.toolsel_re = re.compile(r'^T(\d+)')
-
-        # Comment
-        self.comm_re = re.compile(r'^;(.*)$')
-
-        # Absolute/Incremental G90/G91
-        self.absinc_re = re.compile(r'^G9([01])$')
-
-        # Modes of operation
-        # 1-linear, 2-circCW, 3-cirCCW, 4-vardwell, 5-Drill
-        self.modes_re = re.compile(r'^G0([012345])')
-
-        # Measuring mode
-        # 1-metric, 2-inch
-        self.meas_re = re.compile(r'^M7([12])$')
-
-        # Coordinates
-        #self.xcoord_re = re.compile(r'^X(\d*\.?\d*)(?:Y\d*\.?\d*)?$')
-        #self.ycoord_re = re.compile(r'^(?:X\d*\.?\d*)?Y(\d*\.?\d*)$')
-        self.coordsperiod_re = re.compile(r'(?=.*X([-\+]?\d*\.\d*))?(?=.*Y([-\+]?\d*\.\d*))?[XY]')
-        self.coordsnoperiod_re = re.compile(r'(?!.*\.)(?=.*X([-\+]?\d*))?(?=.*Y([-\+]?\d*))?[XY]')
-
-        # R - Repeat hole (# times, X offset, Y offset)
-        self.rep_re = re.compile(r'^R(\d+)(?=.*[XY])+(?:X([-\+]?\d*\.?\d*))?(?:Y([-\+]?\d*\.?\d*))?$')
-
-        # Various stop/pause commands
-        self.stop_re = re.compile(r'^((G04)|(M09)|(M06)|(M00)|(M30))')
-
-        # Parse coordinates
-        self.leadingzeros_re = re.compile(r'^[-\+]?(0*)(\d*)')
-        
+        # (zeros, units, leading zeros?, inches?) as last used
+        # by parse_number(), redone when zeros or units change.
+        self._number_format = (None, None, False, False)
+
     def parse_file(self, filename):
         """
-        Reads the specified file as array of lines as
-        passes it to ``parse_lines()``.
+        Passes the lines in the specified file to
+        ``parse_lines()`` as they are read.
 
         :param filename: The file to be read and parsed.
         :type filename: str
         :return: None
         """
-        with open(filename, 'r') as efile:
-            estr = efile.readlines()
-        self.parse_lines(estr)
+        with open(filename, 'r', buffering=1 << 20) as efile:
+            self.parse_lines(efile)
 
     def parse_lines(self, elines):
         """
         Main Excellon parser.
 
-        :param elines: List of strings, each being a line of Excellon code.
-        :type elines: list
+        :param elines: Strings, each being a line of Excellon code.
+            Any iterable, it is only read once.
+        :type elines: iterable
         :return: None
         """
 
@@ -167,6 +217,18 @@ class Excellon(Geometry):
         current_x = None
         current_y = None
 
+        # Drills not yet in self.drills, as coordinates and
+        # tool names. Their points are made all at once.
+        drill_x = []
+        drill_y = []
+        drill_tool = []
+
+        def add_drills():
+            points = shapely.points(drill_x, drill_y).tolist()
+            self.drills.extend({'point': point, 'tool': tool}
+                               for point, tool in zip(points, drill_tool))
+            del drill_x[:], drill_y[:], drill_tool[:]
+
         #### Parsing starts here ####
         line_num = 0  # Line number
         eline = ""
@@ -178,93 +240,81 @@ class Excellon(Geometry):
                 ### Cleanup lines
                 eline = eline.strip(' \r\n')
 
-                ## Header Begin (M48) ##
-                if self.hbegin_re.search(eline):
-                    in_header = True
-                    continue
+                # Only the patterns that can match a line
+                # starting with this character are tried.
+                first = eline[:1]
 
-                ## Header End ##
-                if self.hend_re.search(eline):
-                    in_header = False
-                    continue
+                if first == 'M' or first == '%':
 
-                ## Alternative units format M71/M72
-                # Supposed to be just in the body (yes, the body)
-                # but some put it in the header (PADS for example).
-                # Will detect anywhere. Occurrence will change the
-                # object's units.
-                match = self.meas_re.match(eline)
-                if match:
-                    #self.units = {"1": "MM", "2": "IN"}[match.group(1)]
-
-                    # Modified for issue #80
-                    self.convert_units({"1": "MM", "2": "IN"}[match.group(1)])
-                    log.debug("  Units: %s" % self.units)
-                    continue
+                    ## Header Begin (M48) ##
+                    if self.hbegin_re.search(eline):
+                        in_header = True
+                        continue
 
-                #### Body ####
-                if not in_header:
+                    ## Header End ##
+                    if self.hend_re.search(eline):
+                        in_header = False
+                        continue
 
-                    ## Tool change ##
-                    match = self.toolsel_re.search(eline)
+                    ## Alternative units format M71/M72
+                    # Supposed to be just in the body (yes, the body)
+                    # but some put it in the header (PADS for example).
+                    # Will detect anywhere. Occurrence will change the
+                    # object's units.
+                    match = self.meas_re.match(eline)
                     if match:
-                        current_tool = str(int(match.group(1)))
-                        log.debug("Tool change: %s" % current_tool)
+                        #self.units = {"1": "MM", "2": "IN"}[match.group(1)]
+
+                        # Modified for issue #80
+                        add_drills()  # Converted too.
+                        self.convert_units({"1": "MM", "2": "IN"}[match.group(1)])
+                        log.debug("  Units: %s" % self.units)
                         continue
 
-                    ## Coordinates without period ##
-                    match = self.coordsnoperiod_re.search(eline)
-                    if match:
-                        try:
-                            #x = float(match.group(1))/10000
-                            x = self.parse_number(match.group(1))
-                            current_x = x
-                        except TypeError:
-                            x = current_x
-
-                        try:
-                            #y = float(match.group(2))/10000
-                            y = self.parse_number(match.group(2))
-                            current_y = y
-                        except TypeError:
-                            y = current_y
-
-                        if x is None or y is None:
-                            log.error("Missing coordinates")
+                #### Body ####
+                if not in_header:
+
+                    ## Tool change ##
+                    if first == 'T':
+                        match = self.toolsel_re.search(eline)
+                        if match:
+                            current_tool = str(int(match.group(1)))
+                            log.debug("Tool change: %s" % current_tool)
                             continue
 
-                        self.drills.append({'point': Point((x, y)), 'tool': current_tool})
-                        log.debug("{:15} {:8} {:8}".format(eline, x, y))
+                    # Coordinates can follow other codes on the
+                    # line (G00X...), but need an X or a Y.
+                    if 'X' not in eline and 'Y' not in eline:
+                        log.warning("Line ignored: %s" % eline)
                         continue
 
-                    ## Coordinates with period: Use literally. ##
-                    match = self.coordsperiod_re.search(eline)
-                    if match:
-                        try:
-                            x = float(match.group(1))
-                            current_x = x
-                        except TypeError:
-                            x = current_x
-
-                        try:
-                            y = float(match.group(2))
-                            current_y = y
-                        except TypeError:
-                            y = current_y
-
-                        if x is None or y is None:
-                            log.error("Missing coordinates")
-                            continue
+                    ## Coordinates ##
+                    # Without period they depend on the number
+                    # format, with period they are used literally.
+                    x, y, period = _parse_xy(eline)
+                    number = float if period else self.parse_number
+
+                    if x is not None:
+                        current_x = number(x)
+                    if y is not None:
+                        current_y = number(y)
+                    x, y = current_x, current_y
 
-                        self.drills.append({'point': Point((x, y)), 'tool': current_tool})
-                        log.debug("{:15} {:8} {:8}".format(eline, x, y))
+                    if x is None or y is None:
+                        log.error("Missing coordinates")
                         continue
 
+                    drill_x.append(x)
+                    drill_y.append(y)
+                    drill_tool.append(current_tool)
+                    log.debug("{:15} {:8} {:8}".format(eline, x, y))
+                    continue
+
                 #### Header ####
                 if in_header:
 
                     ## Tool definitions ##
-                    match = self.toolset_re.search(eline)
+                    match = self.toolset_re.search(eline) if first == 'T' else None
                     if match:
 
                         name = str(int(match.group(1)))
@@ -281,13 +331,14 @@ class Excellon(Geometry):
                         continue
 
                     ## Units and number format ##
-                    match = self.units_re.match(eline)
+                    match = self.units_re.match(eline) if first == 'I' or first == 'M' else None
                     if match:
                         self.zeros = match.group(2) or self.zeros  # "T" or "L". Might be empty
 
                         #self.units = {"INCH": "IN", "METRIC": "MM"}[match.group(1)]
 
                         # Modified for issue #80
+                        add_drills()  # Converted too.
                         self.convert_units({"INCH": "IN", "METRIC": "MM"}[match.group(1)])
                         log.debug("  Units/Format: %s %s" % (self.units, self.zeros))
                         continue
@@ -299,37 +350,46 @@ class Excellon(Geometry):
         except Exception as e:
             log.error("PARSING FAILED. Line %d: %s" % (line_num, eline))
             raise
+
+        finally:
+            add_drills()
         
     def parse_number(self, number_str):
         """
         Parses coordinate numbers without period.
 
-        :param number_str: String representing the numerical value.
+        :param number_str: String representing the numerical value,
+            an optional sign and digits.
         :type number_str: str
         :return: Floating point representation of the number
         :rtype: foat
         """
-        if self.zeros == "L":
+        zeros, units, leading, inch = self._number_format
+        if zeros is not self.zeros or units is not self.units:
+            leading = self.zeros == "L"
+            inch = self.units.lower() == "in"
+            self._number_format = (self.zeros, self.units, leading, inch)
+
+        if leading:
             # With leading zeros, when you type in a coordinate,
             # the leading zeros must always be included.  Trailing zeros
             # are unneeded and may be left off. The CNC-7 will automatically add them.
-            # r'^[-\+]?(0*)(\d*)'
             # 6 digits are divided by 10^4
             # If less than size digits, they are automatically added,
             # 5 digits then are divided by 10^3 and so on.
-            match = self.leadingzeros_re.search(number_str)
-            if self.units.lower() == "in":
-                return float(number_str) / \
-                    (10 ** (len(match.group(1)) + len(match.group(2)) - 2))
+            digits = len(number_str) - (number_str[:1] in ('-', '+'))
+            if inch:
+                exponent = digits - 2
             else:
-                return float(number_str) / \
-                    (10 ** (len(match.group(1)) + len(match.group(2)) - 3))
+                exponent = digits - 3
+            divisor = _powers_of_ten.get(exponent) or 10 ** exponent
+            return float(number_str) / divisor
 
         else:  # Trailing
             # You must show all zeros to the right of the number and can omit
             # all zeros to the left of the number. The CNC-7 will count the number
             # of digits you typed and automatically fill in the missing zeros.
-            if self.units.lower() == "in":  # Inches is 00.0000
+            if inch:  # Inches is 00.0000
                 return float(number_str) / 10000
             else:
                 return float(number_str) / 1000  # Metric is 000.000
@@ -341,13 +401,12 @@ class Excellon(Geometry):
 
         :return: None
         """
-        self.solid_geometry = []
-
-        for drill in self.drills:
-            # poly = drill['point'].buffer(self.tools[drill['tool']]["C"]/2.0)
-            tooldia = self.tools[drill['tool']]['C']
-            poly = drill['point'].buffer(tooldia / 2.0)
-            self.solid_geometry.append(poly)
+        # All drills are buffered in one call, each by the
+        # radius of its tool (16 segments per quarter circle
+        # as in Point.buffer()).
+        points = [drill['point'] for drill in self.drills]
+        tooldias = np.array([self.tools[drill['tool']]['C'] for drill in self.drills], dtype=float)
+        self.solid_geometry = shapely.buffer(points, tooldias / 2.0, quad_segs=16).tolist()
 
     def scale(self, factor):
         """
@@ -361,8 +420,7 @@ class Excellon(Geometry):
         """
 
         # Drills
-        for drill in self.drills:
-            drill['point'] = affinity.scale(drill['point'], factor, factor, origin=(0, 0))
+        self._transform_drills(lambda coords: coords * factor)
 
         self.create_geometry()
 
@@ -378,8 +436,7 @@ class Excellon(Geometry):
         dx, dy = vect
 
         # Drills
-        for drill in self.drills:
-            drill['point'] = affinity.translate(drill['point'], xoff=dx, yoff=dy)
+        self._transform_drills(lambda coords: coords + (dx, dy))
 
         # Recreate geometry
         self.create_geometry()
@@ -398,12 +455,25 @@ class Excellon(Geometry):
         xscale, yscale = {"X": (1.0, -1.0), "Y": (-1.0, 1.0)}[axis]
 
         # Modify data
-        for drill in self.drills:
-            drill['point'] = affinity.scale(drill['point'], xscale, yscale, origin=(px, py))
+        self._transform_drills(lambda coords: coords * (xscale, yscale) +
+                               (px - px * xscale, py - py * yscale))
 
         # Recreate geometry
         self.create_geometry()
 
+    def _transform_drills(self, transformation):
+        """
+        Replaces the points in ``self.drills``, all at once,
+        by their transformation.
+
+        :param transformation: Function taking an (N, 2) array of
+            coordinates and returning the new ones.
+        :return: None
+        """
+        points = shapely.transform([drill['point'] for drill in self.drills], transformation)
+        for drill, point in zip(self.drills, points):
+            drill['point'] = point
+
     def convert_units(self, units):
         factor = Geometry.convert_units(self, units)
 
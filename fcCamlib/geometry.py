@@ -15,7 +15,8 @@ from shapely.ops import unary_union
 from shapely.wkt import loads as sloads
 from shapely.wkt import dumps as sdumps
 
-from .utils import setup_log
+from .fcTree import FlatCAMRTreeStorage
+from .utils import autolist, setup_log
 
 log = setup_log("fcCamlib.geometry")
 
@@ -132,14 +133,14 @@ class Geometry:
         flat_geometry = self.flatten(pathonly=True)
         log.debug("%d paths" % len(flat_geometry))
         polygon=Polygon(points)
-        toolgeo=cascaded_union(polygon)
+        toolgeo=unary_union(polygon)
         diffs=[]
         for target in flat_geometry:
             if type(target) == LineString or type(target) == LinearRing:
                 diffs.append(target.difference(toolgeo))
             else:
                 log.warning("Not implemented.")
-        self.solid_geometry=cascaded_union(diffs)
+        self.solid_geometry=unary_union(diffs)
 
     def bounds(self):
         """
@@ -156,7 +157,7 @@ class Geometry:
             if len(self.solid_geometry) == 0:
                 log.debug('solid_geometry is empty []')
                 return 0, 0, 0, 0
-            return cascaded_union(self.solid_geometry).bounds
+            return unary_union(self.solid_geometry).bounds
         else:
             return self.solid_geometry.bounds
 
@@ -173,6 +174,9 @@ class Geometry:
         if geoset is None:
             geoset = self.solid_geometry
 
+        # Multi-part geometry is iterated through its parts.
+        geoset = getattr(geoset, 'geoms', geoset)
+
         try:  # Iterable
             for sub_geo in geoset:
                 p = self.find_polygon(point, geoset=sub_geo)
@@ -199,7 +203,7 @@ class Geometry:
 
         ## If iterable, expand recursively.
         try:
-            for geo in geometry:
+            for geo in getattr(geometry, 'geoms', geometry):
                 interiors.extend(self.get_interiors(geometry=geo))
 
         ## Not iterable, get the exterior if polygon.
@@ -226,7 +230,7 @@ class Geometry:
 
         ## If iterable, expand recursively.
         try:
-            for geo in geometry:
+            for geo in getattr(geometry, 'geoms', geometry):
                 exteriors.extend(self.get_exteriors(geometry=geo))
 
         ## Not iterable, get the exterior if polygon.
@@ -254,17 +258,11 @@ class Geometry:
         if reset:
             self.flat_geometry = []
 
-        ## If iterable, expand recursively.
+        ## If iterable, expand recursively. Lists and multi-part
+        ## geometry, through its parts.
         try:
-            for geo in geometry.geoms:
+            for geo in getattr(geometry, 'geoms', geometry):
                 self.flatten(geometry=geo, reset=False, pathonly=pathonly)
-        except AttributeError:
-            if pathonly and type(geometry) == Polygon:
-                self.flat_geometry.append(geometry.exterior)
-                for interior in list(geometry.interiors):
-                    self.flatten(geometry=interior, reset=False, pathonly=True)
-            else:
-                self.flat_geometry.append(geometry)
 
         ## Not iterable, do the actual indexing and add.
         except TypeError:
@@ -274,7 +272,7 @@ class Geometry:
                              reset=False,
                              pathonly=True)
             else:
-                self.flat_geometry.append(geometry.geoms)
+                self.flat_geometry.append(geometry)
 
         return self.flat_geometry
 
@@ -476,21 +474,17 @@ class Geometry:
         geoms = FlatCAMRTreeStorage()
         geoms.get_points = get_pts
 
+        # Indexed all at once when done
+        paths = []
+
         # Can only result in a Polygon or MultiPolygon
         current = polygon.buffer(-tooldia / 2.0)
 
         # current can be a MultiPolygon
-        try:
-            for p in current:
-                geoms.insert(p.exterior)
-                for i in p.interiors:
-                    geoms.insert(i)
-
-        # Not a Multipolygon. Must be a Polygon
-        except TypeError:
-            geoms.insert(current.exterior)
-            for i in current.interiors:
-                geoms.insert(i)
+        for p in autolist(current):
+            paths.append(p.exterior)
+            for i in p.interiors:
+                paths.append(i)
 
         while True:
 
@@ -499,20 +493,15 @@ class Geometry:
             if current.area > 0:
 
                 # current can be a MultiPolygon
-                try:
-                    for p in current:
-                        geoms.insert(p.exterior)
-                        for i in p.interiors:
-                            geoms.insert(i)
-
-                # Not a Multipolygon. Must be a Polygon
-                except TypeError:
-                    geoms.insert(current.exterior)
-                    for i in current.interiors:
-                        geoms.insert(i)
+                for p in autolist(current):
+                    paths.append(p.exterior)
+                    for i in p.interiors:
+                        paths.append(i)
             else:
                 break
 
+        geoms.bulk_load(paths)
+
         # Optimization: Reduce lifts
         log.debug("Reducing tool lifts...")
         geoms = Geometry.paint_connect(geoms, polygon, tooldia)
@@ -549,6 +538,9 @@ class Geometry:
         geoms = FlatCAMRTreeStorage()
         geoms.get_points = get_pts
 
+        # Indexed all at once when done
+        paths = []
+
         # Path margin
         path_margin = polygon.buffer(-tooldia / 2)
 
@@ -568,12 +560,11 @@ class Geometry:
             else:
                 #geoms.append(path)
                 #geoms.insert(path)
-                # path can be a collection of paths.
-                try:
-                    for p in path:
-                        geoms.insert(p)
-                except TypeError:
-                    geoms.insert(path)
+                # path can be a collection of paths, and of
+                # points where the circle only touches the margin.
+                for p in autolist(path):
+                    if isinstance(p, LineString):
+                        paths.append(p)
 
             radius += tooldia * (1 - overlap)
 
@@ -585,12 +576,14 @@ class Geometry:
                 inner_edges.append(y)
         #geoms += outer_edges + inner_edges
         for g in outer_edges + inner_edges:
-            geoms.insert(g)
+            paths.append(g)
 
         # Optimization connect touching paths
         # log.debug("Connecting paths...")
         # geoms = Geometry.path_connect(geoms)
 
+        geoms.bulk_load(paths)
+
         # Optimization: Reduce lifts
         log.debug("Reducing tool lifts...")
         geoms = Geometry.paint_connect(geoms, polygon, tooldia)
@@ -677,7 +670,7 @@ class Geometry:
                 # then reverse coordinates.
                 # but prefer the first one if last == first
                 if pt != candidate.coords[0] and pt == candidate.coords[-1]:
-                    candidate.coords = list(candidate.coords)[::-1]
+                    candidate = LineString(candidate.coords[::-1])
 
                 # Straight line from current_pt to pt.
                 # Is the toolpath inside the geometry?
@@ -688,7 +681,7 @@ class Geometry:
                     #log.debug("Walk to path #%d is inside. Joining." % path_count)
 
                     # Completely inside. Append...
-                    geo.coords = list(geo.coords) + list(candidate.coords)
+                    geo = LineString(list(geo.coords) + list(candidate.coords))
                     # try:
                     #     last = optimized_paths[-1]
                     #     last.coords = list(last.coords) + list(geo.coords)
@@ -755,22 +748,22 @@ class Geometry:
                 if type(left) == LineString:
                     if left.coords[0] == geo.coords[0]:
                         storage.remove(left)
-                        geo.coords = list(geo.coords)[::-1] + list(left.coords)
+                        geo = LineString(list(geo.coords)[::-1] + list(left.coords))
                         continue
 
                     if left.coords[-1] == geo.coords[0]:
                         storage.remove(left)
-                        geo.coords = list(left.coords) + list(geo.coords)
+                        geo = LineString(list(left.coords) + list(geo.coords))
                         continue
 
                     if left.coords[0] == geo.coords[-1]:
                         storage.remove(left)
-                        geo.coords = list(geo.coords) + list(left.coords)
+                        geo = LineString(list(geo.coords) + list(left.coords))
                         continue
 
                     if left.coords[-1] == geo.coords[-1]:
                         storage.remove(left)
-                        geo.coords = list(geo.coords) + list(left.coords)[::-1]
+                        geo = LineString(list(geo.coords) + list(left.coords)[::-1])
                         continue
 
                 _, right = storage.nearest(geo.coords[-1])
@@ -781,22 +774,22 @@ class Geometry:
                 if type(right) == LineString:
                     if right.coords[0] == geo.coords[-1]:
                         storage.remove(right)
-                        geo.coords = list(geo.coords) + list(right.coords)
+                        geo = LineString(list(geo.coords) + list(right.coords))
                         continue
 
                     if right.coords[-1] == geo.coords[-1]:
                         storage.remove(right)
-                        geo.coords = list(geo.coords) + list(right.coords)[::-1]
+                        geo = LineString(list(geo.coords) + list(right.coords)[::-1])
                         continue
 
                     if right.coords[0] == geo.coords[0]:
                         storage.remove(right)
-                        geo.coords = list(geo.coords)[::-1] + list(right.coords)
+                        geo = LineString(list(geo.coords)[::-1] + list(right.coords))
                         continue
 
                     if right.coords[-1] == geo.coords[0]:
                         storage.remove(right)
-                        geo.coords = list(left.coords) + list(geo.coords)
+                        geo = LineString(list(left.coords) + list(geo.coords))
                         continue
 
                 # right is either a LinearRing or it does not connect
@@ -894,7 +887,7 @@ class Geometry:
         :return: SVG Element
         """
         # Make sure we see a Shapely Geometry class and not a list
-        geom = cascaded_union(self.flatten())
+        geom = unary_union(self.flatten())
 
         # scale_factor is a multiplication factor for the SVG stroke-width used within shapely's svg export
 
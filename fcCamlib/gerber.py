@@ -11,6 +11,7 @@ import sys
 import traceback
 
 from numpy import arctan2, sqrt, pi, sin, cos
+import shapely
 from shapely import affinity
 from shapely.geometry import Polygon, LineString, Point, MultiPolygon
 from shapely.geometry import box as shply_box
@@ -977,7 +978,10 @@ class Gerber (Geometry):
             log.warn("Joining %d polygons." % len(poly_buffer))
             if self.use_buffer_for_union:
                 log.debug("Union by buffer...")
-                new_poly = MultiPolygon(poly_buffer)
+                # Macro flashes can be MultiPolygons, which can't be
+                # parts of a MultiPolygon. Take their polygons instead.
+                parts = shapely.get_parts(poly_buffer)
+                new_poly = MultiPolygon([p for p in parts if type(p) is Polygon and not p.is_empty])
                 new_poly = new_poly.buffer(0.00000001)
                 new_poly = new_poly.buffer(-0.00000001)
                 log.warn("Union(buffer) done.")
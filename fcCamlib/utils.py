@@ -1,6 +1,6 @@
 import logging
 
-from numpy import ceil, cos, pi, sin, sqrt
+from numpy import arange, ceil, cos, pi, sin, sqrt
 
 
 def setup_log(name:str) -> logging.Logger:
@@ -38,7 +38,6 @@ def arc(center, radius, start, stop, direction, steps_per_circ):
     # TODO: Resolution should be established by maximum error from the exact arc.
 
     da_sign = {"cw": -1.0, "ccw": 1.0}
-    points = []
     if direction == "ccw" and stop <= start:
         stop += 2 * pi
     if direction == "cw" and stop >= start:
@@ -49,13 +48,15 @@ def arc(center, radius, start, stop, direction, steps_per_circ):
     #angle = stop-start
     steps = max([int(ceil(angle / (2 * pi) * steps_per_circ)), 2])
     delta_angle = da_sign[direction] * angle * 1.0 / steps
-    for i in range(steps + 1):
-        theta = start + delta_angle * i
-        points.append((center[0] + radius * cos(theta), center[1] + radius * sin(theta)))
-    return points
+    # All the angles at once
+    theta = start + delta_angle * arange(steps + 1)
+    return list(zip((center[0] + radius * cos(theta)).tolist(),
+                    (center[1] + radius * sin(theta)).tolist()))
 
 
 def autolist(obj):
+    # Multi-part geometry is not iterable, its parts are.
+    obj = getattr(obj, 'geoms', obj)
     try:
         _ = iter(obj)
         return obj
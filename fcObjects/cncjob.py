@@ -246,19 +246,19 @@ class FlatCAMCNCjob(FlatCAMObj, CNCjob):
 
     def export_gcode(self, filename, preamble='', postamble=''):
 
-        lines = StringIO(self.gcode)
-
-        ## Post processing
-        # Dwell?
-        if self.options['dwell']:
-            self.app.log.debug("Will add G04!")
-            lines = self.dwell_generator(lines)
-
         ## Write
         with open(filename, 'w') as f:
             f.write(preamble + "\n")
-            for line in lines:
-                f.write(line)
+
+            ## Post processing
+            # Dwell?
+            if self.options['dwell']:
+                self.app.log.debug("Will add G04!")
+                f.writelines(self.dwell_generator(StringIO(self.gcode)))
+            else:
+                # Nothing to change, no need to go line by line.
+                f.write(self.gcode)
+
             f.write(postamble)
 
         # Just for adding it to the recent files list.
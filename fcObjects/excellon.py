@@ -1,7 +1,8 @@
 
 from PyQt6.QtCore import Qt
-from PyQt6.QtWidgets import QLabel, QTableWidgetItem, QGridLayout, QPushButton
-from shapely.geometry import Point
+from PyQt6.QtWidgets import QLabel, QGridLayout, QPushButton
+import numpy as np
+import shapely
 
 from fcCamlib.excellon import Excellon
 from FlatCAMObj import FlatCAMObj, ObjectDeleted
@@ -240,10 +241,10 @@ class FlatCAMExcellon(FlatCAMObj, Excellon):
                         except:
                             exc.app.log.warning("Failed to copy option.",option)
 
-                #deep copy of all drills,to avoid any references
+                #copy of all drills, to avoid any references. Points
+                #can't be modified, they are shared.
                 for drill in exc.drills:
-                    point = Point(drill['point'].x,drill['point'].y)
-                    exc_final.drills.append({"point": point, "tool": drill['tool']})
+                    exc_final.drills.append({"point": drill['point'], "tool": drill['tool']})
                 toolsrework=dict()
                 max_numeric_tool=0
                 for toolname in exc.tools.iterkeys():
@@ -272,32 +273,22 @@ class FlatCAMExcellon(FlatCAMObj, Excellon):
     def build_ui(self):
         FlatCAMObj.build_ui(self)
 
-        # Populate tool list
-        n = len(self.tools)
-        self.ui.tools_table.setColumnCount(2)
-        self.ui.tools_table.setHorizontalHeaderLabels(['#', 'Diameter'])
-        self.ui.tools_table.setRowCount(n)
-        self.ui.tools_table.setSortingEnabled(False)
-        i = 0
-        for tool in self.tools:
-            id = QTableWidgetItem(tool)
-            id.setFlags(Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEnabled)
-            self.ui.tools_table.setItem(i, 0, id)  # Tool name/id
-            dia = QTableWidgetItem(str(self.tools[tool]['C']))
-            dia.setFlags(Qt.ItemFlag.ItemIsEnabled)
-            self.ui.tools_table.setItem(i, 1, dia)  # Diameter
-            i += 1
-        
+        # Populate tool list, only the tool ids can be selected
+        table = self.ui.tools_table
+        table.setSortingEnabled(False)
+        table.set_data(['#', 'Diameter'], [[tool, self.tools[tool]['C']] for tool in self.tools],
+                       selectable_columns=(0,))
+
         # sort the tool diameter column
-        self.ui.tools_table.sortItems(1)
+        table.horizontalHeader().setSortIndicator(1, Qt.SortOrder.AscendingOrder)
+        table.setSortingEnabled(True)
         # all the tools are selected by default
-        self.ui.tools_table.selectColumn(0)
-        
-        self.ui.tools_table.resizeColumnsToContents()
-        self.ui.tools_table.resizeRowsToContents()
-        self.ui.tools_table.horizontalHeader().setStretchLastSection(True)
-        self.ui.tools_table.verticalHeader().hide()
-        self.ui.tools_table.setSortingEnabled(True)
+        table.selectColumn(0)
+
+        table.resizeColumnsToContents()
+        table.resizeRowsToContents()
+        table.horizontalHeader().setStretchLastSection(True)
+        table.verticalHeader().hide()
 
         self.app.ui.showSelectedTab()
 
@@ -344,7 +335,7 @@ class FlatCAMExcellon(FlatCAMObj, Excellon):
         :return: List of tools.
         :rtype: list
         """
-        return [str(x.text()) for x in self.ui.tools_table.selectedItems()]
+        return [str(tool) for tool in self.ui.tools_table.selected_values(0)]
 
     def generate_milling(self, tools=None, outname=None, tooldia=None):
         """
@@ -382,14 +373,13 @@ class FlatCAMExcellon(FlatCAMObj, Excellon):
                 "Initializer expected a FlatCAMGeometry, got %s" % type(geo_obj)
             app_obj.progress.emit(20)
 
-            geo_obj.solid_geometry = []
-
-            for hole in self.drills:
-                if hole['tool'] in tools:
-                    geo_obj.solid_geometry.append(
-                        Point(hole['point']).buffer(self.tools[hole['tool']]["C"] / 2 -
-                                                    tooldia / 2).exterior
-                    )
+            # All holes buffered in one call (16 segments per
+            # quarter circle, as Point.buffer()).
+            selected = set(tools)
+            holes = [hole for hole in self.drills if hole['tool'] in selected]
+            radii = np.array([self.tools[hole['tool']]["C"] / 2 - tooldia / 2 for hole in holes], dtype=float)
+            polys = shapely.buffer([hole['point'] for hole in holes], radii, quad_segs=16)
+            geo_obj.solid_geometry = shapely.get_exterior_ring(polys).tolist()
 
         def geo_thread(app_obj):
             app_obj.new_object("geometry", outname, geo_init)
@@ -494,14 +484,14 @@ class FlatCAMExcellon(FlatCAMObj, Excellon):
         try:
             # Plot excellon (All polygons?)
             if self.options["solid"]:
-                for geo in self.solid_geometry:
-                    self.add_shape(shape=geo, color='#750000BF', face_color='#C40000BF', visible=self.options['plot'],
-                                   layer=2)
+                self.add_shapes([{'shape': geo} for geo in self.solid_geometry],
+                                color='#750000BF', face_color='#C40000BF', visible=self.options['plot'], layer=2)
             else:
+                shapes = []
                 for geo in self.solid_geometry:
-                    self.add_shape(shape=geo.exterior, color='red', visible=self.options['plot'])
-                    for ints in geo.interiors:
-                        self.add_shape(shape=ints, color='green', visible=self.options['plot'])
+                    shapes.append({'shape': geo.exterior, 'color': 'red'})
+                    shapes += [{'shape': ints, 'color': 'green'} for ints in geo.interiors]
+                self.add_shapes(shapes, visible=self.options['plot'])
 
             self.shapes.redraw()
         except (ObjectDeleted, AttributeError):
@@ -511,7 +511,7 @@ class FlatCAMGeometry(FlatCAMObj, Geometry):
 
     def plot_element(self, element):
         try:
-            for sub_el in element.geoms:
+            for sub_el in getattr(element, 'geoms', element):
                 self.plot_element(sub_el)
 
         except TypeError:  # Element is not iterable...
@@ -1,4 +1,5 @@
-import inspect
+import logging
+import sys
 
 from numpy import random
 from PyQt6.QtWidgets import QLabel, QGridLayout, QPushButton
@@ -661,7 +662,8 @@ class FlatCAMGerber(FlatCAMObj, Gerber):
 
     def plot(self):
 
-        self.app.log.debug(str(inspect.stack()[1][3]) + " --> FlatCAMGerber.plot()")
+        if self.app.log.isEnabledFor(logging.DEBUG):
+            self.app.log.debug("%s --> FlatCAMGerber.plot()", sys._getframe(1).f_code.co_name)
 
         # Does all the required setup and returns False
         # if the 'ptint' option is set to False.
@@ -671,10 +673,8 @@ class FlatCAMGerber(FlatCAMObj, Gerber):
         geometry = self.solid_geometry
 
         # Make sure geometry is iterable.
-        try:
-            _ = geometry.geoms
-        except TypeError:
-            geometry = [geometry]
+        if type(geometry) is not list:
+            geometry = getattr(geometry, 'geoms', [geometry])
 
         def random_color():
             color = random.rand(4)
@@ -683,13 +683,12 @@ class FlatCAMGerber(FlatCAMObj, Gerber):
 
         try:
             if self.options["solid"]:
-                for poly in geometry.geoms:
-                    self.add_shape(shape=poly, color='#006E20BF', face_color=random_color()
-                                   if self.options['multicolored'] else '#BBF268BF', visible=self.options['plot'])
+                self.add_shapes([{'shape': poly, 'face_color': random_color()
+                                  if self.options['multicolored'] else '#BBF268BF'} for poly in geometry],
+                                color='#006E20BF', visible=self.options['plot'])
             else:
-                for poly in geometry.geoms:
-                    self.add_shape(shape=poly, color=random_color() if self.options['multicolored'] else 'black',
-                                   visible=self.options['plot'])
+                self.add_shapes([{'shape': poly, 'color': random_color() if self.options['multicolored'] else 'black'}
+                                 for poly in geometry], visible=self.options['plot'])
             self.shapes.redraw()
         except (ObjectDeleted, AttributeError):
             self.shapes.clear(update=True)
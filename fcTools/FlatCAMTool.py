@@ -65,10 +65,8 @@ class FlatCAMTool(QWidget):
 #        self.menuAction.triggered.connect(self.run)
 
     def run(self):
-        # Remove anything else in the GUI
-        self.app.ui.tool_scroll_area.takeWidget()
-        # Put ourself in the GUI
-        self.app.ui.tool_scroll_area.setWidget(self)
+        # Put ourself in the GUI in place of anything else
+        self.app.ui.tool_scroll_area.replace_widget(self)
         # Switch notebook to tool page
         self.app.ui.notebook.setCurrentWidget(self.app.ui.tool_tab)
         self.show()
@@ -1,3 +1,4 @@
+import logging
 import threading
 import numpy as np
 
@@ -9,6 +10,8 @@ from vispy.color import Color
 
 from .VisPyTesselators import GLUTess
 
+log = logging.getLogger('base')
+
 
 class FlatCAMLineVisual(LineVisual):
     def __init__(self, pos=None, color=(0.5, 0.5, 0.5, 1), width=1, connect='strip',
@@ -31,27 +34,27 @@ def _update_shape_buffers(data, triangulation='glu'):
     :param triangulation: str
         Triangulation engine
     """
-    mesh_vertices = []                                              # Vertices for mesh
-    mesh_tris = []                                                  # Faces for mesh
-    mesh_colors = []                                                # Face colors
-    line_pts = []                                                   # Vertices for line
-    line_colors = []                                                # Line color
+    mesh_vertices = np.empty((0, 2), dtype=np.float32)             # Vertices for mesh
+    mesh_tris = np.empty(0, dtype=np.uint32)                        # Faces for mesh
+    mesh_colors = np.empty((0, 4), dtype=np.float32)                # Face colors
+    line_pts = np.empty((0, 2), dtype=np.float32)                   # Vertices for line
+    line_colors = np.empty((0, 4), dtype=np.float32)                # Line color
 
     geo, color, face_color, tolerance = data['geometry'], data['color'], data['face_color'], data['tolerance']
 
     if geo is not None and not geo.is_empty:
         simple = geo.simplify(tolerance) if tolerance else geo      # Simplified shape
-        pts = []                                                    # Shape line points
+        pts = line_pts                                              # Shape line points
         tri_pts = []                                                # Mesh vertices
         tri_tris = []                                               # Mesh faces
 
         if type(geo) == LineString:
             # Prepare lines
-            pts = _linestring_to_segments(list(simple.coords))
+            pts = _linestring_to_segments(simple.coords)
 
         elif type(geo) == LinearRing:
             # Prepare lines
-            pts = _linearring_to_segments(list(simple.coords))
+            pts = _linearring_to_segments(simple.coords)
 
         elif type(geo) == Polygon:
             # Prepare polygon faces
@@ -64,20 +67,26 @@ def _update_shape_buffers(data, triangulation='glu'):
 
             # Prepare polygon edges
             if color is not None:
-                pts = _linearring_to_segments(list(simple.exterior.coords))
-                for ints in simple.interiors:
-                    pts += _linearring_to_segments(list(ints.coords))
+                pts = np.concatenate([_linearring_to_segments(simple.exterior.coords)] +
+                                     [_linearring_to_segments(ints.coords) for ints in simple.interiors])
 
-        # Appending data for mesh
+        # Storing data for mesh
         if len(tri_pts) > 0 and len(tri_tris) > 0:
-            mesh_tris += tri_tris
-            mesh_vertices += tri_pts
-            mesh_colors += [Color(face_color).rgba] * (len(tri_tris) // 3)
+            # Kept together: the shape gets either all three or none.
+            try:
+                tris = np.asarray(tri_tris, dtype=np.uint32)
+                vertices = np.asarray(tri_pts, dtype=np.float32)[:, :2]
+                colors = np.tile(np.asarray(Color(face_color).rgba, dtype=np.float32),
+                                 (len(tris) // 3, 1))
+            except (TypeError, ValueError) as e:
+                log.warning("Could not store mesh data of shape: %s", e)
+            else:
+                mesh_tris, mesh_vertices, mesh_colors = tris, vertices, colors
 
-        # Appending data for line
+        # Storing data for line
         if len(pts) > 0:
-            line_pts += pts
-            line_colors += [Color(color).rgba] * len(pts)
+            line_pts = pts
+            line_colors = np.tile(np.asarray(Color(color).rgba, dtype=np.float32), (len(pts), 1))
 
     # Store buffers
     data['line_pts'] = line_pts
@@ -92,30 +101,57 @@ def _update_shape_buffers(data, triangulation='glu'):
     return data
 
 
+def _try_update_shape_buffers(data, triangulation='glu'):
+    """
+    As _update_shape_buffers(), for process pool jobs: a shape that
+    can't be translated gets empty buffers and the error message in
+    data['error'], so that it doesn't fail the other shapes of its job
+    :param data: dict
+        Input shape data
+    :param triangulation: str
+        Triangulation engine
+    """
+    try:
+        return _update_shape_buffers(data, triangulation)
+    except Exception as e:
+        data['geometry'] = None
+        data = _update_shape_buffers(data)
+        data['error'] = str(e)
+        return data
+
+
 def _linearring_to_segments(arr):
-    # Close linear ring
     """
     Translates linear ring to line segments
-    :param arr: numpy.array
-        Array of linear ring vertices
+    :param arr: sequence
+        Linear ring vertices
     :return: numpy.array
         Line segments
     """
-    if arr[0] != arr[-1]:
-        arr.append(arr[0])
+    pts = np.asarray(arr, dtype=np.float32)
+    if len(pts) == 0:
+        return np.empty((0, 2), dtype=np.float32)
+
+    # Close linear ring
+    if (pts[0] != pts[-1]).any():
+        pts = np.vstack((pts, pts[:1]))
 
-    return _linestring_to_segments(arr)
+    return _linestring_to_segments(pts)
 
 
 def _linestring_to_segments(arr):
     """
     Translates line strip to segments
-    :param arr: numpy.array
-        Array of line strip vertices
+    :param arr: sequence
+        Line strip vertices
     :return: numpy.array
-        Line segments
+        Line segments, (N, 2) float32 array of segment end points
     """
-    return [arr[i // 2] for i in range(0, len(arr) * 2)][1:-1]
+    pts = np.asarray(arr, dtype=np.float32)
+    if len(pts) == 0:
+        return np.empty((0, 2), dtype=np.float32)
+
+    return np.repeat(pts[:, :2], 2, axis=0)[1:-1]
 
 
 class ShapeGroup(object):
@@ -137,6 +173,16 @@ class ShapeGroup(object):
         """
         self._indexes.append(self._collection.add(**kwargs))
 
+    def add_batch(self, shapes, **kwargs):
+        """
+        Adds list of shapes to collection and store indexes in group
+        :param shapes: list
+            Keyword argument dicts, one per shape, for ShapeCollection.add function
+        :param kwargs: keyword arguments
+            Arguments common to all shapes
+        """
+        self._indexes += self._collection.add_batch(shapes, **kwargs)
+
     def clear(self, update=False):
         """
         Removes group shapes from collection, clear indexes
@@ -260,15 +306,60 @@ class ShapeCollectionVisual(CompoundVisual):
 
         # Add data to process pool if pool exists
         try:
-            self.results[key] = self.pool.map_async(_update_shape_buffers, [self.data[key]])
+            self.results[key] = (self.pool.map_async(_try_update_shape_buffers, [self.data[key]]), 0)
         except:
-            self.data[key] = _update_shape_buffers(self.data[key])
+            self._store_translated(key, _try_update_shape_buffers(self.data[key]))
 
         if update:
             self.redraw()                       # redraw() waits for pool process end
 
         return key
 
+    def add_batch(self, shapes, update=False, **kwargs):
+        """
+        Adds list of shapes to collection as one process pool job
+        :param shapes: list
+            Keyword argument dicts, one per shape, as accepted by add function
+        :param update: bool
+            Set True to redraw collection
+        :param kwargs: keyword arguments
+            Arguments common to all shapes (color, visible, layer, tolerance...)
+        :return: list
+            Indexes of shapes
+        """
+        defaults = {'shape': None, 'color': None, 'face_color': None, 'visible': True, 'layer': 1,
+                    'tolerance': 0.01}
+        defaults.update(kwargs)
+
+        # Get new keys
+        self.key_lock.acquire(True)
+        first = self.last_key + 1
+        self.last_key += len(shapes)
+        self.key_lock.release()
+        keys = list(range(first, first + len(shapes)))
+
+        # Prepare data for translation
+        batch = []
+        for key, shape in zip(keys, shapes):
+            args = dict(defaults, **shape)
+            self.data[key] = {'geometry': args['shape'], 'color': args['color'], 'face_color': args['face_color'],
+                              'visible': args['visible'], 'layer': args['layer'], 'tolerance': args['tolerance']}
+            batch.append(self.data[key])
+
+        # Translate whole batch in one pool job, each key remembers its position in the result
+        try:
+            result = self.pool.map_async(_try_update_shape_buffers, batch)
+            for pos, key in enumerate(keys):
+                self.results[key] = (result, pos)
+        except:
+            for key in keys:
+                self._store_translated(key, _try_update_shape_buffers(self.data[key]))
+
+        if update:
+            self.redraw()
+
+        return keys
+
     def remove(self, key, update=False):
         """
         Removes shape from collection
@@ -306,23 +397,27 @@ class ShapeCollectionVisual(CompoundVisual):
         mesh_vertices = [[] for _ in range(0, len(self._meshes))]       # Vertices for mesh
         mesh_tris = [[] for _ in range(0, len(self._meshes))]           # Faces for mesh
         mesh_colors = [[] for _ in range(0, len(self._meshes))]         # Face colors
+        mesh_count = [0] * len(self._meshes)                            # Vertices count for mesh
         line_pts = [[] for _ in range(0, len(self._lines))]             # Vertices for line
         line_colors = [[] for _ in range(0, len(self._lines))]          # Line color
 
         # Lock sub-visuals updates
         self.update_lock.acquire(True)
 
-        # Merge shapes buffers
+        # Collect shapes buffers, merged below with one concatenate per layer
         for data in self.data.values():
             if data['visible'] and 'line_pts' in data:
                 try:
-                    line_pts[data['layer']] += data['line_pts']
-                    line_colors[data['layer']] += data['line_colors']
-                    mesh_tris[data['layer']] += [x + len(mesh_vertices[data['layer']])
-                                                 for x in data['mesh_tris']]
-
-                    mesh_vertices[data['layer']] += data['mesh_vertices']
-                    mesh_colors[data['layer']] += data['mesh_colors']
+                    layer = data['layer']
+                    if len(data['line_pts']) > 0:
+                        line_pts[layer].append(data['line_pts'])
+                        line_colors[layer].append(data['line_colors'])
+
+                    if len(data['mesh_tris']) > 0:
+                        mesh_tris[layer].append(data['mesh_tris'] + mesh_count[layer])
+                        mesh_vertices[layer].append(data['mesh_vertices'])
+                        mesh_colors[layer].append(data['mesh_colors'])
+                        mesh_count[layer] += len(data['mesh_vertices'])
                 except Exception as e:
                     print("Data error", e)
 
@@ -330,8 +425,8 @@ class ShapeCollectionVisual(CompoundVisual):
         for i, mesh in enumerate(self._meshes):
             if len(mesh_vertices[i]) > 0:
                 set_state(polygon_offset_fill=False)
-                mesh.set_data(np.asarray(mesh_vertices[i]), np.asarray(mesh_tris[i], dtype=np.uint32)
-                              .reshape((-1, 3)), face_colors=np.asarray(mesh_colors[i]))
+                mesh.set_data(np.concatenate(mesh_vertices[i]), np.concatenate(mesh_tris[i]).reshape((-1, 3)),
+                              face_colors=np.concatenate(mesh_colors[i]))
             else:
                 mesh.set_data()
 
@@ -340,7 +435,8 @@ class ShapeCollectionVisual(CompoundVisual):
         # Updating lines
         for i, line in enumerate(self._lines):
             if len(line_pts[i]) > 0:
-                line.set_data(np.asarray(line_pts[i]), np.asarray(line_colors[i]), self._line_width, 'segments')
+                line.set_data(np.concatenate(line_pts[i]), np.concatenate(line_colors[i]), self._line_width,
+                              'segments')
             else:
                 line.clear_data()
 
@@ -361,18 +457,34 @@ class ShapeCollectionVisual(CompoundVisual):
 
         for i in self.data.keys() if not indexes else indexes:
             if i in self.results.keys():
+                # Taken out in any case, so a failed job is reported once.
+                result, pos = self.results.pop(i)
                 try:
-                    self.results[i].wait()                                  # Wait for process results
-                    if i in self.data:
-                        self.data[i] = self.results[i].get()[0]             # Store translated data
-                        del self.results[i]
+                    result.wait()                                           # Wait for process results
+                    data = result.get()[pos]
                 except Exception as e:
-                    print(f"VisPyVisuals.redraw: {e}, {indexes}")
+                    log.error("Could not translate shape %d: %s", i, e)
+                    continue
+                if i in self.data:
+                    self._store_translated(i, data)                         # Store translated data
 
         self.results_lock.release()
 
         self.__update()
 
+    def _store_translated(self, key, data):
+        """
+        Stores translated shape data, see _try_update_shape_buffers()
+        :param key: int
+            Shape index
+        :param data: dict
+            Translated shape data
+        """
+        error = data.pop('error', None)
+        if error is not None:
+            log.warning("Could not translate shape %d: %s", key, error)
+        self.data[key] = data
+
     def lock_updates(self):
         self.update_lock.acquire(True)
 
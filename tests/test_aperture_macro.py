@@ -0,0 +1,42 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from shapely.geometry import MultiPolygon, Polygon
+
+from fcCamlib.aperture import ApertureMacro
+
+
+def make_geometry(raw, modifiers=None):
+    macro = ApertureMacro("TEST")
+    macro.append(raw)
+    return macro.make_geometry(modifiers or [])
+
+
+class DegeneratePrimitivesTestCase(unittest.TestCase):
+    """
+    Primitives of zero width or height add no area, and the
+    geometry of a flash stays polygonal.
+    """
+
+    def test_zero_width_vector_line(self):
+        geo = make_geometry("20,1,0,0,0,1,1,0*")
+        self.assertIsInstance(geo, (Polygon, MultiPolygon))
+        self.assertTrue(geo.is_empty)
+
+    def test_zero_width_vector_line_and_circle(self):
+        geo = make_geometry("20,1,0,0,0,1,1,0*1,1,0.5,3,0*")
+        circle = make_geometry("1,1,0.5,3,0*")
+        self.assertIsInstance(geo, Polygon)
+        self.assertAlmostEqual(geo.symmetric_difference(circle).area, 0)
+
+    def test_zero_height_center_line(self):
+        geo = make_geometry("21,1,0,1,0,0,0*")
+        self.assertIsInstance(geo, (Polygon, MultiPolygon))
+        self.assertTrue(geo.is_empty)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,35 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+from shapely.geometry import LineString
+
+from fcCamlib.cncjob import CNCjob
+
+
+class Linear2GcodeTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.job = CNCjob()
+        self.path = LineString([(0, 0), (1, 0), (1, 2), (3, 2)])
+
+    def test_reverse(self):
+        self.assertEqual(self.job.linear2gcode(self.path, reverse=True),
+                         self.job.linear2gcode(LineString(self.path.coords[::-1])))
+
+    def test_coords(self):
+        coords = np.array([(5, 5), (6, 5)])
+        self.assertEqual(self.job.linear2gcode(self.path, coords=coords),
+                         self.job.linear2gcode(LineString(coords)))
+
+    def test_coords_reverse(self):
+        coords = np.asarray(self.path.coords)
+        self.assertEqual(self.job.linear2gcode(self.path, coords=coords, reverse=True),
+                         self.job.linear2gcode(self.path, reverse=True))
+
+
+if __name__ == "__main__":
+    unittest.main()
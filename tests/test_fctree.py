@@ -0,0 +1,83 @@
+import os
+import sys
+import random
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from shapely.geometry import LineString
+
+from fcCamlib import fcTree
+from fcCamlib.fcTree import FlatCAMZOrderStorage
+
+
+def clustered_paths(n, seed=0):
+    """
+    Short paths around a few points plus one far away, as
+    FlatCAMZOrderStorage used to degrade to O(n^2) on them.
+    """
+    r = random.Random(seed)
+    centers = [(r.uniform(0, 10), r.uniform(0, 10)) for _ in range(5)]
+    paths = []
+    for _ in range(n):
+        cx, cy = r.choice(centers)
+        x, y = cx + r.gauss(0, 0.01), cy + r.gauss(0, 0.01)
+        paths.append(LineString([(x, y), (x + r.uniform(-.001, .001), y + r.uniform(-.001, .001))]))
+    paths.append(LineString([(10000, 10000), (10001, 10000)]))
+    return paths
+
+
+def make_storage(paths):
+    storage = FlatCAMZOrderStorage()
+    storage.get_points = lambda o: [o.coords[0], o.coords[-1]]
+    storage.bulk_load(paths)
+    return storage
+
+
+class ZOrderStorageTestCase(unittest.TestCase):
+
+    def test_nearest_matches_brute_force(self):
+        paths = clustered_paths(500)
+        storage = make_storage(paths)
+        left = list(paths)
+
+        current = (0, 0)
+        while left:
+            pt, path = storage.nearest(current)
+            d2 = (pt[0] - current[0]) ** 2 + (pt[1] - current[1]) ** 2
+            expected = min(min((c[0] - current[0]) ** 2 + (c[1] - current[1]) ** 2
+                               for c in (p.coords[0], p.coords[-1])) for p in left)
+            self.assertAlmostEqual(d2, expected)
+            self.assertIn(pt, (path.coords[0], path.coords[-1]))
+
+            storage.remove(path)
+            left.remove(path)
+            current = path.coords[-1]
+
+        self.assertRaises(StopIteration, storage.nearest, current)
+
+    def test_clustered_search_cost(self):
+        paths = clustered_paths(5000)
+        storage = make_storage(paths)
+
+        pops = []
+        real_heappop = fcTree.heappop
+
+        def counting_heappop(heap):
+            pops.append(None)
+            return real_heappop(heap)
+
+        with mock.patch.object(fcTree, "heappop", counting_heappop):
+            current = (0, 0)
+            for _ in paths:
+                pt, path = storage.nearest(current)
+                storage.remove(path)
+                current = path.coords[-1]
+
+        # Nodes visited per search stay about constant, not O(n).
+        self.assertLess(len(pops) / len(paths), 100)
+
+
+if __name__ == "__main__":
+    unittest.main()
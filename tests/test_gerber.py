@@ -0,0 +1,68 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from shapely.geometry import LineString, MultiPolygon, Polygon, box
+
+from fcCamlib.geometry import Geometry
+from fcCamlib.gerber import Gerber
+
+THERMAL = """G04 thermal flash*
+%FSLAX24Y24*%
+%MOIN*%
+%AMTHERM*7,0,0,0.08,0.05,0.01,45*%
+%ADD10C,0.010*%
+%ADD12THERM*%
+G01*
+D10*
+X0Y0D02*
+X10000Y0D01*
+D12*
+X7000Y3000D03*
+M02*
+"""
+
+
+class GerberParseTestCase(unittest.TestCase):
+
+    def test_thermal_flash(self):
+        gerber = Gerber()
+        gerber.parse_lines(THERMAL.splitlines())
+
+        self.assertIsInstance(gerber.solid_geometry, (Polygon, MultiPolygon))
+        self.assertTrue(gerber.solid_geometry.is_valid)
+        # The thermal is 4 parts, apart from the trace.
+        self.assertEqual(len(gerber.solid_geometry.geoms), 5)
+
+
+class GeometryPartsTestCase(unittest.TestCase):
+    """
+    Multi-part geometry and lists of geometry are gone through
+    part by part.
+    """
+
+    def setUp(self):
+        self.geo = Geometry()
+        self.geo.solid_geometry = [MultiPolygon([box(0, 0, 1, 1), box(2, 0, 3, 1)]),
+                                   LineString([(0, 2), (3, 2)])]
+
+    def test_flatten(self):
+        self.assertEqual([g.geom_type for g in self.geo.flatten()],
+                         ['Polygon', 'Polygon', 'LineString'])
+        self.assertEqual([g.geom_type for g in self.geo.flatten(pathonly=True)],
+                         ['LinearRing', 'LinearRing', 'LineString'])
+
+    def test_exteriors(self):
+        self.assertEqual(len(self.geo.get_exteriors()), 2)
+
+    def test_find_polygon(self):
+        self.assertTrue(self.geo.find_polygon((2.5, 0.5)).equals(box(2, 0, 3, 1)))
+
+    def test_bounds(self):
+        self.assertEqual(self.geo.bounds(), (0, 0, 3, 2))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,110 @@
+import os
+import sys
+import shutil
+import tempfile
+import time
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtWidgets import QApplication
+
+GERBER = """G04 gerber flow test*
+%FSLAX24Y24*%
+%MOIN*%
+%AMTHERM*7,0,0,0.08,0.05,0.01,45*%
+%ADD10C,0.010*%
+%ADD11R,0.060X0.040*%
+%ADD12THERM*%
+G01*
+D10*
+X0Y0D02*
+X10000Y0D01*
+X10000Y5000D01*
+X2000Y2000D02*
+X8000Y2000D01*
+D11*
+X3000Y3000D03*
+X5000Y3000D03*
+D12*
+X7000Y3000D03*
+M02*
+"""
+
+
+class GerberFlowTestCase(unittest.TestCase):
+    """
+    Opens a Gerber file with a fresh user profile, isolates it and
+    generates a CNC job from the isolation geometry, all with the
+    default options.
+    """
+
+    def setUp(self):
+        self.app = QApplication.instance() or QApplication(sys.argv[:1])
+
+        # A fresh profile: no defaults.json in the home folder yet.
+        self.tmpdir = tempfile.mkdtemp()
+        self.old_home = os.environ.get("HOME")
+        os.environ["HOME"] = self.tmpdir
+        self.old_cwd = os.getcwd()
+
+        self.filename = os.path.join(self.tmpdir, "flow.gbr")
+        with open(self.filename, "w") as f:
+            f.write(GERBER)
+
+        # App reads the command line when its module is imported, leave
+        # the test runner's arguments out of it.
+        argv, sys.argv = sys.argv, sys.argv[:1]
+        try:
+            from FlatCAMApp import App
+        finally:
+            sys.argv = argv
+        self.fc = App()
+        self.errors = []
+        self.fc.thread_exception.connect(self.errors.append)
+
+    def tearDown(self):
+        self.fc.ui.close()
+        del self.fc
+        os.chdir(self.old_cwd)
+        if self.old_home is None:
+            del os.environ["HOME"]
+        else:
+            os.environ["HOME"] = self.old_home
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def wait_for(self, name, timeout=20):
+        """
+        Processes events until an object called ``name`` is in the
+        collection, or fails the test after ``timeout`` seconds.
+        """
+        end = time.time() + timeout
+        while time.time() < end:
+            self.app.processEvents()
+            self.assertEqual(self.errors, [])
+            if name in self.fc.collection.get_names():
+                self.app.processEvents()
+                return self.fc.collection.get_by_name(name)
+            time.sleep(0.05)
+        self.fail("Timed out waiting for %s" % name)
+
+    def test_flow(self):
+        self.assertIs(self.fc.defaults["gerber_combine_passes"], False)
+        self.assertIs(self.fc.options["gerber_combine_passes"], False)
+
+        self.fc.open_gerber(self.filename, outname="flow")
+        gerber_obj = self.wait_for("flow")
+        self.assertIs(gerber_obj.options["combine_passes"], False)
+
+        gerber_obj.on_iso_button_click()
+        geo_obj = self.wait_for("flow_iso")
+        self.assertFalse(isinstance(geo_obj.solid_geometry, list))
+
+        geo_obj.on_generatecnc_button_click()
+        cnc_obj = self.wait_for("flow_iso_cnc")
+        self.assertIn("G01", cnc_obj.gcode)
+
+
+if __name__ == "__main__":
+    unittest.main()
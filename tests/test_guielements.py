@@ -0,0 +1,62 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtWidgets import QApplication
+
+from GUIElements import EvalEntry, FloatEntry
+
+
+class EvalEntryTestCase(unittest.TestCase):
+    """
+    Values typed into EvalEntry and FloatEntry, which go through
+    GUIElements._safe_eval().
+    """
+
+    def setUp(self):
+        self.app = QApplication.instance() or QApplication(sys.argv[:1])
+        self.entry = EvalEntry()
+
+    def value_of(self, text):
+        self.entry.setText(text)
+        return self.entry.get_value()
+
+    def test_int_stays_int(self):
+        value = self.value_of("5")
+        self.assertEqual(value, 5)
+        self.assertIsInstance(value, int)
+        self.assertIsInstance(self.value_of("2*3"), int)
+
+    def test_float(self):
+        value = self.value_of("0.5")
+        self.assertEqual(value, 0.5)
+        self.assertIsInstance(value, float)
+
+    def test_tuples(self):
+        self.assertEqual(self.value_of("(1, 2.5)"), (1, 2.5))
+        self.assertEqual(self.value_of("[(0, 0), (1, pi)]")[1][1], 3.141592653589793)
+
+    def test_not_finite(self):
+        for text in ("inf", "nan", "1e400", "(1, 1e400)", "((1e400,),)", "[(0, 0), (1, 1e400)]"):
+            self.assertIsNone(self.value_of(text), text)
+
+    def test_not_allowed(self):
+        for text in ("__import__('os')", "'a'", "9**9**9", "[0]*10", "1j",
+                     "(-8)**0.5", "(1, (-8)**0.5)", "[((-8)**0.5,)]"):
+            self.assertIsNone(self.value_of(text), text)
+
+    def test_float_entry(self):
+        entry = FloatEntry()
+        entry.setText("5")
+        value = entry.get_value()
+        self.assertEqual(value, 5.0)
+        self.assertIsInstance(value, float)
+        entry.setText("(-8)**0.5")
+        self.assertIsNone(entry.get_value())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,47 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from shapely.geometry import LineString, MultiPolygon, Polygon, box
+from shapely.ops import unary_union
+
+from fcCamlib.geometry import Geometry
+
+# A square with a square hole
+FRAME = Polygon([(0, 0), (4, 0), (4, 4), (0, 4)], [[(1.5, 1.5), (2.5, 1.5), (2.5, 2.5), (1.5, 2.5)]])
+# Two squares joined by a neck the tool doesn't fit in, so the
+# first inward buffer gives a MultiPolygon.
+DUMBBELL = unary_union([box(0, 0, 2, 2), box(3, 0, 5, 2), box(1.9, 0.95, 3.1, 1.05)])
+
+
+class PaintTestCase(unittest.TestCase):
+
+    tooldia = 0.2
+
+    def check_paths(self, storage, polygon):
+        paths = list(storage.get_objects())
+        self.assertGreater(len(paths), 0)
+        for path in paths:
+            self.assertIsInstance(path, LineString)
+        # The tool stays inside the polygon.
+        cut = unary_union([path.buffer(self.tooldia / 2) for path in paths])
+        self.assertLess(cut.difference(polygon).area, 1e-3 * polygon.area)
+
+    def test_clear_polygon(self):
+        self.check_paths(Geometry.clear_polygon(FRAME, self.tooldia), FRAME)
+
+    def test_clear_polygon_split(self):
+        self.assertIsInstance(DUMBBELL.buffer(-self.tooldia / 2), MultiPolygon)
+        self.check_paths(Geometry.clear_polygon(DUMBBELL, self.tooldia), DUMBBELL)
+
+    def test_clear_polygon2(self):
+        self.check_paths(Geometry.clear_polygon2(FRAME, self.tooldia), FRAME)
+
+    def test_clear_polygon2_split(self):
+        self.check_paths(Geometry.clear_polygon2(DUMBBELL, self.tooldia), DUMBBELL)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+import os
+import sys
+import unittest
+from multiprocessing import Pool
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from shapely.geometry import LineString
+
+from fcVispy.VisPyVisuals import ShapeCollectionVisual
+
+
+class BrokenShape(object):
+    """
+    Stands for geometry that fails to translate.
+    """
+    is_empty = False
+
+    def simplify(self, tolerance):
+        raise ValueError("broken shape")
+
+
+class ShapeBatchTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.pool = Pool(1)
+        self.collection = ShapeCollectionVisual(pool=self.pool)
+
+    def tearDown(self):
+        self.pool.terminate()
+        self.pool.join()
+
+    def test_failing_shape_leaves_others(self):
+        shapes = [{'shape': LineString([(0, 0), (1, 1)])},
+                  {'shape': BrokenShape()},
+                  {'shape': LineString([(1, 1), (2, 0)])}]
+
+        with self.assertLogs('base', level='WARNING') as logs:
+            keys = self.collection.add_batch(shapes, color='red')
+            self.collection.redraw()
+            self.collection.redraw()
+
+        # Reported once, for the failing shape only.
+        self.assertEqual(len(logs.records), 1)
+        self.assertIn(str(keys[1]), logs.output[0])
+
+        good, broken, other = (self.collection.data[k] for k in keys)
+        self.assertEqual(len(good['line_pts']), 2)
+        self.assertEqual(len(broken['line_pts']), 0)
+        self.assertEqual(len(other['line_pts']), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()